@@ -0,0 +1,192 @@
+"""Process-wide, time-sorted in-memory index over the activity log"""
+import bisect
+import os
+import threading
+from datetime import datetime
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.services.activity_log_store import ActivityLogStore
+
+
+class _TimeSortedActivities:
+    """Activities sorted by timestamp, with a parallel list of epoch keys for bisect"""
+
+    __slots__ = ('keys', 'items')
+
+    def __init__(self):
+        self.keys: List[float] = []
+        self.items: List[Dict] = []
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def extend(self, entries: List[Tuple[float, Dict]]) -> None:
+        """Add (key, activity) pairs; in-order appends are O(1) each"""
+        if not entries:
+            return
+        in_order = all(entries[i][0] <= entries[i + 1][0] for i in range(len(entries) - 1))
+        if in_order and (not self.keys or entries[0][0] >= self.keys[-1]):
+            self.keys.extend(key for key, _ in entries)
+            self.items.extend(activity for _, activity in entries)
+        elif len(entries) <= 16:
+            for key, activity in entries:
+                position = bisect.bisect_right(self.keys, key)
+                self.keys.insert(position, key)
+                self.items.insert(position, activity)
+        else:
+            # Bulk out-of-order load (first build, backfills) - one stable sort
+            merged = list(zip(self.keys, self.items)) + entries
+            merged.sort(key=itemgetter(0))
+            self.keys = [key for key, _ in merged]
+            self.items = [activity for _, activity in merged]
+
+    def range(self, start: Optional[float], end: Optional[float]) -> List[Dict]:
+        low = 0 if start is None else bisect.bisect_left(self.keys, start)
+        high = len(self.keys) if end is None else bisect.bisect_right(self.keys, end)
+        return self.items[low:high]
+
+
+class ActivityIndex:
+    """
+    Keeps every activity from an ActivityLogStore in memory, parsed once and
+    sorted by timestamp, with secondary indexes by type, application_id and
+    contact_id. Date ranges are answered with bisect instead of re-parsing
+    every timestamp.
+
+    Before each query the index reads only the bytes appended to each segment
+    since it last looked (by this or any other process), so it never rescans
+    the whole log after the first build.
+
+    Returned activity dicts are shared with the index and must not be mutated.
+    """
+
+    def __init__(self, store: ActivityLogStore):
+        self.store = store
+        self._lock = threading.RLock()
+        self._reset()
+
+    def query(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        activity_type: Optional[str] = None,
+        application_id: Optional[str] = None,
+        contact_id: Optional[str] = None
+    ) -> List[Dict]:
+        """Return matching activities in timestamp order"""
+        with self._lock:
+            self.refresh()
+            filters = [
+                (self._by_type, 'type', activity_type),
+                (self._by_application, 'application_id', application_id),
+                (self._by_contact, 'contact_id', contact_id),
+            ]
+            filters = [(index, field, value) for index, field, value in filters if value]
+
+            # Start from the smallest matching bucket, then check the remaining criteria
+            candidates = self._all
+            chosen_field = None
+            for index, field, value in filters:
+                bucket = index.get(value)
+                if bucket is None:
+                    return []
+                if len(bucket) < len(candidates):
+                    candidates = bucket
+                    chosen_field = field
+
+            start = start_date.timestamp() if start_date else None
+            end = end_date.timestamp() if end_date else None
+            activities = candidates.range(start, end)
+
+        for _, field, value in filters:
+            if field != chosen_field:
+                activities = [a for a in activities if a.get(field) == value]
+        return activities
+
+    def refresh(self) -> None:
+        """Index any activities appended since the last refresh"""
+        with self._lock:
+            segment_keys = self._segment_keys()
+            if any(key not in segment_keys for key in self._offsets):
+                # A segment was removed - rebuild from scratch
+                self._reset()
+                segment_keys = self._segment_keys()
+
+            new_entries = []
+            for key in segment_keys:
+                size = self.store.segment_size(key)
+                offset = self._offsets.get(key, 0)
+                if size is None or size == offset:
+                    continue
+                if size < offset:
+                    # Segment was rewritten; drop everything and reload on the next pass
+                    self._reset()
+                    self.refresh()
+                    return
+                activities, self._offsets[key] = self.store.read_from(key, offset)
+                new_entries.extend((self._sort_key(a), a) for a in activities)
+
+            if new_entries:
+                self._add(new_entries)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _reset(self) -> None:
+        self._offsets: Dict[str, int] = {}
+        self._segment_dir_mtime: Optional[int] = None
+        self._segment_key_cache: List[str] = []
+        self._all = _TimeSortedActivities()
+        self._by_type: Dict[str, _TimeSortedActivities] = {}
+        self._by_application: Dict[str, _TimeSortedActivities] = {}
+        self._by_contact: Dict[str, _TimeSortedActivities] = {}
+
+    def _segment_keys(self) -> List[str]:
+        """List segments, skipping the directory scan while the directory is unchanged"""
+        try:
+            dir_mtime = os.stat(self.store.log_dir).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        if dir_mtime is None or dir_mtime != self._segment_dir_mtime:
+            self._segment_key_cache = self.store.segment_keys()
+            self._segment_dir_mtime = dir_mtime
+        return self._segment_key_cache
+
+    @staticmethod
+    def _sort_key(activity: Dict) -> float:
+        try:
+            return datetime.fromisoformat(activity['timestamp']).timestamp()
+        except (KeyError, TypeError, ValueError):
+            # Undatable entries sort first and never match a date range
+            return float('-inf')
+
+    def _add(self, entries: List[Tuple[float, Dict]]) -> None:
+        self._all.extend(entries)
+        for index, field in ((self._by_type, 'type'),
+                             (self._by_application, 'application_id'),
+                             (self._by_contact, 'contact_id')):
+            grouped: Dict[str, List[Tuple[float, Dict]]] = {}
+            for key, activity in entries:
+                value = activity.get(field)
+                if value:
+                    grouped.setdefault(value, []).append((key, activity))
+            for value, value_entries in grouped.items():
+                index.setdefault(value, _TimeSortedActivities()).extend(value_entries)
+
+
+_indexes: Dict[Path, ActivityIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_activity_index(store: ActivityLogStore) -> ActivityIndex:
+    """Return the process-wide activity index for a log directory"""
+    log_dir = store.log_dir.resolve()
+    with _indexes_lock:
+        index = _indexes.get(log_dir)
+        if index is None:
+            index = ActivityIndex(store)
+            _indexes[log_dir] = index
+        return index
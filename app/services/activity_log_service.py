@@ -1,44 +1,80 @@
 """Activity log service for tracking all job application and networking activities"""
 import json
+import os
+import threading
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Optional
-from app.utils.file_utils import get_data_path, ensure_dir_exists, read_text_file, write_text_file
+from app.services.activity_index import get_activity_index
+from app.services.activity_log_store import ActivityLogStore
+from app.utils.data_generation import bump_generation
+from app.utils.file_utils import get_data_path, ensure_dir_exists, read_text_file
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+_migration_lock = threading.Lock()
+
+
+def _activity_key(activity: Dict) -> str:
+    """Identity of an activity for de-duplication: its id, or its content if it has none"""
+    if activity.get('id') is not None:
+        return f"id:{activity['id']}"
+    return 'content:' + json.dumps(activity, sort_keys=True, default=str)
 
 
 class ActivityLogService:
-    """Maintains a single JSON log file of all activities for fast reporting"""
+    """Records all activities in an append-only, month-segmented JSONL log for fast reporting"""
     
     def __init__(self):
         self.log_dir = get_data_path('output')
         ensure_dir_exists(self.log_dir)
+        # Legacy single-file log, migrated into the segmented store on first use
         self.log_file = self.log_dir / 'activity_log.json'
-        self._ensure_log_file()
+        self.store = ActivityLogStore(self.log_dir / 'activity_log')
+        self._migrate_legacy_log()
+        self.index = get_activity_index(self.store)
     
-    def _ensure_log_file(self):
-        """Ensure log file exists with proper structure"""
-        if not self.log_file.exists():
-            initial_data = {
-                'version': '1.0',
-                'created_at': datetime.now(timezone(timedelta(hours=-4))).isoformat(),
-                'activities': []
-            }
-            write_text_file(json.dumps(initial_data, indent=2), self.log_file)
+    def _migrate_legacy_log(self):
+        """Move activities from the old activity_log.json into the segmented store (once)"""
+        claimed_file = self.log_file.with_name(self.log_file.name + '.migrating')
+        if not self.log_file.exists() and not claimed_file.exists():
+            return
+        
+        # One migration at a time across threads and processes; a leftover
+        # .migrating file (interrupted migration) is only resumed under the lock
+        lock_path = self.log_file.with_name(self.log_file.name + '.lock')
+        with _migration_lock:
+            fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                migrated_file = self.log_file.with_name(self.log_file.name + '.migrated')
+                if self.log_file.exists():
+                    os.replace(self.log_file, claimed_file)
+                elif not claimed_file.exists():
+                    # Another process finished the migration (to migrated_file) while we waited
+                    return
+                self._import_legacy_log(claimed_file, migrated_file)
+            finally:
+                os.close(fd)  # also releases the flock
     
-    def _load_log(self) -> Dict:
-        """Load the activity log from disk"""
+    def _import_legacy_log(self, claimed_file: Path, migrated_file: Path):
         try:
-            content = read_text_file(self.log_file)
-            return json.loads(content)
-        except (json.JSONDecodeError, FileNotFoundError):
-            # If corrupted, create a new one
-            self._ensure_log_file()
-            content = read_text_file(self.log_file)
-            return json.loads(content)
-    
-    def _save_log(self, data: Dict):
-        """Save the activity log to disk"""
-        write_text_file(json.dumps(data, indent=2), self.log_file)
+            activities = json.loads(read_text_file(claimed_file)).get('activities', [])
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"Warning: Could not migrate legacy activity log {claimed_file}: {e}")
+            return
+        
+        # A previous migration may have been interrupted part-way; skip what already made it
+        existing = {_activity_key(a) for a in self.store.read()}
+        pending = [a for a in activities if _activity_key(a) not in existing]
+        count = self.store.append_many(pending)
+        os.replace(claimed_file, migrated_file)
+        print(f"Migrated {count} activities from {self.log_file.name} to {self.store.log_dir}")
     
     def log_application_created(
         self,
@@ -139,14 +175,9 @@ class ActivityLogService:
         self._add_activity(activity)
     
     def _add_activity(self, activity: Dict):
-        """Add an activity to the log (thread-safe append)"""
-        data = self._load_log()
-        data['activities'].append(activity)
-        # Keep only last 10,000 activities to prevent file from growing too large
-        if len(data['activities']) > 10000:
-            data['activities'] = data['activities'][-10000:]
-        data['last_updated'] = datetime.now(timezone(timedelta(hours=-4))).isoformat()
-        self._save_log(data)
+        """Append an activity to the log (a single O_APPEND write, safe across processes)"""
+        self.store.append(activity)
+        bump_generation()
     
     def get_activities(
         self,
@@ -156,35 +187,19 @@ class ActivityLogService:
         application_id: Optional[str] = None,
         contact_id: Optional[str] = None
     ) -> List[Dict]:
-        """Get activities filtered by criteria"""
-        data = self._load_log()
-        activities = data.get('activities', [])
-        
-        # Filter by date range
-        if start_date or end_date:
-            filtered = []
-            for activity in activities:
-                activity_dt = datetime.fromisoformat(activity['timestamp'])
-                if start_date and activity_dt < start_date:
-                    continue
-                if end_date and activity_dt > end_date:
-                    continue
-                filtered.append(activity)
-            activities = filtered
-        
-        # Filter by type
-        if activity_type:
-            activities = [a for a in activities if a.get('type') == activity_type]
-        
-        # Filter by application_id
-        if application_id:
-            activities = [a for a in activities if a.get('application_id') == application_id]
-        
-        # Filter by contact_id
-        if contact_id:
-            activities = [a for a in activities if a.get('contact_id') == contact_id]
+        """
+        Get activities filtered by criteria, in timestamp order.
         
-        return activities
+        Served from the process-wide in-memory index; the returned dicts are
+        shared and must not be modified.
+        """
+        return self.index.query(
+            start_date=start_date,
+            end_date=end_date,
+            activity_type=activity_type,
+            application_id=application_id,
+            contact_id=contact_id
+        )
     
     def get_daily_activities_summary(
         self,
@@ -0,0 +1,121 @@
+"""Append-only JSONL storage engine for the activity log"""
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.utils.file_utils import ensure_dir_exists
+
+
+class ActivityLogStore:
+    """
+    Stores activities as one JSON object per line in per-month segment files
+    (``YYYY-MM.jsonl``). Every event is a single ``O_APPEND`` write, so
+    concurrent writers never rewrite the log or lose each other's events.
+
+    Queries go through ActivityIndex, which reads each segment incrementally
+    (read_from) and keeps the parsed activities in memory. There is no
+    per-date byte-offset index: a process reads each segment once, on its
+    first query, and afterwards only the bytes appended since.
+    """
+
+    SEGMENT_SUFFIX = '.jsonl'
+
+    def __init__(self, log_dir: Path):
+        self.log_dir = Path(log_dir)
+        ensure_dir_exists(self.log_dir)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, activity: Dict) -> None:
+        """Append one activity to its month segment"""
+        self._append_lines(self._segment_key(activity), [activity])
+
+    def append_many(self, activities: Iterable[Dict]) -> int:
+        """Append activities grouped by segment (one write per segment); returns count"""
+        by_segment: Dict[str, List[Dict]] = {}
+        for activity in activities:
+            by_segment.setdefault(self._segment_key(activity), []).append(activity)
+        for key, segment_activities in by_segment.items():
+            self._append_lines(key, segment_activities)
+        return sum(len(items) for items in by_segment.values())
+
+    def _append_lines(self, key: str, activities: List[Dict]) -> None:
+        data = ''.join(json.dumps(a, ensure_ascii=False) + '\n' for a in activities).encode('utf-8')
+        fd = os.open(self._segment_path(key), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def read(self) -> List[Dict]:
+        """Return every activity, segment by segment in append order"""
+        activities = []
+        for key in self.segment_keys():
+            activities.extend(self._read_segment(key))
+        return activities
+
+    def segment_keys(self) -> List[str]:
+        """Return the month keys of all segments, oldest first"""
+        suffix = self.SEGMENT_SUFFIX
+        return sorted(p.name[:-len(suffix)] for p in self.log_dir.glob(f'*{suffix}'))
+
+    def segment_size(self, key: str) -> Optional[int]:
+        """Return the size of a segment in bytes, or None if it does not exist"""
+        try:
+            return self._segment_path(key).stat().st_size
+        except OSError:
+            return None
+
+    def read_from(self, key: str, offset: int) -> Tuple[List[Dict], int]:
+        """
+        Return the complete lines of a segment from byte offset onwards, and
+        the offset just past the last complete line (a partially written tail
+        is left for the next call).
+        """
+        with open(self._segment_path(key), 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+        complete = data.rfind(b'\n') + 1
+        return self._parse_lines(data[:complete]), offset + complete
+
+    def _read_segment(self, key: str) -> List[Dict]:
+        with open(self._segment_path(key), 'rb') as f:
+            return self._parse_lines(f.read())
+
+    @staticmethod
+    def _parse_lines(data: bytes) -> List[Dict]:
+        activities = []
+        for raw in data.splitlines():
+            if not raw.strip():
+                continue
+            try:
+                activities.append(json.loads(raw))
+            except ValueError:
+                # Torn or corrupted line - skip it rather than failing the whole read
+                continue
+        return activities
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _activity_day(activity: Dict) -> str:
+        return activity.get('date') or (activity.get('timestamp') or '')[:10]
+
+    def _segment_key(self, activity: Dict) -> str:
+        return self._activity_day(activity)[:7] or 'undated'
+
+    def _segment_path(self, key: str) -> Path:
+        return self.log_dir / f"{key}{self.SEGMENT_SUFFIX}"
+
@@ -3,8 +3,8 @@ import json
 import re
 from datetime import datetime
 from typing import Dict, List, Optional
-import requests
 from app.models.qualification import QualificationAnalysis
+from app.services.ollama_client import get_ollama_client
 from app.utils.prompts import get_prompt
 from app.utils.simple_tech_extractor import SimpleTechExtractor
 
@@ -22,7 +22,8 @@ class AIAnalyzer:
     def __init__(self, model: str = "llama3", base_url: str = "http://localhost:11434"):
         self.model = model
         self.base_url = base_url
-        self.timeout = 600  # 10 minutes timeout for longer responses
+        # Shared, pooled connection to Ollama; its timeouts come from config.yaml's ai: section
+        self.client = get_ollama_client(base_url)
         self.tech_extractor = SimpleTechExtractor()  # Initialize simple tech extractor
         
         # Initialize enhanced analyzer if available
@@ -35,61 +36,27 @@ class AIAnalyzer:
             print("⚠️ Enhanced Qualifications Analyzer not available - using standard AI analysis")
     
     def check_connection(self) -> bool:
-        """Check if Ollama is running and accessible"""
-        try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
-            return response.status_code == 200
-        except:
-            return False
+        """Check if Ollama is running and accessible (cached for a few seconds)"""
+        return self.client.is_available()
     
     def list_available_models(self) -> List[str]:
         """List available Ollama models"""
-        try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                return [model['name'] for model in data.get('models', [])]
-        except:
-            pass
-        return []
+        return self.client.list_models()
     
     def _call_ollama(self, prompt: str, system_prompt: Optional[str] = None) -> str:
-        """Make a call to Ollama API"""
-        if not self.check_connection():
-            raise ConnectionError(
-                "Cannot connect to Ollama. Please ensure Ollama is running:\n"
-                "  1. Install: brew install ollama\n"
-                "  2. Start: ollama serve\n"
-                "  3. Pull model: ollama pull llama3"
-            )
-        
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": 0.7,
-                "num_predict": 10000,  # Increased to 10000 tokens for large documents
-                "num_ctx": 10000  # Context window for processing large job descriptions
-            }
+        """Make a call to Ollama API (identical requests are served from the response cache)"""
+        options = {
+            "temperature": 0.7,
+            "num_predict": 10000,  # Increased to 10000 tokens for large documents
+            "num_ctx": 10000  # Context window for processing large job descriptions
         }
-        
-        if system_prompt:
-            payload["system"] = system_prompt
-        
-        try:
-            response = requests.post(
-                f"{self.base_url}/api/generate",
-                json=payload,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            result = response.json()
-            return result.get('response', '')
-        except requests.exceptions.Timeout:
-            raise TimeoutError("Ollama request timed out. The model might be taking too long to respond.")
-        except requests.exceptions.RequestException as e:
-            raise RuntimeError(f"Ollama API error: {str(e)}")
+        return self.client.generate(
+            self.model,
+            prompt,
+            system=system_prompt,
+            options=options,
+            check_available=True
+        )
     
     def analyze_qualifications(self, job_description: str, resume_content: str) -> QualificationAnalysis:
         """Analyze how well the resume matches the job description"""
@@ -105,10 +72,8 @@ class AIAnalyzer:
     
     def _analyze_qualifications_original(self, job_description: str, resume_content: str) -> QualificationAnalysis:
         """Original qualifications analysis method (fallback)"""
-        # Use cached technologies from resume manager if available
-        from app.services.resume_manager import ResumeManager
-        resume_manager = ResumeManager()
-        cached_tech_list = resume_manager.get_technology_list()
+        # Use the resume's cached technologies (tech.yaml, via the shared resume profile) if available
+        cached_tech_list = self._cached_technology_list()
         
         if cached_tech_list:
             # Use cached technologies for comparison
@@ -141,6 +106,16 @@ class AIAnalyzer:
         analysis = self._parse_qualification_response(response, tech_comparison)
         return analysis
     
+    def _cached_technology_list(self) -> List[str]:
+        """Technologies recorded for the base resume"""
+        try:
+            from app.services.resume_profile import get_resume_profile
+            return get_resume_profile().technologies
+        except Exception as e:
+            print(f"Warning: Could not load resume profile: {e}")
+        from app.services.resume_manager import ResumeManager
+        return ResumeManager().get_technology_list()
+    
     def _parse_qualification_response(self, response: str, tech_comparison: Dict = None) -> QualificationAnalysis:
         """Parse AI response into QualificationAnalysis object"""
         # Extract match score
@@ -976,14 +976,7 @@ class AnalyticsGenerator:
                 avg_score_with = sum(skill_to_match_scores.get(skill, [])) / len(skill_to_match_scores.get(skill, [1])) if skill_to_match_scores.get(skill) else 0.0
                 
                 # Check if this is a technical skill (technology)
-                skill_lower = skill.lower()
-                is_technical = False
-                known_technologies_lower = {tech.lower() for tech in self.tech_extractor.TECHNOLOGIES.keys()}
-                # Check if skill matches any known technology name or variation
-                for tech_name, variations in self.tech_extractor.TECHNOLOGIES.items():
-                    if skill_lower == tech_name.lower() or any(skill_lower == var.lower() for var in variations):
-                        is_technical = True
-                        break
+                is_technical = self.tech_extractor.is_known_technology(skill)
                 
                 skill_data = {
                     'skill': skill,
@@ -0,0 +1,318 @@
+"""In-process application repository backed by the application folders on disk"""
+import os
+import threading
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.models.application import Application
+from app.utils.file_utils import load_yaml
+from app.utils.id_index import IdIndex
+from app.utils.pagination import keyset_page
+
+
+# Sortable fields -> ascending sort key; keys end with the id so they are unique
+APPLICATION_SORT_KEYS: Dict[str, Callable[[Application], tuple]] = {
+    'created_at': lambda app: (app.created_at.isoformat(), app.id),
+    'updated_at': lambda app: ((app.status_updated_at or app.created_at).isoformat(), app.id),
+    'match_score': lambda app: (app.match_score is not None, float(app.match_score or 0.0), app.id),
+    'company': lambda app: ((app.company or '').lower(), app.id),
+    'status': lambda app: ((app.status or '').lower(), app.id),
+    'flagged': lambda app: (bool(app.flagged), app.id),
+}
+
+
+class ApplicationRepository:
+    """
+    Caches parsed Application records for one applications directory.
+
+    Every folder is loaded once and then only re-read when its application.yaml
+    or its updates/ folder changes (mtime, inode or size), so listing thousands
+    of applications costs one stat per folder instead of a YAML parse and an
+    updates/ walk. Records are indexed by id, company and status, and kept in
+    sorted key order per sort field for paging.
+
+    When an index_path is given, single-record lookups go through a persistent
+    id -> folder index and read only that record's metadata file.
+    """
+
+    def __init__(self, root_dir: Path, label: str = "application", index_path: Optional[Path] = None):
+        self.root_dir = Path(root_dir)
+        self.label = label
+        self._lock = threading.RLock()
+        self.id_index = None
+        if index_path is not None:
+            self.id_index = IdIndex(self.root_dir, index_path, "application.yaml", scan=self._scan_ids)
+        # folder name -> (signature, Application or None if the folder failed to load)
+        self._entries: Dict[str, Tuple[tuple, Optional[Application]]] = {}
+        self._by_id: Dict[str, str] = {}
+        self._by_company: Dict[str, Set[str]] = {}
+        self._by_status: Dict[str, Set[str]] = {}
+        self._sorted_ids: Optional[List[str]] = None
+        # sort field -> sorted keys of every record (rebuilt after a change)
+        self._sort_indexes: Dict[str, List[tuple]] = {}
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def list_all(self) -> List[Application]:
+        """Return all applications sorted by created_at descending"""
+        with self._lock:
+            self.refresh()
+            if self._sorted_ids is None:
+                apps = [self._get_cached(app_id) for app_id in self._by_id]
+                apps.sort(key=lambda x: x.created_at, reverse=True)
+                self._sorted_ids = [app.id for app in apps]
+            return [self._copy(self._get_cached(app_id)) for app_id in self._sorted_ids]
+
+    def get(self, app_id: str) -> Optional[Application]:
+        """Return the application with the given id, or None"""
+        with self._lock:
+            if self.id_index is None:
+                self.refresh()
+                application = self._get_cached(app_id)
+            else:
+                application = self._get_indexed(app_id)
+            return self._copy(application) if application else None
+
+    def find_by_company(self, company: str) -> List[Application]:
+        """Return applications whose company matches (case-insensitive)"""
+        return self._find(self._by_company, self._key(company))
+
+    def find_by_status(self, status: str) -> List[Application]:
+        """Return applications whose status matches (case-insensitive)"""
+        return self._find(self._by_status, self._key(status))
+
+    def page(
+        self,
+        sort_by: str = 'created_at',
+        descending: bool = True,
+        after: Optional[tuple] = None,
+        limit: int = 20,
+        statuses: Optional[Iterable[str]] = None,
+        company: Optional[str] = None,
+        accept: Optional[Callable[[Application], bool]] = None
+    ) -> Tuple[List[Application], Optional[tuple]]:
+        """
+        Return up to limit applications in sort_by order (see
+        APPLICATION_SORT_KEYS) following the sort key after, and the key of
+        the last one if more follow. statuses and company (case-insensitive)
+        narrow the candidates through the indexes; accept filters the rest.
+        """
+        key_fn = APPLICATION_SORT_KEYS[sort_by]
+        with self._lock:
+            self.refresh()
+            candidates = None
+            if statuses is not None:
+                candidates = set()
+                for status in statuses:
+                    candidates |= self._by_status.get(self._key(status), set())
+            if company is not None:
+                company_ids = self._by_company.get(self._key(company), set())
+                candidates = company_ids if candidates is None else candidates & company_ids
+
+            if candidates is None:
+                keys = self._sort_index(sort_by)
+            else:
+                keys = sorted(key_fn(self._get_cached(app_id)) for app_id in candidates)
+
+            check = None
+            if accept is not None:
+                check = lambda position: accept(self._get_cached(keys[position][-1]))
+            positions, has_more = keyset_page(keys, after, limit, descending, check)
+            apps = [self._copy(self._get_cached(keys[position][-1])) for position in positions]
+            return apps, keys[positions[-1]] if has_more else None
+
+    def invalidate(self, folder_path: Optional[Path] = None) -> None:
+        """Forget a cached folder (or everything) so it is re-read on next access"""
+        with self._lock:
+            if folder_path is None:
+                for folder_name in list(self._entries):
+                    self._drop(folder_name)
+                return
+            folder_path = Path(folder_path).resolve()
+            if folder_path.parent == self.root_dir and folder_path.name in self._entries:
+                self._drop(folder_path.name)
+
+    def remember(self, app_id: str, folder_path: Path) -> None:
+        """Record where a newly created or moved application lives"""
+        with self._lock:
+            if self.id_index is not None:
+                self.id_index.set(app_id, folder_path)
+
+    def forget(self, app_id: str) -> None:
+        """Drop an application that was moved out of or deleted from this directory"""
+        with self._lock:
+            folder_name = self._by_id.get(app_id)
+            if folder_name is not None:
+                self._drop(folder_name)
+            if self.id_index is not None:
+                self.id_index.remove(app_id)
+
+    def refresh(self) -> None:
+        """Bring the cache in line with the folders currently on disk"""
+        with self._lock:
+            seen = set()
+            try:
+                dir_entries = list(os.scandir(self.root_dir))
+            except FileNotFoundError:
+                dir_entries = []
+
+            for entry in dir_entries:
+                if not entry.is_dir():
+                    continue
+                signature = self._signature(Path(entry.path))
+                if signature is None:
+                    continue
+                seen.add(entry.name)
+                cached = self._entries.get(entry.name)
+                if cached is not None and cached[0] == signature:
+                    continue
+                self._drop(entry.name)
+                self._load(entry.name, signature)
+
+            for folder_name in list(self._entries):
+                if folder_name not in seen:
+                    self._drop(folder_name)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(value: Optional[str]) -> str:
+        return (value or '').lower().strip()
+
+    @staticmethod
+    def _signature(folder_path: Path) -> Optional[tuple]:
+        """Stat-based fingerprint of a folder; None if it has no application.yaml"""
+        try:
+            meta_stat = os.stat(folder_path / "application.yaml")
+        except OSError:
+            return None
+        try:
+            updates_mtime = os.stat(folder_path / "updates").st_mtime_ns
+        except OSError:
+            updates_mtime = None
+        return (meta_stat.st_mtime_ns, meta_stat.st_ino, meta_stat.st_size, updates_mtime)
+
+    @staticmethod
+    def _copy(application: Application) -> Application:
+        """Hand out copies so callers can mutate records without touching the cache"""
+        return replace(
+            application,
+            checklist_items=dict(application.checklist_items) if application.checklist_items else application.checklist_items,
+            extracted_skills=list(application.extracted_skills) if application.extracted_skills else application.extracted_skills
+        )
+
+    def _sort_index(self, sort_by: str) -> List[tuple]:
+        keys = self._sort_indexes.get(sort_by)
+        if keys is None:
+            key_fn = APPLICATION_SORT_KEYS[sort_by]
+            keys = sorted(key_fn(self._get_cached(app_id)) for app_id in self._by_id)
+            self._sort_indexes[sort_by] = keys
+        return keys
+
+    def _get_cached(self, app_id: str) -> Optional[Application]:
+        folder_name = self._by_id.get(app_id)
+        if folder_name is None:
+            return None
+        return self._entries[folder_name][1]
+
+    def _get_indexed(self, app_id: str) -> Optional[Application]:
+        for _ in range(2):
+            folder_path = self.id_index.lookup(app_id)
+            if folder_path is None:
+                return None
+            application = self._get_folder(folder_path.name)
+            if application is not None and application.id == app_id:
+                return application
+            # The indexed folder now holds a different record; rescan once
+            self.id_index.rebuild()
+        return None
+
+    def _get_folder(self, folder_name: str) -> Optional[Application]:
+        """Return the cached record for one folder, re-reading it only if it changed"""
+        signature = self._signature(self.root_dir / folder_name)
+        if signature is None:
+            self._drop(folder_name)
+            return None
+        cached = self._entries.get(folder_name)
+        if cached is None or cached[0] != signature:
+            self._drop(folder_name)
+            self._load(folder_name, signature)
+        return self._entries[folder_name][1]
+
+    def _scan_ids(self) -> Dict[str, str]:
+        self.refresh()
+        return dict(self._by_id)
+
+    def _find(self, index: Dict[str, Set[str]], key: str) -> List[Application]:
+        with self._lock:
+            self.refresh()
+            apps = [self._get_cached(app_id) for app_id in index.get(key, ())]
+            apps.sort(key=lambda x: x.created_at, reverse=True)
+            return [self._copy(app) for app in apps]
+
+    def _load(self, folder_name: str, signature: tuple) -> None:
+        folder_path = self.root_dir / folder_name
+        try:
+            metadata = load_yaml(folder_path / "application.yaml")
+            metadata['folder_path'] = str(folder_path)
+            application = Application.from_dict(metadata)
+            # Calculate and set contact count
+            application.contact_count = application.calculate_contact_count()
+        except Exception as e:
+            print(f"Error loading {self.label} from {folder_path}: {e}")
+            self._entries[folder_name] = (signature, None)
+            return
+
+        self._entries[folder_name] = (signature, application)
+        previous_folder = self._by_id.get(application.id)
+        if previous_folder is not None and previous_folder != folder_name:
+            # Two folders claim the same id; keep the most recently seen one
+            self._unindex(self._entries[previous_folder][1], previous_folder)
+        self._by_id[application.id] = folder_name
+        self._by_company.setdefault(self._key(application.company), set()).add(application.id)
+        self._by_status.setdefault(self._key(application.status), set()).add(application.id)
+        self._sorted_ids = None
+        self._sort_indexes = {}
+
+    def _drop(self, folder_name: str) -> None:
+        cached = self._entries.pop(folder_name, None)
+        if cached is not None and cached[1] is not None:
+            self._unindex(cached[1], folder_name)
+
+    def _unindex(self, application: Application, folder_name: str) -> None:
+        if self._by_id.get(application.id) != folder_name:
+            return
+        del self._by_id[application.id]
+        for index, key in ((self._by_company, self._key(application.company)),
+                           (self._by_status, self._key(application.status))):
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(application.id)
+                if not ids:
+                    del index[key]
+        self._sorted_ids = None
+        self._sort_indexes = {}
+
+
+_repositories: Dict[Path, ApplicationRepository] = {}
+_repositories_lock = threading.Lock()
+
+
+def get_application_repository(
+    root_dir: Path,
+    label: str = "application",
+    index_path: Optional[Path] = None
+) -> ApplicationRepository:
+    """Return the process-wide repository for an applications directory"""
+    root_dir = Path(root_dir).resolve()
+    with _repositories_lock:
+        repository = _repositories.get(root_dir)
+        if repository is None:
+            repository = ApplicationRepository(root_dir, label=label, index_path=index_path)
+            _repositories[root_dir] = repository
+        return repository
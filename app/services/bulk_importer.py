@@ -0,0 +1,316 @@
+"""Bulk import of job postings: dedupe and pre-process up front, then generate with bounded concurrency"""
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from app.services.ollama_client import OLLAMA_UNAVAILABLE_MESSAGE
+from app.services.preliminary_matcher import PreliminaryMatcher
+from app.utils.file_utils import get_project_root, load_yaml, read_text_file
+from app.utils.input_sanitizer import sanitize_text
+
+
+# Accepted spellings for posting fields in JSON/JSONL records and text headers
+FIELD_ALIASES = {
+    'company': 'company',
+    'job_title': 'job_title',
+    'title': 'job_title',
+    'job_description': 'job_description',
+    'description': 'job_description',
+    'job_url': 'job_url',
+    'url': 'job_url',
+}
+
+POSTING_FILE_SUFFIXES = ('.jsonl', '.json', '.txt', '.md')
+
+
+def load_postings(path: Path) -> List[Dict]:
+    """
+    Read postings from a .jsonl/.json file or a directory of them.
+
+    JSON records use company, job_title (or title), job_description (or
+    description) and optional job_url (or url). .txt/.md files start with
+    "Company: ...", "Title: ...", "URL: ..." header lines, followed by a
+    blank line and the job description.
+    """
+    path = Path(path)
+    if path.is_dir():
+        postings = []
+        for file_path in sorted(p for p in path.iterdir() if p.suffix.lower() in POSTING_FILE_SUFFIXES):
+            postings.extend(load_postings(file_path))
+        return postings
+
+    suffix = path.suffix.lower()
+    text = read_text_file(path)
+    if suffix == '.jsonl':
+        postings = parse_jsonl(text)
+    elif suffix == '.json':
+        data = json.loads(text)
+        postings = data if isinstance(data, list) else [data]
+    else:
+        postings = [_parse_text_posting(text)]
+    for posting in postings:
+        posting.setdefault('source', path.name)
+    return postings
+
+
+def parse_jsonl(text: str) -> List[Dict]:
+    """Parse one JSON posting per line (blank lines are skipped)"""
+    postings = []
+    for line_number, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            postings.append(json.loads(line))
+        except ValueError as e:
+            postings.append({'error': f"line {line_number}: invalid JSON ({e})"})
+    return postings
+
+
+def _parse_text_posting(text: str) -> Dict:
+    posting = {}
+    lines = text.splitlines()
+    body_start = 0
+    for i, line in enumerate(lines):
+        if not line.strip():
+            body_start = i + 1
+            break
+        key, sep, value = line.partition(':')
+        field = FIELD_ALIASES.get(key.strip().lower().replace(' ', '_'))
+        if not sep or field is None or field == 'job_description':
+            body_start = i
+            break
+        posting[field] = value.strip()
+    posting['job_description'] = '\n'.join(lines[body_start:]).strip()
+    return posting
+
+
+class BulkImporter:
+    """
+    Imports many postings in one go:
+
+    1. prepare(): validate, clean every description (JobProcessor's
+       deterministic cleaner), drop duplicates - within the batch and
+       against existing applications of the same company, by job URL or
+       cleaned description - and score each posting with PreliminaryMatcher.
+       No LLM calls; pending postings are ordered best match first.
+    2. run(): create applications and generate their documents, at most
+       max_concurrent postings at a time (jobs.bulk_concurrency in
+       config.yaml), reporting progress after every status change.
+    """
+
+    def __init__(self, job_processor, doc_generator, max_concurrent: Optional[int] = None):
+        self.job_processor = job_processor
+        self.doc_generator = doc_generator
+        if max_concurrent is None:
+            try:
+                config = load_yaml(get_project_root() / 'config' / 'config.yaml').get('jobs') or {}
+            except Exception:
+                config = {}
+            max_concurrent = int(config.get('bulk_concurrency', 2))
+        self.max_concurrent = max(1, max_concurrent)
+        self._matcher: Optional[PreliminaryMatcher] = None
+        self._lock = threading.Lock()
+
+    def prepare(self, postings: List[Dict], previous: Optional[Dict] = None) -> List[Dict]:
+        """
+        Turn raw postings into import items (see class docstring). previous
+        is the progress summary of an interrupted run of the same import:
+        the applications it created are not duplicates but postings to
+        resume (see restore).
+        """
+        items = []
+        seen_urls: Dict[str, str] = {}
+        seen_descriptions: Dict[str, str] = {}
+        existing_cache: Dict[str, Dict[str, Dict[str, str]]] = {}
+        resumed_ids = {
+            item['application_id'] for item in (previous or {}).get('items', [])
+            if item.get('application_id')
+        }
+
+        for index, raw in enumerate(postings):
+            posting = {FIELD_ALIASES[k]: v for k, v in raw.items() if k in FIELD_ALIASES and v}
+            company = sanitize_text(str(posting.get('company', ''))).strip()
+            job_title = sanitize_text(str(posting.get('job_title', ''))).strip()
+            job_description = str(posting.get('job_description', ''))
+            job_url = str(posting['job_url']).strip() if posting.get('job_url') else None
+            item = {
+                'key': f"posting-{index}",
+                'source': raw.get('source'),
+                'company': company,
+                'job_title': job_title,
+                'job_url': job_url,
+                'job_description': job_description,
+                'status': 'pending',
+                'preliminary_score': None,
+                'application_id': None,
+                'reason': None,
+                'error': None,
+            }
+            items.append(item)
+
+            if raw.get('error') or not all([company, job_title, job_description.strip()]):
+                item['status'] = 'invalid'
+                item['reason'] = raw.get('error') or 'Missing required fields: company, job_title, job_description'
+                continue
+
+            cleaned = self.job_processor._clean_job_description(job_description)
+            description_hash = hashlib.sha256(cleaned.lower().encode('utf-8')).hexdigest()
+            # Stable across re-runs of the same import, so progress can be matched up on resume
+            item['key'] = description_hash[:16]
+
+            duplicate_of = (seen_urls.get(job_url) if job_url else None) or seen_descriptions.get(description_hash)
+            if duplicate_of:
+                item['status'] = 'duplicate'
+                item['reason'] = f"Same posting as {duplicate_of} in this import"
+                continue
+            existing_id = self._find_existing(company, job_url, description_hash, existing_cache, resumed_ids)
+            if existing_id:
+                item['status'] = 'duplicate'
+                item['reason'] = f"Already imported as {existing_id}"
+                continue
+            label = f"{company} - {job_title}"
+            if job_url:
+                seen_urls[job_url] = label
+            seen_descriptions[description_hash] = label
+
+            try:
+                item['preliminary_score'] = self.matcher.find_skill_matches(cleaned).get('match_score')
+            except Exception as e:
+                print(f"Warning: Preliminary matching failed for {label}: {e}")
+
+        if previous:
+            self.restore(items, previous)
+
+        pending = [item for item in items if item['status'] == 'pending']
+        pending.sort(key=lambda item: -(item['preliminary_score'] or 0))
+        return pending + [item for item in items if item['status'] != 'pending']
+
+    def run(
+        self,
+        items: List[Dict],
+        on_progress: Optional[Callable[[Dict], None]] = None
+    ) -> Dict:
+        """
+        Create applications for all pending items and return the final
+        progress summary. Items that already have an application_id (from an
+        interrupted run) only get their documents generated.
+        """
+        todo = [item for item in items if item['status'] in ('pending', 'running')]
+        # Fail the whole import up front rather than every posting one by one
+        if todo and not self.doc_generator.ai_analyzer.check_connection():
+            raise ConnectionError(OLLAMA_UNAVAILABLE_MESSAGE)
+
+        def report():
+            if on_progress is not None:
+                with self._lock:
+                    summary = self.summarize(items)
+                on_progress(summary)
+
+        def process(item):
+            with self._lock:
+                item['status'] = 'running'
+            report()
+            try:
+                application = None
+                if item['application_id']:
+                    application = self.job_processor.get_application_by_id(item['application_id'])
+                if application is None:
+                    application = self.job_processor.create_job_application(
+                        company=item['company'],
+                        job_title=item['job_title'],
+                        job_description=item['job_description'],
+                        job_url=item['job_url']
+                    )
+                    with self._lock:
+                        item['application_id'] = application.id
+                    report()
+                self.doc_generator.generate_all_documents(application)
+                self.job_processor._save_application_metadata(application)
+                with self._lock:
+                    item['status'] = 'succeeded'
+                    item['match_score'] = application.match_score
+            except Exception as e:
+                print(f"Warning: Bulk import failed for {item['company']} - {item['job_title']}: {e}")
+                with self._lock:
+                    item['status'] = 'failed'
+                    item['error'] = str(e)
+            report()
+
+        report()
+        with ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix='bulk-import') as executor:
+            list(executor.map(process, todo))
+        return self.summarize(items)
+
+    @staticmethod
+    def restore(items: List[Dict], previous: Dict) -> None:
+        """Carry application ids and results over from an interrupted run's progress summary"""
+        previous_items = {
+            item['key']: item for item in previous.get('items', [])
+            if item.get('application_id')
+        }
+        for item in items:
+            if item['status'] != 'pending':
+                continue
+            earlier = previous_items.get(item['key'])
+            if not earlier or not earlier.get('application_id'):
+                continue
+            # The posting now matches the application the earlier run created
+            item['application_id'] = earlier['application_id']
+            item['status'] = 'succeeded' if earlier['status'] == 'succeeded' else 'pending'
+            item['reason'] = None
+            if 'match_score' in earlier:
+                item['match_score'] = earlier['match_score']
+
+    @staticmethod
+    def summarize(items: List[Dict]) -> Dict:
+        """Counts per status plus each item without its description"""
+        summary = {'total': len(items)}
+        for status in ('pending', 'running', 'succeeded', 'failed', 'duplicate', 'invalid'):
+            summary[status] = sum(1 for item in items if item['status'] == status)
+        summary['items'] = [
+            {k: v for k, v in item.items() if k != 'job_description'}
+            for item in items
+        ]
+        return summary
+
+    @property
+    def matcher(self) -> PreliminaryMatcher:
+        if self._matcher is None:
+            self._matcher = PreliminaryMatcher()
+        return self._matcher
+
+    def _find_existing(
+        self,
+        company: str,
+        job_url: Optional[str],
+        description_hash: str,
+        cache: Dict,
+        ignore_ids: Optional[set] = None
+    ) -> Optional[str]:
+        """
+        Return the id of an existing application of this company with the
+        same URL or description, other than the ids in ignore_ids
+        """
+        key = company.lower()
+        if key not in cache:
+            urls, hashes = {}, {}
+            for application in self.job_processor.find_applications_by_company(company):
+                if ignore_ids and application.id in ignore_ids:
+                    continue
+                if application.job_url:
+                    urls[application.job_url.strip()] = application.id
+                if application.raw_job_description_path and Path(application.raw_job_description_path).exists():
+                    try:
+                        cleaned = self.job_processor._clean_job_description(
+                            read_text_file(application.raw_job_description_path)
+                        )
+                    except Exception:
+                        continue
+                    hashes[hashlib.sha256(cleaned.lower().encode('utf-8')).hexdigest()] = application.id
+            cache[key] = {'urls': urls, 'hashes': hashes}
+        existing = cache[key]
+        return (existing['urls'].get(job_url) if job_url else None) or existing['hashes'].get(description_hash)
@@ -1,14 +1,16 @@
 """Dashboard generation service"""
 from pathlib import Path
-from typing import List, Optional, Dict
-import re
+from typing import List, Optional, Dict, Tuple
+import json
+import os
+import threading
 import time
 
 from app.models.application import Application
 from app.services.job_processor import JobProcessor
 from app.services.networking_processor import NetworkingProcessor
 from app.services.contact_count_cache import ContactCountCache
-from app.utils.file_utils import get_data_path, ensure_dir_exists, write_text_file, read_text_file
+from app.utils.file_utils import get_data_path, ensure_dir_exists, write_text_file
 from app.utils.datetime_utils import format_for_display
 
 STATUS_NORMALIZATION_MAP = {
@@ -21,6 +23,21 @@ STATUS_NORMALIZATION_MAP = {
     'interview - follow up': 'interview - follow up',
 }
 
+# Rendered card HTML per (dashboard, application id): (inputs signature, html).
+# Shared by all generators so a regeneration only re-renders cards that changed.
+_card_fragments: Dict[Tuple[str, str], Tuple[tuple, str]] = {}
+_card_fragments_lock = threading.Lock()
+
+
+def invalidate_archived_dashboard() -> None:
+    """Drop the generated archived dashboard so the next /archived request rebuilds it"""
+    try:
+        (get_data_path('output') / 'archived.html').unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"Warning: Could not invalidate archived dashboard: {e}")
+
 
 class DashboardGenerator:
     """Generates HTML dashboard"""
@@ -48,7 +65,20 @@ class DashboardGenerator:
         - The file does not exist
         - The file's modification time is older than ttl_seconds
         """
-        dashboard_path = self.get_dashboard_path()
+        return self._is_stale(self.get_dashboard_path(), ttl_seconds)
+    
+    def is_archived_dashboard_stale(self, ttl_seconds: int = 300) -> bool:
+        """
+        Return True if the archived dashboard HTML should be regenerated.
+        
+        Same rules as is_dashboard_stale(); in addition, archiving or
+        rejecting an application deletes the file (see
+        invalidate_archived_dashboard), which makes it stale immediately.
+        """
+        return self._is_stale(self.get_archived_dashboard_path(), ttl_seconds)
+    
+    @staticmethod
+    def _is_stale(dashboard_path: Path, ttl_seconds: int) -> bool:
         if not dashboard_path.exists():
             return True
         
@@ -1413,8 +1443,7 @@ class DashboardGenerator:
                     </div>
                 '''
         
-        # Create all application cards
-        cards_html = ""
+        # Create all application cards (unchanged cards come from the fragment cache)
         # Sort applications by updated timestamp (newest first)
         def safe_datetime_sort_key(app):
             if app.status_updated_at:
@@ -1422,12 +1451,7 @@ class DashboardGenerator:
             return str(app.created_at)
         
         sorted_apps = sorted(applications, key=safe_datetime_sort_key, reverse=True)
-        for app in sorted_apps:
-            if is_archived:
-                # Archive dash doesn't need contact counts, so skip contacts_cache
-                cards_html += self._create_archived_application_card(app)
-            else:
-                cards_html += self._create_application_card(app, contacts_cache=contacts_cache)
+        cards_html = self._render_cards(sorted_apps, is_archived=is_archived, contacts_cache=contacts_cache)
         
         # Get unique company names for search
         company_names = sorted(list(set([app.company for app in applications if app.company])))
@@ -1643,6 +1667,77 @@ class DashboardGenerator:
         </div>
         '''
     
+    def _render_cards(self, applications: List[Application], is_archived: bool = False, contacts_cache: dict = None) -> str:
+        """
+        Concatenate the cards for applications (in the given order), reusing
+        the cached fragment of every card whose inputs are unchanged and
+        rendering only the rest. Fragments of applications no longer on
+        this dashboard are dropped.
+        """
+        dashboard = 'archived' if is_archived else 'main'
+        if not is_archived and contacts_cache is None:
+            contacts_cache = self._load_contacts_cache()
+        
+        fragments = []
+        fresh = {}
+        for app in applications:
+            key = (dashboard, app.id)
+            signature = self._card_signature(app, is_archived, contacts_cache)
+            with _card_fragments_lock:
+                cached = _card_fragments.get(key)
+            if signature is not None and cached is not None and cached[0] == signature:
+                html = cached[1]
+            elif is_archived:
+                # Archive dash doesn't need contact counts, so skip contacts_cache
+                html = self._create_archived_application_card(app)
+            else:
+                html = self._create_application_card(app, contacts_cache=contacts_cache)
+            if signature is not None:
+                fresh[key] = (signature, html)
+            fragments.append(html)
+        
+        with _card_fragments_lock:
+            for key in [key for key in _card_fragments if key[0] == dashboard and key not in fresh]:
+                del _card_fragments[key]
+            _card_fragments.update(fresh)
+        return ''.join(fragments)
+    
+    def _card_signature(self, app: Application, is_archived: bool, contacts_cache: dict = None) -> Optional[tuple]:
+        """
+        Everything a card is rendered from: the application's metadata file,
+        its folder (summary file), its latest update file (rejection notes)
+        and, on the main dashboard, its contact count and badge. None if the
+        folder can't be read, in which case the card is always re-rendered.
+        """
+        folder_path = app.folder_path
+        if not folder_path:
+            return None
+        try:
+            meta_stat = os.stat(folder_path / "application.yaml")
+            folder_mtime = os.stat(folder_path).st_mtime_ns
+        except OSError:
+            return None
+        
+        latest_update = None
+        try:
+            with os.scandir(folder_path / "updates") as entries:
+                for entry in entries:
+                    if entry.name.endswith('.html') and (latest_update is None or entry.name > latest_update.name):
+                        latest_update = entry
+            if latest_update is not None:
+                latest_update = (latest_update.name, latest_update.stat().st_mtime_ns)
+        except OSError:
+            latest_update = None
+        
+        signature = (str(folder_path), meta_stat.st_mtime_ns, meta_stat.st_size, folder_mtime, latest_update, app.summary_path)
+        if not is_archived:
+            badge_data = self._get_latest_badge_for_application(app, contacts_cache)
+            signature += (
+                self._get_contact_count_for_application(app, contacts_cache),
+                json.dumps(badge_data, sort_keys=True, default=str) if badge_data else None,
+            )
+        return signature
+    
     def _create_application_card(self, app: Application, contacts_cache: dict = None) -> str:
         """Create HTML for a single application card"""
         # Generate proper URLs for summary and folder
@@ -1685,10 +1780,12 @@ class DashboardGenerator:
             if notes:
                 # Truncate long notes for card display
                 display_notes = notes[:200] + "..." if len(notes) > 200 else notes
+                # Notes are plain text; escape them for the card markup
+                import html
                 notes_html = f"""
             <div class="card-notes">
                 <div class="card-notes-label">Rejection Notes:</div>
-                <div class="card-notes-text" title="{notes}">{display_notes}</div>
+                <div class="card-notes-text" title="{html.escape(notes)}">{html.escape(display_notes)}</div>
             </div>
                 """
         
@@ -1783,10 +1880,12 @@ class DashboardGenerator:
             notes = self._get_latest_status_notes(app)
             if notes:
                 display_notes = notes[:200] + "..." if len(notes) > 200 else notes
+                # Notes are plain text; escape them for the card markup
+                import html
                 notes_html = f"""
             <div class="card-notes">
                 <div class="card-notes-label">Rejection Notes:</div>
-                <div class="card-notes-text" title="{notes}">{display_notes}</div>
+                <div class="card-notes-text" title="{html.escape(notes)}">{html.escape(display_notes)}</div>
             </div>
             """
         
@@ -1979,31 +2078,11 @@ class DashboardGenerator:
             # Get the most recent update (updates are sorted, so take the last one)
             latest_update = status_updates[-1] if status_updates else None
             
-            if not latest_update or not Path(latest_update['file']).exists():
+            if not latest_update:
                 return None
             
-            # Extract notes from the HTML file
-            html_content = read_text_file(Path(latest_update['file']))
-            
-            # Extract notes text using regex - match everything between notes-text div tags
-            # Use a more robust pattern that handles nested HTML
-            notes_match = re.search(r'<div class="notes-text">(.*?)</div>', html_content, re.DOTALL)
-            if notes_match:
-                notes_html = notes_match.group(1).strip()
-                # Remove HTML tags but preserve text content
-                # First, replace common block elements with newlines for better formatting
-                notes_html = re.sub(r'</(p|div|br|li)>', '\n', notes_html, flags=re.IGNORECASE)
-                notes_html = re.sub(r'<(p|div|br|li)[^>]*>', '\n', notes_html, flags=re.IGNORECASE)
-                # Remove all remaining HTML tags
-                notes_text = re.sub(r'<[^>]+>', ' ', notes_html)
-                # Clean up whitespace - replace multiple spaces/newlines with single space
-                notes_text = re.sub(r'\s+', ' ', notes_text)
-                # Strip leading/trailing whitespace
-                notes_text = notes_text.strip()
-                # Return None if empty after cleaning
-                return notes_text if notes_text else None
-            
-            return None
+            # Notes text comes from the structured update log (see StatusUpdateStore)
+            return latest_update.get('notes_text')
         except Exception as e:
             # Silently fail - don't break dashboard if notes can't be extracted
             return None
@@ -1,11 +1,15 @@
 """Document generation service"""
 import re
 import html
+import time
 from pathlib import Path
+from typing import Dict, Optional
 from app.models.application import Application
 from app.models.qualification import QualificationAnalysis
 from app.services.resume_manager import ResumeManager
 from app.services.ai_analyzer import AIAnalyzer
+from app.services.generation_stream import stream_stage
+from app.services.stage_pipeline import Stage, StagePipeline
 from app.utils.file_utils import write_text_file, read_text_file
 from app.utils.datetime_utils import format_datetime_for_filename, format_for_display
 
@@ -17,40 +21,62 @@ class DocumentGenerator:
         self.resume_manager = ResumeManager()
         self.ai_analyzer = AIAnalyzer()
     
-    def generate_all_documents(self, application: Application) -> None:
-        """Generate all documents for an application"""
+    def generate_all_documents(self, application: Application, stream_id: Optional[str] = None) -> Dict[str, float]:
+        """
+        Generate all documents for an application and return the seconds each
+        stage took.
+        
+        The stages form a small DAG: company research does not depend on the
+        qualifications analysis, so the two run concurrently; the cover letter
+        waits for both, and the summary page for everything.
+        
+        If stream_id is given, LLM output for each stage is streamed to that
+        generation_stream channel as it is produced.
+        """
+        from app.utils.message_logger import log_message
         print(f"Generating documents for {application.company} - {application.job_title}...")
+        started = time.perf_counter()
         
         # Load resume and job description
         resume = self.resume_manager.get_resume_for_job(application)
         job_description = read_text_file(application.job_description_path)
         
-        # 1. Generate qualifications analysis (with feature extraction)
-        print("  → Analyzing qualifications and extracting features...")
-        qualifications = self.generate_qualifications(
-            application, job_description, resume.content
-        )
-        
-        # 2. Generate company research
-        from app.utils.message_logger import log_message
-        log_message(37, "  → Generating company research...")
-        self.generate_research(application)
-        
-        # 3. Generate cover letter
-        log_message(38, "  → Generating cover letter...")
-        self.generate_cover_letter(application, qualifications, resume.full_name)
-        
-        # 3.5. Intro messages (deferred) - generated on demand from the Cover Letter tab
-        log_message(39, "  → Skipping intro messages (deferred; generate from Cover Letter tab if needed)")
-        
-        # 4. Customized resume (deferred) - generated on demand from the Resume tab
-        log_message(40, "  → Skipping customized resume (deferred; generate from Resume tab if needed)")
-        
-        # 5. Generate summary HTML page
-        print("  → Generating summary page...")
-        self.generate_summary_page(application, qualifications)
-        
-        print("  ✓ All documents generated successfully!")
+        def qualifications_stage():
+            # Qualifications analysis (with feature extraction)
+            print("  → Analyzing qualifications and extracting features...")
+            with stream_stage(stream_id, 'qualifications'):
+                return self.generate_qualifications(application, job_description, resume.content)
+        
+        def research_stage():
+            log_message(37, "  → Generating company research...")
+            with stream_stage(stream_id, 'research'):
+                self.generate_research(application)
+        
+        def cover_letter_stage(qualifications, research):
+            # Uses the research file when one was generated
+            log_message(38, "  → Generating cover letter...")
+            with stream_stage(stream_id, 'cover_letter'):
+                self.generate_cover_letter(application, qualifications, resume.full_name)
+        
+        def summary_stage(qualifications, research, cover_letter):
+            # Intro messages and the customized resume are deferred - generated on
+            # demand from the Cover Letter and Resume tabs
+            log_message(39, "  → Skipping intro messages (deferred; generate from Cover Letter tab if needed)")
+            log_message(40, "  → Skipping customized resume (deferred; generate from Resume tab if needed)")
+            print("  → Generating summary page...")
+            with stream_stage(stream_id, 'summary'):
+                self.generate_summary_page(application, qualifications)
+        
+        _, timings = StagePipeline([
+            Stage('qualifications', qualifications_stage),
+            Stage('research', research_stage),
+            Stage('cover_letter', cover_letter_stage, inputs=('qualifications', 'research')),
+            Stage('summary', summary_stage, inputs=('qualifications', 'research', 'cover_letter')),
+        ]).run()
+        
+        stage_times = ', '.join(f"{name} {seconds:.1f}s" for name, seconds in timings.items())
+        print(f"  ✓ All documents generated successfully in {time.perf_counter() - started:.1f}s ({stage_times})")
+        return timings
     
     def generate_qualifications(
         self,
@@ -6244,6 +6270,7 @@ Format this as a professional research document that demonstrates thorough prepa
                     'display_date': update['display_timestamp'],
                     'status': update['status'],
                     'update_file': update['file'],
+                    'notes_html': update.get('notes_html'),
                     'update_type': update.get('type', 'application'),
                     'contact_name': update.get('contact_name')
                 })
@@ -6258,64 +6285,8 @@ Format this as a professional research document that demonstrates thorough prepa
         
         timeline_html = ""
         for item in timeline_items:
-            # Extract notes if this is an update item
-            notes_text = ""
-            if item['update_file']:
-                try:
-                    if Path(item['update_file']).exists():
-                        html_content = read_text_file(Path(item['update_file']))
-                        # Extract notes - handle both networking and regular updates
-                        # Try new structure first (notes-text), then fallback to old structure (notes)
-                        start_pattern = r'<div class="notes-text">'
-                        start_match = re.search(start_pattern, html_content)
-                        if not start_match:
-                            # Fallback: try old networking structure with class="notes"
-                            start_pattern = r'<div class="notes">'
-                            start_match = re.search(start_pattern, html_content)
-                        if start_match:
-                            start_pos = start_match.end()
-                            # Find the matching closing </div> by counting div depth
-                            pos = start_pos
-                            depth = 1
-                            end_pos = None
-                            
-                            while pos < len(html_content):
-                                # Find next <div or </div>
-                                next_div_open = html_content.find('<div', pos)
-                                next_div_close = html_content.find('</div>', pos)
-                                
-                                if next_div_close == -1:
-                                    break
-                                
-                                # Check which comes first
-                                if next_div_open != -1 and next_div_open < next_div_close:
-                                    # Found opening div
-                                    depth += 1
-                                    pos = next_div_open + 4
-                                else:
-                                    # Found closing div
-                                    depth -= 1
-                                    if depth == 0:
-                                        end_pos = next_div_close
-                                        break
-                                    pos = next_div_close + 6
-                            
-                            if end_pos:
-                                notes_text = html_content[start_pos:end_pos].strip()
-                            else:
-                                # Fallback to simple regex
-                                notes_match = re.search(r'<div class="notes-text">(.*?)</div>', html_content, re.DOTALL)
-                                if notes_match:
-                                    notes_text = notes_match.group(1).strip()
-                        else:
-                            # Fallback: try simple pattern
-                            notes_match = re.search(r'<div class="notes-text">(.*?)</div>', html_content, re.DOTALL)
-                            if notes_match:
-                                notes_text = notes_match.group(1).strip()
-                        
-                        # Don't clean up HTML content - preserve images and formatting
-                except Exception as e:
-                    print(f"Warning: Could not extract content from {item['update_file']}: {e}")
+            # Notes HTML comes from the structured update log (see StatusUpdateStore)
+            notes_text = item.get('notes_html') or ""
             
             # Determine tag class for status pill
             status_lower = item['status'].lower()
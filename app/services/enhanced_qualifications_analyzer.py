@@ -4,9 +4,10 @@ Enhanced Qualifications Analyzer - Integrates preliminary matching with AI analy
 """
 
 from app.models.qualification import QualificationAnalysis
+from app.services.ollama_client import get_ollama_client
 from app.services.preliminary_matcher import PreliminaryMatcher
+from app.services.resume_profile import get_resume_profile
 from typing import Dict, Optional
-import requests
 
 class EnhancedQualificationsAnalyzer:
     """Enhanced qualifications analyzer that reduces AI load through preliminary matching"""
@@ -15,38 +16,19 @@ class EnhancedQualificationsAnalyzer:
         self.preliminary_matcher = PreliminaryMatcher()
         self.model = "llama3"
         self.base_url = "http://localhost:11434"
-        self.timeout = 600
+        # Shared, pooled connection to Ollama; its timeouts come from config.yaml's ai: section
+        self.client = get_ollama_client(self.base_url)
         
-        # PERFORMANCE: Pre-compute these sets once at initialization instead of on every match
-        # This avoids expensive nested set comprehensions during validation
-        self._candidate_skills_lower_cache = {skill.lower() for skill in self.preliminary_matcher.candidate_skills.keys()}
+        # PERFORMANCE: Resume-side sets come from the shared resume profile (computed once per resume version)
+        profile = self.preliminary_matcher.resume_profile or get_resume_profile(self.preliminary_matcher)
+        self._candidate_skills_lower_cache = set(profile.candidate_skills_lower)
         self._known_technologies_lower_cache = {tech.lower() for tech in self.preliminary_matcher.tech_extractor.TECHNOLOGIES.keys()}
-        # Pre-compute which candidate skills are technologies (avoids O(n*m) check on every match)
-        self._candidate_technologies_lower_cache = {
-            skill.lower() for skill in self._candidate_skills_lower_cache
-            if skill.lower() in self._known_technologies_lower_cache
-        }
+        # Which candidate skills are technologies (avoids O(n*m) check on every match)
+        self._candidate_technologies_lower_cache = set(profile.candidate_technologies_lower)
     
     def _call_ollama(self, prompt: str) -> str:
         """Make a call to Ollama API"""
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False
-        }
-        
-        try:
-            response = requests.post(
-                f"{self.base_url}/api/generate",
-                json=payload,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            return response.json().get('response', '')
-        except requests.exceptions.Timeout:
-            raise TimeoutError("Ollama request timed out. The model might be taking too long to respond.")
-        except requests.exceptions.RequestException as e:
-            raise RuntimeError(f"Ollama API error: {str(e)}")
+        return self.client.generate(self.model, prompt)
     
     def analyze_qualifications_enhanced(self, job_description: str, resume_content: str) -> QualificationAnalysis:
         """Enhanced qualifications analysis with preliminary matching"""
@@ -0,0 +1,160 @@
+"""Live progress channels for LLM generations, consumed as Server-Sent Events"""
+import json
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+
+# Events kept per channel so a subscriber that connects late still sees the output so far
+REPLAY_BUFFER_SIZE = 5000
+# How long a finished channel is kept around for late subscribers
+FINISHED_CHANNEL_TTL = 300
+# Channels nobody finished or watches (e.g. the request failed early) are dropped after this
+IDLE_CHANNEL_TTL = 3600
+
+
+class _Channel:
+    def __init__(self):
+        self.events = deque(maxlen=REPLAY_BUFFER_SIZE)
+        self.subscribers = []
+        self.listeners = []
+        self.finished_at: Optional[float] = None
+        self.touched_at = time.monotonic()
+
+
+_channels: Dict[str, _Channel] = {}
+_channels_lock = threading.Lock()
+
+# (channel id, stage) of the generation currently running in this context
+_current: ContextVar = ContextVar('generation_stream', default=None)
+
+
+def _get_channel(channel_id: str) -> _Channel:
+    """Return (creating if needed) a channel; caller must hold _channels_lock"""
+    now = time.monotonic()
+    for stale_id in [cid for cid, ch in _channels.items() if _is_stale(ch, now)]:
+        del _channels[stale_id]
+    channel = _channels.get(channel_id)
+    if channel is None:
+        channel = _Channel()
+        _channels[channel_id] = channel
+    channel.touched_at = now
+    return channel
+
+
+def _is_stale(channel: _Channel, now: float) -> bool:
+    if channel.finished_at is not None:
+        return now - channel.finished_at > FINISHED_CHANNEL_TTL
+    return not channel.subscribers and not channel.listeners and now - channel.touched_at > IDLE_CHANNEL_TTL
+
+
+def publish(channel_id: str, event: Dict) -> None:
+    """Send an event to everyone watching a channel"""
+    with _channels_lock:
+        channel = _get_channel(channel_id)
+        channel.events.append(event)
+        for subscriber in channel.subscribers:
+            subscriber.put(event)
+        listeners = list(channel.listeners)
+    for listener in listeners:
+        try:
+            listener(event)
+        except Exception as e:
+            print(f"Warning: generation stream listener failed: {e}")
+
+
+def listen(channel_id: str, callback: Callable[[Dict], None]) -> Callable[[], None]:
+    """Call callback (in the publishing thread) for every event on a channel; returns an unsubscribe function"""
+    with _channels_lock:
+        channel = _get_channel(channel_id)
+        channel.listeners.append(callback)
+
+    def stop() -> None:
+        with _channels_lock:
+            if callback in channel.listeners:
+                channel.listeners.remove(callback)
+    return stop
+
+
+def finish(channel_id: Optional[str], error: Optional[str] = None, **result) -> None:
+    """Mark a channel as done (or failed) so subscribers can disconnect"""
+    if not channel_id:
+        return
+    if error:
+        publish(channel_id, {'type': 'error', 'error': error})
+    publish(channel_id, {'type': 'done', **result})
+    with _channels_lock:
+        _get_channel(channel_id).finished_at = time.monotonic()
+
+
+def current_stream() -> Optional[Tuple[str, str]]:
+    """Return (channel id, stage) if generations in this context should stream"""
+    return _current.get()
+
+
+def publish_token(text: str) -> None:
+    """Publish a chunk of generated text for the current stage (no-op outside a stream)"""
+    stream = _current.get()
+    if stream is not None and text:
+        publish(stream[0], {'type': 'token', 'stage': stream[1], 'text': text})
+
+
+@contextmanager
+def stream_stage(channel_id: Optional[str], stage: str):
+    """
+    Stream every Ollama generation made inside the block to channel_id,
+    labelled with stage. A no-op when channel_id is None.
+    """
+    if not channel_id:
+        yield
+        return
+    publish(channel_id, {'type': 'stage', 'stage': stage, 'status': 'started'})
+    token = _current.set((channel_id, stage))
+    try:
+        yield
+    except Exception as e:
+        publish(channel_id, {'type': 'stage', 'stage': stage, 'status': 'failed', 'error': str(e)})
+        raise
+    finally:
+        _current.reset(token)
+    publish(channel_id, {'type': 'stage', 'stage': stage, 'status': 'finished'})
+
+
+def sse_events(channel_id: str, heartbeat: float = 15) -> Iterator[str]:
+    """
+    Yield Server-Sent Event frames for a channel: everything published so far,
+    then live events until the channel finishes. Comment frames are sent as
+    heartbeats so proxies keep the connection open.
+    """
+    subscriber = queue.Queue()
+    with _channels_lock:
+        channel = _get_channel(channel_id)
+        backlog = list(channel.events)
+        channel.subscribers.append(subscriber)
+
+    try:
+        for event in backlog:
+            yield _format_sse(event)
+            if event['type'] == 'done':
+                return
+        while True:
+            try:
+                event = subscriber.get(timeout=heartbeat)
+            except queue.Empty:
+                yield ': keep-alive\n\n'
+                continue
+            yield _format_sse(event)
+            if event['type'] == 'done':
+                return
+    finally:
+        with _channels_lock:
+            if subscriber in channel.subscribers:
+                channel.subscribers.remove(subscriber)
+
+
+def _format_sse(event: Dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
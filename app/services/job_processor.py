@@ -1,7 +1,8 @@
 """Job processing service"""
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
+import contextvars
 import shutil
 from app.models.application import Application
 from app.utils.file_utils import (
@@ -11,6 +12,10 @@ from app.utils.file_utils import (
 from app.utils.datetime_utils import get_est_now, format_datetime_for_filename
 from app.services.ai_analyzer import AIAnalyzer
 from app.services.activity_log_service import ActivityLogService
+from app.services.application_repository import get_application_repository
+from app.services.search_index import get_search_index
+from app.services.status_update_store import StatusUpdateStore
+from app.utils.data_generation import bump_generation
 
 
 class JobProcessor:
@@ -21,6 +26,17 @@ class JobProcessor:
         ensure_dir_exists(self.applications_dir)
         self.ai_analyzer = AIAnalyzer()
         self.activity_log = ActivityLogService()
+        # Shared, stat-validated caches of parsed application.yaml files
+        config_dir = get_data_path('config')
+        self.repository = get_application_repository(
+            self.applications_dir,
+            index_path=config_dir / 'application_id_index.json'
+        )
+        self.archived_repository = get_application_repository(
+            get_data_path('applications_archived'),
+            label="archived application",
+            index_path=config_dir / 'archived_application_id_index.json'
+        )
     
     def _clean_job_description(self, job_description: str) -> str:
         """Remove LinkedIn metadata and clutter from job descriptions"""
@@ -100,6 +116,27 @@ class JobProcessor:
         
         return cleaned
 
+    def _claim_application_folder(self, folder_name: str) -> Path:
+        """
+        Create and return an unused application folder: folder_name, or
+        folder_name-2, -3, ... when taken (also by an archived application).
+        mkdir is atomic, so concurrent creations never share a folder.
+        """
+        ensure_dir_exists(self.applications_dir)
+        archived_dir = get_data_path('applications_archived')
+        suffix = 1
+        while True:
+            candidate = folder_name if suffix == 1 else f"{folder_name}-{suffix}"
+            suffix += 1
+            if (archived_dir / candidate).exists():
+                continue
+            folder_path = self.applications_dir / candidate
+            try:
+                folder_path.mkdir()
+                return folder_path
+            except FileExistsError:
+                continue
+
     def create_job_application(
         self,
         company: str,
@@ -129,11 +166,13 @@ class JobProcessor:
             status_updated_at=get_est_now()
         )
         
-        # Create application folder
+        # Create application folder (a new one, even if another posting has the same company and title)
         folder_name = application.get_folder_name()
-        folder_path = self.applications_dir / folder_name
-        ensure_dir_exists(folder_path)
+        folder_path = self._claim_application_folder(folder_name)
         application.folder_path = folder_path
+        if folder_path.name != folder_name:
+            # Same suffix on the id, which is otherwise only unique to the second
+            application.id = f"{app_id}{folder_path.name[len(folder_name):]}"
         
         # Create updates subfolder
         updates_dir = folder_path / "updates"
@@ -180,8 +219,10 @@ class JobProcessor:
         }
         
         with ThreadPoolExecutor(max_workers=2) as executor:
-            comprehensive_future = executor.submit(extract_comprehensive)
-            details_future = executor.submit(extract_details)
+            # Each job runs in a copy of this context, so the caller's generation
+            # stream stage and LLM cache bypass carry over into the worker threads
+            comprehensive_future = executor.submit(contextvars.copy_context().run, extract_comprehensive)
+            details_future = executor.submit(contextvars.copy_context().run, extract_details)
             
             # Wait for both to complete
             structured_job_description = comprehensive_future.result()
@@ -205,6 +246,7 @@ class JobProcessor:
         
         # Save application metadata
         self._save_application_metadata(application)
+        self.repository.remember(application.id, folder_path)
         
         # Log activity
         try:
@@ -226,66 +268,53 @@ class JobProcessor:
         metadata_path = application.folder_path / "application.yaml"
         metadata = application.to_dict()
         save_yaml(metadata, metadata_path)
+        self.repository.invalidate(application.folder_path)
+        self.archived_repository.invalidate(application.folder_path)
+        bump_generation()
+        get_search_index().index_application(application)
+    
+    def save_applications_metadata(self, applications: List[Application]) -> None:
+        """Save many applications' metadata, invalidating cached views once for the whole batch"""
+        for application in applications:
+            save_yaml(application.to_dict(), application.folder_path / "application.yaml")
+            self.repository.invalidate(application.folder_path)
+            self.archived_repository.invalidate(application.folder_path)
+        if applications:
+            bump_generation()
+        for application in applications:
+            get_search_index().index_application(application)
     
     def list_all_applications(self) -> List[Application]:
         """List all job applications"""
-        applications = []
-        
-        if not self.applications_dir.exists():
-            return applications
-        
-        for folder_path in self.applications_dir.iterdir():
-            if folder_path.is_dir():
-                metadata_path = folder_path / "application.yaml"
-                if metadata_path.exists():
-                    try:
-                        metadata = load_yaml(metadata_path)
-                        metadata['folder_path'] = str(folder_path)
-                        application = Application.from_dict(metadata)
-                        # Calculate and set contact count
-                        application.contact_count = application.calculate_contact_count()
-                        applications.append(application)
-                    except Exception as e:
-                        print(f"Error loading application from {folder_path}: {e}")
-        
-        # Sort by created_at descending
-        applications.sort(key=lambda x: x.created_at, reverse=True)
-        return applications
+        return self.repository.list_all()
     
     def list_archived_applications(self) -> List[Application]:
         """List all archived job applications"""
-        applications = []
-        archived_dir = get_data_path('applications_archived')
-        
-        if not archived_dir.exists():
-            return applications
-        
-        for folder_path in archived_dir.iterdir():
-            if folder_path.is_dir():
-                metadata_path = folder_path / "application.yaml"
-                if metadata_path.exists():
-                    try:
-                        metadata = load_yaml(metadata_path)
-                        metadata['folder_path'] = str(folder_path)
-                        application = Application.from_dict(metadata)
-                        # Calculate and set contact count
-                        application.contact_count = application.calculate_contact_count()
-                        applications.append(application)
-                    except Exception as e:
-                        print(f"Error loading archived application from {folder_path}: {e}")
-        
-        # Sort by created_at descending
-        applications.sort(key=lambda x: x.created_at, reverse=True)
-        return applications
+        return self.archived_repository.list_all()
+    
+    def list_applications_page(self, **kwargs) -> Tuple[List[Application], Optional[tuple]]:
+        """One page of active applications (see ApplicationRepository.page)"""
+        return self.repository.page(**kwargs)
+    
+    def find_applications_by_company(self, company: str) -> List[Application]:
+        """List active applications for a company (case-insensitive match)"""
+        return self.repository.find_by_company(company)
+    
+    def delete_application(self, application: Application) -> None:
+        """Delete an application folder and drop it from the indexes"""
+        if application.folder_path and application.folder_path.exists():
+            shutil.rmtree(application.folder_path)
+        self.repository.forget(application.id)
+        self.archived_repository.forget(application.id)
+        bump_generation()
+        get_search_index().remove('application', application.id)
+        if (application.status or '').lower() == 'rejected':
+            from app.services.dashboard_generator import invalidate_archived_dashboard
+            invalidate_archived_dashboard()
     
     def get_application_by_id(self, app_id: str) -> Optional[Application]:
         """Get an application by ID"""
-        applications = self.list_all_applications()
-        application = next((app for app in applications if app.id == app_id), None)
-        if application:
-            # Ensure contact count is calculated
-            application.contact_count = application.calculate_contact_count()
-        return application
+        return self.repository.get(app_id)
     
     def update_application_status(
         self,
@@ -554,6 +583,7 @@ class JobProcessor:
 </html>"""
         
         write_text_file(html_content, status_path)
+        StatusUpdateStore(application.folder_path).append(status_path, timestamp, status, notes)
         
         # Recalculate contact count after status update
         application.contact_count = application.calculate_contact_count()
@@ -575,6 +605,11 @@ class JobProcessor:
         except Exception as e:
             print(f"Warning: Could not log status change activity: {e}")
         
+        # Rejected applications (and ones moved back out of rejected) change the archived dashboard
+        if status.lower() == 'rejected' or (old_status or '').lower() == 'rejected':
+            from app.services.dashboard_generator import invalidate_archived_dashboard
+            invalidate_archived_dashboard()
+        
         # Regenerate summary to include the new update
         self._regenerate_summary(application)
     
@@ -700,6 +735,11 @@ class JobProcessor:
 </body>
 </html>"""
         write_text_file(html_content, update_path)
+        StatusUpdateStore(application.folder_path).append(
+            update_path, timestamp, status, notes, type='networking', contact_name=contact_name
+        )
+        bump_generation()
+        get_search_index().index_application(application)
     
     def get_application_updates(self, application: Application) -> List[dict]:
         """Get all status updates for an application, including networking contact updates"""
@@ -708,55 +748,58 @@ class JobProcessor:
         
         # Get updates from application's updates folder
         if updates_dir.exists():
-            for update_file in sorted(updates_dir.iterdir()):
-                if update_file.is_file() and update_file.suffix == '.html':
-                    # Extract timestamp and status from filename
-                    # Format: YYYYMMDDHHMMSS-Status.html or YYYYMMDDHHMMSS-networking-ContactName-Status.html
-                    filename_parts = update_file.stem.split('-', 1)
-                    if len(filename_parts) == 2:
-                        timestamp_str = filename_parts[0]
-                        rest = filename_parts[1]
-                        
-                        # Check if this is a networking update
-                        if rest.startswith('networking-'):
-                            # Format: networking-ContactName-Status
-                            networking_parts = rest.split('-', 2)
-                            if len(networking_parts) >= 3:
-                                contact_name = networking_parts[1]
-                                status = '-'.join(networking_parts[2:])  # Status may contain dashes
-                                update_type = 'networking'
-                            else:
-                                status = rest
-                                contact_name = None
-                                update_type = 'networking'
+            # One read of the structured update log (no per-page HTML parsing)
+            for record in StatusUpdateStore(application.folder_path).records():
+                update_file = updates_dir / record['file']
+                # Extract timestamp and status from filename
+                # Format: YYYYMMDDHHMMSS-Status.html or YYYYMMDDHHMMSS-networking-ContactName-Status.html
+                filename_parts = update_file.stem.split('-', 1)
+                if len(filename_parts) == 2:
+                    timestamp_str = filename_parts[0]
+                    rest = filename_parts[1]
+                    
+                    # Check if this is a networking update
+                    if rest.startswith('networking-'):
+                        # Format: networking-ContactName-Status
+                        networking_parts = rest.split('-', 2)
+                        if len(networking_parts) >= 3:
+                            contact_name = networking_parts[1]
+                            status = '-'.join(networking_parts[2:])  # Status may contain dashes
+                            update_type = 'networking'
                         else:
-                            # Regular application update
                             status = rest
                             contact_name = None
-                            update_type = 'application'
-                        
-                        # Format timestamp for display
-                        try:
-                            # Convert filename timestamp to datetime
-                            from datetime import datetime
-                            dt = datetime.strptime(timestamp_str, '%Y%m%d%H%M%S')
-                            display_timestamp = dt.strftime('%B %d, %Y %I:%M %p EST')
-                        except:
-                            display_timestamp = timestamp_str
-                        
-                        update_entry = {
-                            'timestamp': timestamp_str,
-                            'display_timestamp': display_timestamp,
-                            'status': status,
-                            'file': str(update_file),
-                            'relative_url': f"/applications/{application.folder_path.name}/updates/{update_file.name}",
-                            'type': update_type
-                        }
-                        
-                        if contact_name:
-                            update_entry['contact_name'] = contact_name
-                        
-                        updates.append(update_entry)
+                            update_type = 'networking'
+                    else:
+                        # Regular application update
+                        status = rest
+                        contact_name = None
+                        update_type = 'application'
+                    
+                    # Format timestamp for display
+                    try:
+                        # Convert filename timestamp to datetime
+                        from datetime import datetime
+                        dt = datetime.strptime(timestamp_str, '%Y%m%d%H%M%S')
+                        display_timestamp = dt.strftime('%B %d, %Y %I:%M %p EST')
+                    except:
+                        display_timestamp = timestamp_str
+                    
+                    update_entry = {
+                        'timestamp': timestamp_str,
+                        'display_timestamp': display_timestamp,
+                        'status': status,
+                        'file': str(update_file),
+                        'relative_url': f"/applications/{application.folder_path.name}/updates/{update_file.name}",
+                        'type': update_type,
+                        'notes_html': record.get('notes_html'),
+                        'notes_text': record.get('notes_text')
+                    }
+                    
+                    if contact_name:
+                        update_entry['contact_name'] = contact_name
+                    
+                    updates.append(update_entry)
         
         # Also get updates from matching networking contacts
         # But skip duplicates that are already in the application's updates folder
@@ -802,44 +845,46 @@ class JobProcessor:
                                 # Get updates from this contact's updates folder
                                 contact_updates_dir = contact_folder / 'updates'
                                 if contact_updates_dir.exists():
-                                    for update_file in sorted(contact_updates_dir.iterdir()):
-                                        if update_file.is_file() and update_file.suffix == '.html':
-                                            # Parse networking contact update file
-                                            # Format: YYYYMMDDHHMMSS-Status.html
-                                            filename_parts = update_file.stem.split('-', 1)
-                                            if len(filename_parts) == 2:
-                                                timestamp_str = filename_parts[0]
-                                                status = filename_parts[1].replace('-', ' ')
-                                                
-                                                # Check if this update is already represented in application's updates folder
-                                                # (i.e., there's a networking-ContactName-Status entry with same timestamp)
-                                                # Normalize status for comparison (lowercase, strip)
-                                                status_normalized = status.lower().strip()
-                                                update_key = (timestamp_str, contact_name, status_normalized)
-                                                if update_key in existing_networking_updates:
-                                                    # Skip this duplicate - it's already in the application's updates folder
-                                                    continue
-                                                
-                                                # Format timestamp for display
-                                                try:
-                                                    from datetime import datetime
-                                                    dt = datetime.strptime(timestamp_str, '%Y%m%d%H%M%S')
-                                                    display_timestamp = dt.strftime('%B %d, %Y %I:%M %p EST')
-                                                except:
-                                                    display_timestamp = timestamp_str
-                                                
-                                                # Create update entry for networking contact update
-                                                update_entry = {
-                                                    'timestamp': timestamp_str,
-                                                    'display_timestamp': display_timestamp,
-                                                    'status': status,
-                                                    'file': str(update_file),
-                                                    'relative_url': f"/networking/{contact_folder.name}/updates/{update_file.name}",
-                                                    'type': 'networking',
-                                                    'contact_name': contact_name
-                                                }
-                                                
-                                                updates.append(update_entry)
+                                    for record in StatusUpdateStore(contact_folder).records():
+                                        update_file = contact_updates_dir / record['file']
+                                        # Parse networking contact update file
+                                        # Format: YYYYMMDDHHMMSS-Status.html
+                                        filename_parts = update_file.stem.split('-', 1)
+                                        if len(filename_parts) == 2:
+                                            timestamp_str = filename_parts[0]
+                                            status = filename_parts[1].replace('-', ' ')
+                                            
+                                            # Check if this update is already represented in application's updates folder
+                                            # (i.e., there's a networking-ContactName-Status entry with same timestamp)
+                                            # Normalize status for comparison (lowercase, strip)
+                                            status_normalized = status.lower().strip()
+                                            update_key = (timestamp_str, contact_name, status_normalized)
+                                            if update_key in existing_networking_updates:
+                                                # Skip this duplicate - it's already in the application's updates folder
+                                                continue
+                                            
+                                            # Format timestamp for display
+                                            try:
+                                                from datetime import datetime
+                                                dt = datetime.strptime(timestamp_str, '%Y%m%d%H%M%S')
+                                                display_timestamp = dt.strftime('%B %d, %Y %I:%M %p EST')
+                                            except:
+                                                display_timestamp = timestamp_str
+                                            
+                                            # Create update entry for networking contact update
+                                            update_entry = {
+                                                'timestamp': timestamp_str,
+                                                'display_timestamp': display_timestamp,
+                                                'status': status,
+                                                'file': str(update_file),
+                                                'relative_url': f"/networking/{contact_folder.name}/updates/{update_file.name}",
+                                                'type': 'networking',
+                                                'contact_name': contact_name,
+                                                'notes_html': record.get('notes_html'),
+                                                'notes_text': record.get('notes_text')
+                                            }
+                                            
+                                            updates.append(update_entry)
                     except Exception as e:
                         # Skip contacts that can't be loaded
                         continue
@@ -1107,6 +1152,11 @@ class JobProcessor:
             
             # Save updated metadata with new paths
             self._save_application_metadata(application)
+            self.repository.forget(application.id)
+            self.archived_repository.remember(application.id, target_path)
+            
+            from app.services.dashboard_generator import invalidate_archived_dashboard
+            invalidate_archived_dashboard()
             
             print(f"  ✓ Application archived to: {target_path}")
         except Exception as e:
@@ -0,0 +1,291 @@
+"""Persistent background job queue (SQLite) with a worker thread pool"""
+import json
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from app.services.generation_stream import finish as finish_stream, listen
+from app.utils.file_utils import ensure_dir_exists, get_data_path, get_project_root, load_yaml
+from app.utils.sqlite_utils import ClosingConnection, connect
+
+
+# A running job whose worker has not sent a heartbeat for this long is
+# considered interrupted (process killed or restarted) and is picked up again.
+LEASE_SECONDS = 60
+HEARTBEAT_SECONDS = 15
+MAX_ATTEMPTS = 3
+
+
+class JobContext:
+    """What a job handler sees: its payload, resumable state and stage reporting"""
+
+    def __init__(self, queue: 'JobQueue', job: Dict):
+        self.queue = queue
+        self.id = job['id']
+        self.kind = job['kind']
+        self.payload = job['payload']
+        self.state = job['state']
+        self.attempts = job['attempts']
+
+    @property
+    def resumed(self) -> bool:
+        """True when an earlier attempt of this job was interrupted"""
+        return self.attempts > 1
+
+    def update_state(self, **values) -> None:
+        """Persist values a later attempt needs to resume (e.g. the created application id)"""
+        self.state.update(values)
+        self.queue._update(self.id, state=json.dumps(self.state))
+
+
+class JobQueue:
+    """
+    Jobs are rows in a SQLite database, so they survive restarts. Handlers
+    are registered per job kind and run on a small pool of worker threads.
+
+    Each job publishes to the generation_stream channel named after its id:
+    stage events raised while it runs (generation_stream.stream_stage) are
+    recorded as the job's stage progress, LLM output can be watched live at
+    /api/generation-stream/<job id>, and a final 'done' event is sent when
+    the job succeeds or fails.
+
+    Jobs interrupted by a restart are re-run; handlers use JobContext.state
+    to skip work that already completed, and the LLM response cache makes
+    repeated generations instant.
+    """
+
+    def __init__(self, db_path: Path, workers: int = 2):
+        self.db_path = Path(db_path)
+        self.workers = workers
+        self._handlers: Dict[str, Callable[[JobContext], Optional[Dict]]] = {}
+        self._wakeup = threading.Condition()
+        self._running: set = set()
+        self._running_lock = threading.Lock()
+        self._started = False
+        self._start_lock = threading.Lock()
+        ensure_dir_exists(self.db_path.parent)
+        self._init_db()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def register(self, kind: str, handler: Callable[[JobContext], Optional[Dict]]) -> None:
+        """Register the function that runs jobs of a kind; its return value is the job result"""
+        self._handlers[kind] = handler
+
+    def enqueue(self, kind: str, payload: Dict) -> str:
+        """Queue a job and return its id (workers are started if needed)"""
+        if kind not in self._handlers:
+            raise ValueError(f"No handler registered for job kind '{kind}'")
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, payload, status, created_at, updated_at) VALUES (?, ?, ?, 'queued', ?, ?)",
+                (job_id, kind, json.dumps(payload), now, now)
+            )
+        self.start()
+        with self._wakeup:
+            self._wakeup.notify()
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Return a job as a dict, or None"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list_jobs(self, limit: int = 50) -> List[Dict]:
+        """Return the most recent jobs, newest first"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def start(self) -> None:
+        """Start the worker threads (idempotent)"""
+        with self._start_lock:
+            if self._started:
+                return
+            self._started = True
+        for i in range(self.workers):
+            threading.Thread(target=self._worker_loop, name=f"job-worker-{i}", daemon=True).start()
+        threading.Thread(target=self._heartbeat_loop, name="job-heartbeat", daemon=True).start()
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def _worker_loop(self) -> None:
+        while True:
+            job = self._claim()
+            if job is None:
+                with self._wakeup:
+                    self._wakeup.wait(timeout=HEARTBEAT_SECONDS)
+                continue
+            self._run(job)
+
+    def _heartbeat_loop(self) -> None:
+        while True:
+            time.sleep(HEARTBEAT_SECONDS)
+            with self._running_lock:
+                running = list(self._running)
+            if running:
+                with self._connect() as conn:
+                    conn.executemany(
+                        "UPDATE jobs SET heartbeat_at = ? WHERE id = ? AND status = 'running'",
+                        [(time.time(), job_id) for job_id in running]
+                    )
+
+    def _claim(self) -> Optional[Dict]:
+        """Atomically take the oldest queued (or abandoned running) job of a registered kind"""
+        now = time.time()
+        kinds = list(self._handlers)
+        if not kinds:
+            return None
+        placeholders = ','.join('?' * len(kinds))
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            while True:
+                row = conn.execute(
+                    f"""SELECT * FROM jobs
+                        WHERE kind IN ({placeholders})
+                          AND (status = 'queued' OR (status = 'running' AND heartbeat_at < ?))
+                        ORDER BY created_at LIMIT 1""",
+                    (*kinds, now - LEASE_SECONDS)
+                ).fetchone()
+                if row is None:
+                    return None
+                if row['attempts'] < MAX_ATTEMPTS:
+                    break
+                # Keeps getting interrupted (e.g. crashes the process) - stop retrying it
+                conn.execute(
+                    "UPDATE jobs SET status = 'failed', error = ?, updated_at = ? WHERE id = ?",
+                    (row['error'] or f"Gave up after {row['attempts']} interrupted attempts", now, row['id'])
+                )
+            conn.execute(
+                """UPDATE jobs SET status = 'running', attempts = attempts + 1,
+                   heartbeat_at = ?, updated_at = ? WHERE id = ?""",
+                (now, now, row['id'])
+            )
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (row['id'],)).fetchone()
+        return self._to_dict(row)
+
+    def _run(self, job: Dict) -> None:
+        context = JobContext(self, job)
+        handler = self._handlers[job['kind']]
+        with self._running_lock:
+            self._running.add(job['id'])
+        stop_listening = listen(job['id'], lambda event: self._record_stage(job['id'], event))
+        try:
+            result = handler(context) or {}
+        except Exception as e:
+            traceback.print_exc()
+            self._update(job['id'], status='failed', error=str(e), stage=None)
+            finish_stream(job['id'], error=str(e), job_id=job['id'], status='failed')
+        else:
+            self._update(job['id'], status='succeeded', result=json.dumps(result, default=str), error=None, stage=None)
+            finish_stream(job['id'], job_id=job['id'], status='succeeded')
+        finally:
+            stop_listening()
+            with self._running_lock:
+                self._running.discard(job['id'])
+
+    def _record_stage(self, job_id: str, event: Dict) -> None:
+        """Record generation_stream 'stage' events as the job's stage progress"""
+        if event.get('type') != 'stage':
+            return
+        stage, status = event['stage'], event['status']
+        # Stages of one job can run in parallel threads: read and write the
+        # stages in one write transaction so no thread's update is lost
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT stages, attempts FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return
+            stages = json.loads(row['stages'] or '[]')
+            now = time.time()
+            if status == 'started':
+                stages.append({'stage': stage, 'status': 'running', 'started_at': now, 'attempt': row['attempts']})
+            else:
+                for entry in reversed(stages):
+                    if entry['stage'] == stage and entry['status'] == 'running':
+                        entry['status'] = status
+                        entry['finished_at'] = now
+                        entry['duration_seconds'] = round(now - entry['started_at'], 3)
+                        if event.get('error'):
+                            entry['error'] = event['error']
+                        break
+            # The current stage is the latest one still running
+            current = next((entry['stage'] for entry in reversed(stages) if entry['status'] == 'running'), None)
+            conn.execute(
+                "UPDATE jobs SET stages = ?, stage = ?, updated_at = ? WHERE id = ?",
+                (json.dumps(stages), current, now, job_id)
+            )
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> ClosingConnection:
+        return connect(self.db_path)
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    state TEXT NOT NULL DEFAULT '{}',
+                    status TEXT NOT NULL,
+                    stage TEXT,
+                    stages TEXT NOT NULL DEFAULT '[]',
+                    result TEXT,
+                    error TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    heartbeat_at REAL
+                )"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at)")
+
+    def _update(self, job_id: str, **columns) -> None:
+        columns['updated_at'] = time.time()
+        assignments = ', '.join(f"{name} = ?" for name in columns)
+        with self._connect() as conn:
+            conn.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*columns.values(), job_id))
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict:
+        job = dict(row)
+        job['payload'] = json.loads(job['payload'])
+        job['state'] = json.loads(job['state'] or '{}')
+        job['stages'] = json.loads(job['stages'] or '[]')
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        return job
+
+
+_queue: Optional[JobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue(workers: Optional[int] = None) -> JobQueue:
+    """Return the process-wide job queue (data/output/jobs.sqlite3), sized from config.yaml's jobs: section"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            if workers is None:
+                try:
+                    config = load_yaml(get_project_root() / 'config' / 'config.yaml').get('jobs') or {}
+                except Exception:
+                    config = {}
+                workers = int(config.get('workers', 2))
+            _queue = JobQueue(get_data_path('output') / 'jobs.sqlite3', workers=workers)
+        return _queue
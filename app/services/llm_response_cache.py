@@ -0,0 +1,178 @@
+"""Content-addressed on-disk cache of Ollama generations"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Optional
+
+from app.utils.file_utils import ensure_dir_exists, get_data_path
+
+
+_bypass: ContextVar = ContextVar('llm_cache_bypass', default=False)
+
+
+@contextmanager
+def bypass_llm_cache():
+    """
+    Force fresh generations for everything run inside the block (including
+    work submitted to threads via contextvars.copy_context().run). Fresh responses still replace the
+    cached ones.
+    """
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def llm_cache_bypassed() -> bool:
+    return _bypass.get()
+
+
+class LLMResponseCache:
+    """
+    Stores generation responses on disk, keyed by a SHA-256 of the model,
+    system prompt, prompt and generation options - identical requests
+    (regenerating documents for an unchanged job description and resume,
+    resuming an interrupted pipeline) are answered without calling the model.
+
+    Entries live in <cache_dir>/<key[:2]>/<key>.json. A hit refreshes the
+    entry's mtime, and once the cache grows past max_bytes the least
+    recently used entries are removed.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 200 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(model: str, prompt: str, system: Optional[str] = None, options: Optional[Dict] = None) -> str:
+        material = json.dumps(
+            {'model': model, 'system': system or '', 'prompt': prompt, 'options': options or {}},
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None"""
+        path = self._path(key)
+        try:
+            with path.open('r', encoding='utf-8') as f:
+                response = json.load(f)['response']
+            os.utime(path)  # Mark as recently used for LRU eviction
+        except (OSError, ValueError, KeyError, TypeError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return response
+
+    def put(self, key: str, response: str, model: str) -> None:
+        """Store a response (atomically) and evict old entries if over budget"""
+        path = self._path(key)
+        data = json.dumps({'model': model, 'created_at': time.time(), 'response': response}, ensure_ascii=False)
+        tmp_path = None
+        try:
+            ensure_dir_exists(path.parent)
+            try:
+                previous_size = path.stat().st_size
+            except OSError:
+                previous_size = 0
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            tmp_path = None
+            size = path.stat().st_size
+        except OSError as e:
+            print(f"Warning: Could not write LLM response cache entry: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return
+
+        with self._lock:
+            self.writes += 1
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += size - previous_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'writes': self.writes,
+                'evictions': self.evictions,
+                'bytes': self._total_bytes,
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _entries(self):
+        if not self.cache_dir.exists():
+            return []
+        entries = []
+        for path in self.cache_dir.glob('*/*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache is at 90% of its budget"""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+        self._total_bytes = total
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache(max_bytes: Optional[int] = None) -> LLMResponseCache:
+    """Return the process-wide LLM response cache (data/output/llm_cache)"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMResponseCache(get_data_path('output') / 'llm_cache')
+        if max_bytes is not None:
+            _cache.max_bytes = max_bytes
+        return _cache
@@ -0,0 +1,201 @@
+"""Batch re-scoring of stored applications with the deterministic preliminary matcher"""
+import hashlib
+import json
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from app.services.resume_profile import get_resume_profile
+from app.utils.file_utils import ensure_dir_exists, get_data_path, get_project_root, load_yaml, read_text_file
+
+
+# Per application: hash of the inputs its stored score was last computed from
+RESCORE_STATE_FILENAME = 'rescore_state.json'
+
+# The matcher each pool process builds once and reuses for every description
+_worker_matcher = None
+
+
+def _init_worker() -> None:
+    global _worker_matcher
+    from app.services.preliminary_matcher import PreliminaryMatcher
+    _worker_matcher = PreliminaryMatcher()
+
+
+def _analyze(job_description: str) -> Dict:
+    return _worker_matcher.generate_preliminary_analysis(job_description)
+
+
+def _write_json_atomic(path: Path, data, **dump_kwargs) -> None:
+    """Write JSON via a temp file + rename, so path is never left half-written; raises on failure"""
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, **dump_kwargs)
+        os.replace(tmp_path, path)
+        tmp_path = None
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+class MatchRescorer:
+    """
+    Recomputes every application's preliminary match (no LLM calls) after
+    the resume, skills.yaml or the skill taxonomy changed.
+
+    An application is skipped when the hash of its job description plus the
+    resume profile (see resume_profile) and job_engine_v2.yaml is the one
+    its current score was computed from. The rest are scored in a process
+    pool (jobs.rescore_workers in config.yaml, default: one per core), and
+    all new scores are written in one batch at the end: application.yaml's
+    match_score and the Qualifications JSON's match_score and
+    preliminary_analysis, which later status updates read the score from.
+    """
+
+    def __init__(self, job_processor, workers: Optional[int] = None):
+        self.job_processor = job_processor
+        if workers is None:
+            try:
+                config = load_yaml(get_project_root() / 'config' / 'config.yaml').get('jobs') or {}
+            except Exception:
+                config = {}
+            workers = int(config.get('rescore_workers') or os.cpu_count() or 1)
+        self.workers = max(1, workers)
+        self.state_path = get_data_path('output') / RESCORE_STATE_FILENAME
+
+    def rescore(
+        self,
+        include_archived: bool = False,
+        force: bool = False,
+        dry_run: bool = False,
+        on_progress: Optional[Callable[[Dict], None]] = None
+    ) -> Dict:
+        """
+        Re-score applications and return a summary with per-application
+        old and new scores. force ignores the stored hashes; dry_run scores
+        but writes nothing.
+        """
+        applications = self.job_processor.list_all_applications()
+        if include_archived:
+            applications += self.job_processor.list_archived_applications()
+
+        state = self._load_state()
+        fingerprint = self._inputs_fingerprint()
+        summary = {'total': len(applications), 'unchanged': 0, 'skipped': 0, 'rescored': 0, 'changed': 0, 'items': []}
+        todo = []
+        for application in applications:
+            path = application.job_description_path
+            if not path or not Path(path).exists():
+                summary['skipped'] += 1
+                continue
+            job_description = read_text_file(path)
+            input_hash = hashlib.sha256(f"{fingerprint}\n{job_description}".encode('utf-8')).hexdigest()
+            if not force and state.get(application.id) == input_hash:
+                summary['unchanged'] += 1
+                continue
+            todo.append((application, job_description, input_hash))
+
+        analyses = self._analyze_all([job_description for _, job_description, _ in todo], on_progress)
+
+        updated = []
+        for (application, _, input_hash), analysis in zip(todo, analyses):
+            new_score = float(analysis.get('preliminary_match_score') or 0.0)
+            old_score = application.match_score
+            summary['rescored'] += 1
+            if old_score is None or abs(old_score - new_score) > 1e-9:
+                summary['changed'] += 1
+            summary['items'].append({
+                'application_id': application.id,
+                'company': application.company,
+                'job_title': application.job_title,
+                'old_score': old_score,
+                'new_score': new_score,
+            })
+            application.match_score = new_score
+            updated.append((application, analysis))
+            state[application.id] = input_hash
+
+        if updated and not dry_run:
+            self._write_batch(updated, state)
+        return summary
+
+    def _inputs_fingerprint(self) -> str:
+        """Hash of everything besides the job description that the preliminary score depends on"""
+        digest = hashlib.sha256(get_resume_profile().content_hash.encode('utf-8'))
+        v2_config_path = get_data_path('config') / 'job_engine_v2.yaml'
+        if v2_config_path.exists():
+            digest.update(read_text_file(v2_config_path).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _analyze_all(self, job_descriptions: List[str], on_progress: Optional[Callable[[Dict], None]]) -> List[Dict]:
+        """Preliminary analysis per description (identical descriptions are analyzed once)"""
+        unique = list(dict.fromkeys(job_descriptions))
+        results: Dict[str, Dict] = {}
+
+        def report():
+            if on_progress is not None:
+                on_progress({'done': len(results), 'total': len(unique)})
+
+        report()
+        if len(unique) <= 1 or self.workers == 1:
+            from app.services.preliminary_matcher import PreliminaryMatcher
+            matcher = PreliminaryMatcher()
+            for job_description in unique:
+                results[job_description] = matcher.generate_preliminary_analysis(job_description)
+                report()
+        else:
+            # spawn, not fork: the web process has worker threads that may hold locks
+            context = multiprocessing.get_context('spawn')
+            workers = min(self.workers, len(unique))
+            chunksize = max(1, len(unique) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker) as executor:
+                for job_description, analysis in zip(unique, executor.map(_analyze, unique, chunksize=chunksize)):
+                    results[job_description] = analysis
+                    report()
+        return [results[job_description] for job_description in job_descriptions]
+
+    def _write_batch(self, updated: List, state: Dict[str, str]) -> None:
+        for application, analysis in updated:
+            qualifications_json = self._qualifications_json_path(application)
+            if qualifications_json is None:
+                continue
+            try:
+                with open(qualifications_json, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                data['match_score'] = application.match_score
+                data['preliminary_analysis'] = analysis
+                _write_json_atomic(qualifications_json, data, indent=2, ensure_ascii=False)
+            except (OSError, TypeError, ValueError) as e:
+                print(f"Warning: Could not update {qualifications_json}: {e}")
+        self.job_processor.save_applications_metadata([application for application, _ in updated])
+        self._save_state(state)
+
+    @staticmethod
+    def _qualifications_json_path(application) -> Optional[Path]:
+        if not application.qualifications_path:
+            return None
+        path = Path(application.qualifications_path).with_suffix('.json')
+        return path if path.exists() else None
+
+    def _load_state(self) -> Dict[str, str]:
+        if not self.state_path.exists():
+            return {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable re-score state {self.state_path}: {e}")
+            return {}
+
+    def _save_state(self, state: Dict[str, str]) -> None:
+        """Write the state file atomically (temp file + rename)"""
+        try:
+            ensure_dir_exists(self.state_path.parent)
+            _write_json_atomic(self.state_path, state)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: Could not save re-score state {self.state_path}: {e}")
@@ -245,14 +245,10 @@ NOTE: This is a simple contact. For full AI analysis, match scoring, and additio
             from app.services.job_processor import JobProcessor
             job_processor = JobProcessor()
             
-            # Get all applications
-            all_applications = job_processor.list_all_applications()
-            
-            # Filter by company (case-insensitive)
+            # Get applications for this company (case-insensitive)
             company_apps = [
-                app for app in all_applications
-                if app.company.lower().strip() == contact.company_name.lower().strip()
-                and app.summary_path and app.summary_path.exists()
+                app for app in job_processor.find_applications_by_company(contact.company_name)
+                if app.summary_path and app.summary_path.exists()
             ]
             
             if not company_apps:
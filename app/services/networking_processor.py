@@ -9,6 +9,10 @@ from app.utils.file_utils import (
 )
 from app.utils.datetime_utils import get_est_now, format_datetime_for_filename
 from app.services.activity_log_service import ActivityLogService
+from app.services.search_index import get_search_index
+from app.services.status_update_store import StatusUpdateStore
+from app.utils.data_generation import bump_generation
+from app.utils.id_index import get_id_index
 
 
 class NetworkingProcessor:
@@ -34,6 +38,11 @@ class NetworkingProcessor:
         
         ensure_dir_exists(self.networking_dir)
         self.activity_log = ActivityLogService()
+        self.id_index = get_id_index(
+            self.networking_dir,
+            get_data_path('config') / 'networking_id_index.json',
+            'metadata.yaml'
+        )
         
         # #region agent log
         # Debug logging disabled - .cursor directory has special protections
@@ -156,6 +165,7 @@ class NetworkingProcessor:
         
         # Save metadata
         self._save_contact_metadata(contact)
+        self.id_index.set(contact.id, folder_path)
         
         # Log activity
         try:
@@ -199,10 +209,19 @@ class NetworkingProcessor:
     
     def get_contact_by_id(self, contact_id: str) -> Optional[NetworkingContact]:
         """Get a specific contact by ID"""
-        contacts = self.list_all_contacts()
-        for contact in contacts:
+        for _ in range(2):
+            folder = self.id_index.lookup(contact_id)
+            if folder is None:
+                return None
+            try:
+                contact = NetworkingContact.from_dict(load_yaml(folder / 'metadata.yaml'))
+            except Exception as e:
+                print(f"Warning: Could not load contact from {folder.name}: {e}")
+                return None
             if contact.id == contact_id:
                 return contact
+            # The indexed folder now holds a different contact; rescan once
+            self.id_index.rebuild()
         return None
     
     def update_contact_status(
@@ -360,6 +379,7 @@ class NetworkingProcessor:
 </html>
 """
             write_text_file(html_content, status_path)
+            StatusUpdateStore(contact.folder_path).append(status_path, timestamp, status, notes)
             print(f"✓ Created status update file: {status_path}")
         
         # Invalidate contact count cache (includes badge data) when status changes
@@ -446,6 +466,9 @@ class NetworkingProcessor:
         except Exception as e:
             print(f"Warning: Could not log networking status change activity: {e}")
         
+        # Re-index now that the update file (and its notes) exists
+        get_search_index().index_contact(contact)
+        
         from app.utils.message_logger import log_message
         log_message(33, f"✓ Updated contact status to: {status}")
     
@@ -486,37 +509,17 @@ class NetworkingProcessor:
         if not updates_dir.exists():
             return updates
         
-        for update_file in sorted(updates_dir.iterdir(), reverse=True):
-            if update_file.is_file() and update_file.suffix == '.html':
-                # Parse filename: YYYYMMDDHHMMSS-Status.html
-                filename_parts = update_file.stem.split('-', 1)
-                if len(filename_parts) == 2:
-                    timestamp_str = filename_parts[0]
-                    status = filename_parts[1].replace('-', ' ')
-                    
-                    # Read file content for notes
-                    try:
-                        content = read_text_file(update_file)
-                        # Extract notes if present (improved parsing)
-                        notes = None
-                        if '<div class="notes-text">' in content:
-                            start = content.find('<div class="notes-text">') + len('<div class="notes-text">')
-                            end = content.find('</div>', start)
-                            notes = content[start:end].strip()
-                        elif '<div class="notes">' in content:
-                            # Fallback for old format
-                            start = content.find('<div class="notes">') + len('<div class="notes">')
-                            end = content.find('</div>', start)
-                            notes = content[start:end].strip()
-                        
-                        updates.append({
-                            'timestamp': timestamp_str,
-                            'status': status,
-                            'notes': notes,
-                            'file_path': str(update_file)
-                        })
-                    except Exception as e:
-                        print(f"Warning: Could not read update file {update_file}: {e}")
+        # One read of the structured update log (no per-page HTML parsing)
+        for record in reversed(StatusUpdateStore(contact.folder_path).records()):
+            # Parse filename: YYYYMMDDHHMMSS-Status.html
+            filename_parts = Path(record['file']).stem.split('-', 1)
+            if len(filename_parts) == 2:
+                updates.append({
+                    'timestamp': filename_parts[0],
+                    'status': filename_parts[1].replace('-', ' '),
+                    'notes': record.get('notes_html'),
+                    'file_path': str(updates_dir / record['file'])
+                })
         
         return updates
     
@@ -528,4 +531,6 @@ class NetworkingProcessor:
         metadata_path = contact.folder_path / 'metadata.yaml'
         metadata = contact.to_dict()
         save_yaml(metadata, metadata_path)
+        bump_generation()
+        get_search_index().index_contact(contact)
 
@@ -0,0 +1,234 @@
+"""Shared Ollama HTTP client with pooled keep-alive connections"""
+import json
+import threading
+import time
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.services.generation_stream import current_stream, publish_token
+from app.services.llm_response_cache import LLMResponseCache, get_llm_response_cache, llm_cache_bypassed
+from app.utils.file_utils import get_project_root, load_yaml
+
+
+DEFAULT_BASE_URL = "http://localhost:11434"
+
+OLLAMA_UNAVAILABLE_MESSAGE = (
+    "Cannot connect to Ollama. Please ensure Ollama is running:\n"
+    "  1. Install: brew install ollama\n"
+    "  2. Start: ollama serve\n"
+    "  3. Pull model: ollama pull llama3"
+)
+
+
+def _load_ai_config() -> Dict:
+    """Read the ai: section of config/config.yaml (empty if unavailable)"""
+    try:
+        return load_yaml(get_project_root() / 'config' / 'config.yaml').get('ai') or {}
+    except Exception:
+        return {}
+
+
+class OllamaClient:
+    """
+    One client per Ollama server, shared by every analyzer in the process.
+
+    - A requests.Session with a connection pool keeps TCP connections alive
+      between generations instead of reconnecting for every call.
+    - Connection failures are retried with backoff; a request that reached
+      the server is never retried, so a generation is not run twice.
+    - The /api/tags health check is cached for health_check_ttl seconds, so
+      callers can check availability before every generation for free.
+    - With a response_cache, identical requests are answered from disk
+      (see llm_response_cache; bypass_llm_cache() forces fresh generations).
+    - Inside generation_stream.stream_stage(), generations use Ollama's NDJSON
+      streaming mode and publish each chunk as it arrives; the full text is
+      still returned, so callers do not change.
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        connect_timeout: float = 5,
+        read_timeout: float = 600,
+        retries: int = 2,
+        health_check_ttl: float = 10,
+        pool_size: int = 8,
+        response_cache: Optional[LLMResponseCache] = None
+    ):
+        self.base_url = base_url.rstrip('/')
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.health_check_ttl = health_check_ttl
+        self.pool_size = pool_size
+        self.response_cache = response_cache
+
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=0,
+            status=0,
+            backoff_factor=0.5,
+            allowed_methods=None  # connection errors are safe to retry for POST too
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._health_lock = threading.Lock()
+        self._health: Optional[bool] = None
+        self._health_checked_at = 0.0
+        self._models: List[str] = []
+
+    def is_available(self, max_age: Optional[float] = None) -> bool:
+        """Return whether Ollama answered /api/tags within the last max_age seconds"""
+        if max_age is None:
+            max_age = self.health_check_ttl
+        with self._health_lock:
+            if self._health is not None and time.monotonic() - self._health_checked_at < max_age:
+                return self._health
+        self._refresh_health()
+        return self._health
+
+    def list_models(self) -> List[str]:
+        """List available model names (refreshes the health check)"""
+        self._refresh_health()
+        return list(self._models)
+
+    def generate(
+        self,
+        model: str,
+        prompt: str,
+        system: Optional[str] = None,
+        options: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+        check_available: bool = False
+    ) -> str:
+        """
+        Run a non-streaming generation and return the response text.
+
+        With check_available, raise ConnectionError up front if Ollama is not
+        reachable (cached responses are still served).
+        """
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = self.response_cache.make_key(model, prompt, system, options)
+            if not llm_cache_bypassed():
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    publish_token(cached)
+                    return cached
+
+        if check_available and not self.is_available():
+            raise ConnectionError(OLLAMA_UNAVAILABLE_MESSAGE)
+
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": False
+        }
+        if options:
+            payload["options"] = options
+        if system:
+            payload["system"] = system
+
+        try:
+            if current_stream() is not None:
+                text = self._generate_streaming(payload, timeout)
+            else:
+                response = self.session.post(
+                    f"{self.base_url}/api/generate",
+                    json=payload,
+                    timeout=(self.connect_timeout, timeout or self.read_timeout)
+                )
+                response.raise_for_status()
+                text = response.json().get('response', '')
+        except requests.exceptions.Timeout:
+            raise TimeoutError("Ollama request timed out. The model might be taking too long to respond.")
+        except requests.exceptions.RequestException as e:
+            self._mark_unavailable_on_connection_error(e)
+            raise RuntimeError(f"Ollama API error: {str(e)}")
+
+        if cache_key is not None and text:
+            self.response_cache.put(cache_key, text, model)
+        return text
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _generate_streaming(self, payload: Dict, timeout: Optional[float]) -> str:
+        """Consume Ollama's NDJSON stream, publishing chunks as they arrive"""
+        payload = dict(payload, stream=True)
+        parts = []
+        # With stream=True the read timeout applies between chunks, not to the whole generation
+        with self.session.post(
+            f"{self.base_url}/api/generate",
+            json=payload,
+            timeout=(self.connect_timeout, timeout or self.read_timeout),
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if chunk.get('error'):
+                    raise RuntimeError(f"Ollama API error: {chunk['error']}")
+                piece = chunk.get('response', '')
+                if piece:
+                    parts.append(piece)
+                    publish_token(piece)
+                if chunk.get('done'):
+                    break
+        return ''.join(parts)
+
+    def _refresh_health(self) -> None:
+        try:
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=self.connect_timeout)
+            healthy = response.status_code == 200
+            models = [m['name'] for m in response.json().get('models', [])] if healthy else []
+        except (requests.exceptions.RequestException, ValueError, KeyError):
+            healthy, models = False, []
+        with self._health_lock:
+            self._health = healthy
+            self._models = models
+            self._health_checked_at = time.monotonic()
+
+    def _mark_unavailable_on_connection_error(self, error: Exception) -> None:
+        if isinstance(error, requests.exceptions.ConnectionError):
+            with self._health_lock:
+                self._health = False
+                self._health_checked_at = time.monotonic()
+
+
+_clients: Dict[str, OllamaClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_ollama_client(base_url: Optional[str] = None) -> OllamaClient:
+    """Return the process-wide client for an Ollama server, configured from config.yaml"""
+    config = _load_ai_config()
+    base_url = (base_url or config.get('base_url') or DEFAULT_BASE_URL).rstrip('/')
+    with _clients_lock:
+        client = _clients.get(base_url)
+        if client is None:
+            response_cache = None
+            if config.get('response_cache', True):
+                response_cache = get_llm_response_cache(
+                    int(config.get('response_cache_max_mb', 200)) * 1024 * 1024
+                )
+            client = OllamaClient(
+                base_url,
+                connect_timeout=config.get('connect_timeout', 5),
+                read_timeout=config.get('timeout', 600),
+                retries=config.get('retries', 2),
+                health_check_ttl=config.get('health_check_ttl', 10),
+                pool_size=config.get('pool_size', 8),
+                response_cache=response_cache
+            )
+            _clients[base_url] = client
+        return client
@@ -3,14 +3,163 @@
 Preliminary Skills Matcher - Reduces AI load by doing initial matching
 """
 
+import copy
 import yaml
 import re
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
+from app.services.resume_profile import get_resume_profile
 from app.utils.file_utils import read_text_file
+from app.utils.phrase_scanner import PhraseScanner
 from app.utils.skill_normalizer import SkillNormalizer
 from app.utils.simple_tech_extractor import SimpleTechExtractor
 
+
+# Parsed skills.yaml and its compiled variation scanner, shared by every matcher
+# and rebuilt only when the file changes: path -> (file signature, skills, scanner)
+_compiled_skills: Dict[Path, Tuple[Tuple, Dict, PhraseScanner]] = {}
+# Parsed job_engine_v2.yaml: path -> (file signature, config)
+_v2_configs: Dict[Path, Tuple[Tuple, Dict]] = {}
+# Parsed skill_equivalencies.yaml and its graph: path -> (file signature, mappings, graph)
+_equivalence_graphs: Dict[Path, Tuple[Tuple, Dict, '_SkillEquivalenceGraph']] = {}
+_compiled_lock = threading.Lock()
+
+SKILL_QUALIFIER_SUFFIX = re.compile(r'\s+(skills?|experience|expertise|knowledge|proficiency)$')
+
+# Legacy hardcoded equivalences, kept for backward compatibility alongside the YAML
+LEGACY_SKILL_EQUIVALENCES = {
+    'aws lake formation': ['aws', 'lake formation', 'data lake', 'data warehousing'],
+    'amazon kinesis': ['aws', 'kinesis', 'streaming', 'data streaming'],
+    'amazon q': ['aws', 'ai', 'artificial intelligence', 'machine learning'],
+    'budget management': ['financial management', 'budget', 'financial', 'management', 'leadership'],
+    'financial management': ['budget management', 'financial', 'budget', 'management', 'leadership'],
+    'insights': ['insight', 'analytics', 'data insights', 'business insights'],
+    'paid advertising': ['advertising', 'digital marketing', 'google ads', 'meta', 'amazon ads'],
+    'advertising platforms': ['paid advertising', 'digital marketing', 'google ads', 'meta', 'amazon ads'],
+    'problem solving': ['problem-solving', 'problem-solving skills', 'problem solving skills'],
+    'problem-solving': ['problem solving', 'problem-solving skills', 'problem solving skills'],
+    'problem-solving skills': ['problem solving', 'problem-solving'],
+}
+# The smaller legacy set _find_matched_job_skill has always used
+LEGACY_JOB_SKILL_EQUIVALENCES = {
+    'aws lake formation': ['aws', 'lake formation', 'data lake', 'data warehousing'],
+    'amazon kinesis': ['aws', 'kinesis', 'streaming', 'data streaming'],
+    'insights': ['insight', 'analytics', 'data insights', 'business insights'],
+}
+
+
+def _file_signature(path: Path) -> Optional[Tuple]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+@lru_cache(maxsize=20000)
+def _clean_skill_name(skill: str) -> str:
+    """Comparison form of a lowercased skill: hyphens/underscores as spaces, no trailing 'skills'/'experience'/..."""
+    skill = skill.replace('-', ' ').replace('_', ' ')
+    return SKILL_QUALIFIER_SUFFIX.sub('', skill).strip()
+
+
+def _skill_variations(skill_name: str, skill_data: Dict) -> List[str]:
+    """Strings searched for a candidate skill: its name plus the variations found in the resume"""
+    return [skill_name.lower()] + skill_data.get('variations_found', [])
+
+
+def _compile_skill_scanner(candidate_skills: Dict) -> PhraseScanner:
+    """
+    One scanner for every multi-character variation and every meaningful
+    word of multi-word variations (what _is_partial_match looks for).
+    """
+    phrases = []
+    for skill_name, skill_data in candidate_skills.items():
+        for variation in _skill_variations(skill_name, skill_data):
+            if not isinstance(variation, str) or len(variation) < 2:
+                continue
+            phrases.append(variation)
+            phrases.extend(word for word in variation.split() if len(word) > 2)
+    return PhraseScanner(phrases)
+
+
+class _SkillEquivalenceGraph:
+    """
+    Skill equivalences cleaned once into sets of neighbours, so matching a
+    pair of (cleaned) skills is a lookup plus a short substring check, and
+    each pair's answer is remembered.
+
+    Three views are kept because the matchers have always read the mappings
+    differently: _is_skill_matched merges the legacy pairs into the YAML
+    with lowercased keys, _check_equivalency_match uses the YAML keys as
+    written, and _find_matched_job_skill uses the smaller legacy set and
+    requires exact equality.
+    """
+
+    MAX_REMEMBERED_PAIRS = 100000
+
+    def __init__(self, equivalencies: Dict[str, List[str]]):
+        merged = {key: list(values) for key, values in LEGACY_SKILL_EQUIVALENCES.items()}
+        job_skill_map = {key: list(values) for key, values in LEGACY_JOB_SKILL_EQUIVALENCES.items()}
+        self.yaml_neighbours: Dict[str, frozenset] = {}
+        for key, values in equivalencies.items():
+            values = [v.lower().strip() for v in values if isinstance(v, str)]
+            merged.setdefault(key.lower().strip(), []).extend(values)
+            job_skill_map.setdefault(key.lower().strip(), values)
+            self.yaml_neighbours[key] = frozenset(_clean_skill_name(v) for v in values)
+        self.neighbours = {key: frozenset(_clean_skill_name(v) for v in values) for key, values in merged.items()}
+        self.job_skill_neighbours = {
+            key: frozenset(_clean_skill_name(v) for v in values) for key, values in job_skill_map.items()
+        }
+        self._pairs: Dict[Tuple[str, str], bool] = {}
+        self._yaml_pairs: Dict[Tuple[str, str], bool] = {}
+
+    def related(self, skill: str, other: str) -> bool:
+        """Either skill lists an equivalent equal to, or (both over 2 chars) overlapping, the other"""
+        key = (skill, other)
+        result = self._pairs.get(key)
+        if result is None:
+            result = self._reaches(skill, other) or self._reaches(other, skill)
+            self._remember(self._pairs, key, result)
+        return result
+
+    def yaml_related(self, skill: str, other: str) -> bool:
+        """Either skill is a YAML key with an equivalent overlapping the other"""
+        key = (skill, other)
+        result = self._yaml_pairs.get(key)
+        if result is None:
+            result = self._overlaps(self.yaml_neighbours.get(skill), other) or \
+                self._overlaps(self.yaml_neighbours.get(other), skill)
+            self._remember(self._yaml_pairs, key, result)
+        return result
+
+    def job_skill_related(self, skill: str, other: str) -> bool:
+        """Either skill lists the other as an equivalent (legacy job-skill view)"""
+        return other in self.job_skill_neighbours.get(skill, ()) or skill in self.job_skill_neighbours.get(other, ())
+
+    def _reaches(self, skill: str, other: str) -> bool:
+        equivalents = self.neighbours.get(skill)
+        if not equivalents:
+            return False
+        if other in equivalents:
+            return True
+        if len(other) <= 2:
+            return False
+        return any(len(equivalent) > 2 and (equivalent in other or other in equivalent) for equivalent in equivalents)
+
+    @staticmethod
+    def _overlaps(equivalents: Optional[frozenset], other: str) -> bool:
+        if not equivalents:
+            return False
+        return other in equivalents or any(equivalent in other or other in equivalent for equivalent in equivalents)
+
+    def _remember(self, pairs: Dict, key: Tuple[str, str], result: bool) -> None:
+        if len(pairs) >= self.MAX_REMEMBERED_PAIRS:
+            pairs.clear()
+        pairs[key] = result
+
 class PreliminaryMatcher:
     """Preliminary matching system to reduce AI load"""
     
@@ -26,17 +175,16 @@ class PreliminaryMatcher:
         self.skill_normalizer = SkillNormalizer()
         # Initialize technology extractor (comprehensive 157+ technologies)
         self.tech_extractor = SimpleTechExtractor()
-        # Load skill equivalency mappings
+        # Load skill equivalency mappings (and their shared equivalence graph)
         self.skill_equivalencies = self._load_skill_equivalencies()
         self.load_skills_data()
         self._build_normalization_cache()
+        self._apply_resume_profile()
     
     def load_skills_data(self):
         """Load both skills files"""
         # Load candidate skills
-        with open(self.skills_yaml_path, 'r') as f:
-            skills_data = yaml.safe_load(f)
-            self.candidate_skills = skills_data.get('skills', {})
+        self._load_candidate_skills()
         
         # Load job skills from markdown (optional file)
         if self.job_skills_path.exists():
@@ -48,23 +196,74 @@ class PreliminaryMatcher:
             print(f"   Continuing without job skills database. The file is optional.")
             self.job_skills = {}
     
+    def _load_candidate_skills(self):
+        """Use the shared parsed skills.yaml and compiled scanner, re-reading the file only if it changed"""
+        path = self.skills_yaml_path
+        signature = _file_signature(path)
+        with _compiled_lock:
+            cached = _compiled_skills.get(path)
+        if cached is None or cached[0] != signature or signature is None:
+            with open(path, 'r') as f:
+                skills_data = yaml.safe_load(f)
+            candidate_skills = skills_data.get('skills', {})
+            cached = (signature, candidate_skills, _compile_skill_scanner(candidate_skills))
+            with _compiled_lock:
+                _compiled_skills[path] = cached
+        self._skills_signature, self.candidate_skills, self._skill_scanner = cached
+    
+    def _refresh_candidate_skills(self):
+        """Pick up edits to skills.yaml made since this matcher loaded it"""
+        if _file_signature(self.skills_yaml_path) != self._skills_signature:
+            self._load_candidate_skills()
+    
     def _build_normalization_cache(self):
         """Initialize empty cache - normalize lazily as needed"""
         self._normalized_candidate_skills_cache = {}
         self._normalized_candidate_skills_set = set()
     
+    def _apply_resume_profile(self):
+        """Start from the shared resume profile's normalized candidate skills instead of normalizing them again"""
+        try:
+            self.resume_profile = get_resume_profile(self)
+        except Exception as e:
+            print(f"⚠️  Warning: Could not load resume profile: {e}")
+            self.resume_profile = None
+            return
+        for skill_name, normalized in self.resume_profile.normalized_skills.items():
+            if normalized:
+                self._normalized_candidate_skills_cache[skill_name] = normalized
+                self._normalized_candidate_skills_set.add(normalized)
+    
     def _load_skill_equivalencies(self) -> Dict[str, List[str]]:
-        """Load skill equivalency mappings from YAML file"""
+        """Load skill equivalency mappings from YAML file (shared; re-read only when the file changes)"""
         equivalencies_path = Path(__file__).parent.parent.parent / "data" / "config" / "skill_equivalencies.yaml"
-        if equivalencies_path.exists():
-            try:
-                with open(equivalencies_path, 'r') as f:
-                    data = yaml.safe_load(f)
-                    return data.get('equivalencies', {})
-            except Exception as e:
-                print(f"⚠️  Warning: Could not load skill equivalencies: {e}")
-                return {}
-        return {}
+        signature = _file_signature(equivalencies_path)
+        with _compiled_lock:
+            cached = _equivalence_graphs.get(equivalencies_path)
+        if cached is None or cached[0] != signature:
+            equivalencies = {}
+            if signature is not None:
+                try:
+                    with open(equivalencies_path, 'r') as f:
+                        data = yaml.safe_load(f)
+                        equivalencies = data.get('equivalencies', {})
+                except Exception as e:
+                    print(f"⚠️  Warning: Could not load skill equivalencies: {e}")
+            cached = (signature, equivalencies, _SkillEquivalenceGraph(equivalencies))
+            with _compiled_lock:
+                _equivalence_graphs[equivalencies_path] = cached
+        self._equivalencies_signature, equivalencies, self._equivalence_graph = cached
+        return equivalencies
+    
+    def _refresh_skill_equivalencies(self):
+        """Pick up edits to skill_equivalencies.yaml made since this matcher loaded it"""
+        path = Path(__file__).parent.parent.parent / "data" / "config" / "skill_equivalencies.yaml"
+        if _file_signature(path) != self._equivalencies_signature:
+            self.skill_equivalencies = self._load_skill_equivalencies()
+    
+    def _clean_normalized_skill(self, skill: str) -> str:
+        """Cached normalized form of a candidate skill (or its lowercase original), cleaned for comparison"""
+        return _clean_skill_name(self._get_normalized_skill(skill) or skill.lower().strip())
     
     def _get_normalized_skill(self, skill_name: str) -> str:
         """Get normalized skill from cache, or normalize and cache if not present"""
@@ -129,8 +328,13 @@ class PreliminaryMatcher:
     def find_skill_matches(self, job_description: str) -> Dict[str, any]:
         """Find matches between job description and candidate skills"""
         
+        self._refresh_candidate_skills()
+        self._refresh_skill_equivalencies()
+        
         # Normalize job description
         job_desc_lower = job_description.lower()
+        # Every skill variation (and partial-match word) present in the JD, in one pass
+        found_phrases = self._skill_scanner.find_all(job_desc_lower)
         
         # Check if Job Engine V2 is enabled and get V2 data
         v2_config = self._load_job_engine_v2_config()
@@ -173,7 +377,7 @@ class PreliminaryMatcher:
             
             # CRITICAL: Search using ORIGINAL skill name + variations, NOT normalized form
             # This prevents "power-bi" from searching for "business intelligence" in the job description
-            skill_variations = [skill_name.lower()] + skill_data.get('variations_found', [])
+            skill_variations = _skill_variations(skill_name, skill_data)
             
             # Check for exact matches
             exact_match = False
@@ -194,14 +398,13 @@ class PreliminaryMatcher:
                         matched_skills.add(skill_name)
                         break
                 else:
-                    # Multi-character skills: use word boundary matching
-                    pattern = r'\b' + re.escape(variation) + r'\b'
-                    if re.search(pattern, job_desc_lower):
+                    # Multi-character skills: word boundary matching (precomputed by the scanner)
+                    if variation in found_phrases:
                         exact_match = True
                         matched_variation = variation
                         matched_skills.add(skill_name)
                         break
-                    elif self._is_partial_match(variation, job_desc_lower):
+                    elif self._is_partial_phrase_match(variation, found_phrases):
                         partial_match = True
                         matched_variation = variation
                         matched_skills.add(skill_name)
@@ -493,17 +696,25 @@ class PreliminaryMatcher:
         return matches
     
     def _load_job_engine_v2_config(self) -> Dict:
-        """Load Job Engine V2 configuration from YAML file"""
+        """Load Job Engine V2 configuration from YAML file (parsed once, re-read when the file changes)"""
         config_path = Path(__file__).parent.parent.parent / "data" / "config" / "job_engine_v2.yaml"
-        if config_path.exists():
+        signature = _file_signature(config_path)
+        if signature is None:
+            return {'enabled': False, 'console_logging': True, 'phases': {}}
+        with _compiled_lock:
+            cached = _v2_configs.get(config_path)
+        if cached is None or cached[0] != signature:
             try:
                 with open(config_path, 'r') as f:
                     config = yaml.safe_load(f)
-                    return config.get('job_engine_v2', {})
+                    cached = (signature, config.get('job_engine_v2', {}))
             except Exception as e:
                 print(f"⚠️  Warning: Could not load Job Engine V2 config: {e}")
                 return {'enabled': False, 'console_logging': True, 'phases': {}}
-        return {'enabled': False, 'console_logging': True, 'phases': {}}
+            with _compiled_lock:
+                _v2_configs[config_path] = cached
+        # Callers get their own copy so the cached config cannot be modified
+        return copy.deepcopy(cached[1])
     
     def _log_engine_status(self, config: Dict) -> None:
         """Log which engine and phases are active"""
@@ -1491,48 +1702,13 @@ class PreliminaryMatcher:
             job_skill_normalized = job_skill.lower().strip()
         
         # Normalize hyphens and handle plurals for better matching
-        job_skill_normalized = job_skill_normalized.replace('-', ' ').replace('_', ' ')
-        job_skill_normalized = re.sub(r'\s+(skills?|experience|expertise|knowledge|proficiency)$', '', job_skill_normalized).strip()
-        
-        # Combine hardcoded equivalences with loaded equivalency mappings
-        # Start with legacy hardcoded mappings for backward compatibility
-        skill_equivalences = {
-            'aws lake formation': ['aws', 'lake formation', 'data lake', 'data warehousing'],
-            'amazon kinesis': ['aws', 'kinesis', 'streaming', 'data streaming'],
-            'amazon q': ['aws', 'ai', 'artificial intelligence', 'machine learning'],
-            'budget management': ['financial management', 'budget', 'financial', 'management', 'leadership'],
-            'financial management': ['budget management', 'financial', 'budget', 'management', 'leadership'],
-            'insights': ['insight', 'analytics', 'data insights', 'business insights'],                                                                         
-            'paid advertising': ['advertising', 'digital marketing', 'google ads', 'meta', 'amazon ads'],
-            'advertising platforms': ['paid advertising', 'digital marketing', 'google ads', 'meta', 'amazon ads'],
-            'problem solving': ['problem-solving', 'problem-solving skills', 'problem solving skills'],
-            'problem-solving': ['problem solving', 'problem-solving skills', 'problem solving skills'],
-            'problem-solving skills': ['problem solving', 'problem-solving'],
-        }
-        
-        # Add loaded equivalency mappings (from YAML file)
-        # Normalize keys and values to lowercase for matching
-        for key, values in self.skill_equivalencies.items():
-            key_normalized = key.lower().strip()
-            values_normalized = [v.lower().strip() for v in values]
-            if key_normalized not in skill_equivalences:
-                skill_equivalences[key_normalized] = values_normalized
-            else:
-                # Merge with existing values
-                skill_equivalences[key_normalized].extend(values_normalized)
+        job_skill_normalized = _clean_skill_name(job_skill_normalized)
+        graph = self._equivalence_graph
         
         # Performance optimization: Use lazy cache - normalize only when needed
         for candidate_skill in matched_skills:
-            # Get normalized skill from cache (normalizes on first access, then caches)
-            candidate_skill_normalized = self._get_normalized_skill(candidate_skill)
-            
-            if not candidate_skill_normalized:
-                # Fallback: use candidate skill as-is
-                candidate_skill_normalized = candidate_skill.lower().strip()
-            
-            # Normalize hyphens and handle plurals for candidate skill too
-            candidate_skill_normalized = candidate_skill_normalized.replace('-', ' ').replace('_', ' ')
-            candidate_skill_normalized = re.sub(r'\s+(skills?|experience|expertise|knowledge|proficiency)$', '', candidate_skill_normalized).strip()
+            # Normalized (on first access, then cached), hyphens and plurals handled
+            candidate_skill_normalized = self._clean_normalized_skill(candidate_skill)
             
             # Direct match (fast check)
             # SIMPLIFIED: Only exact matches for multi-word skills to avoid false positives
@@ -1551,34 +1727,9 @@ class PreliminaryMatcher:
                     candidate_skill_normalized in job_skill_normalized):
                     return True
             
-            # Check for skill equivalences (only if direct match failed)
-            # First check if job skill has equivalents defined
-            if job_skill_normalized in skill_equivalences:
-                for equivalent in skill_equivalences[job_skill_normalized]:
-                    equivalent_normalized = equivalent.lower().strip().replace('-', ' ').replace('_', ' ')
-                    equivalent_normalized = re.sub(r'\s+(skills?|experience|expertise|knowledge|proficiency)$', '', equivalent_normalized).strip()
-                    
-                    # Check if equivalent matches candidate skill (exact match preferred)
-                    if equivalent_normalized == candidate_skill_normalized:
-                        return True
-                    # Also check if equivalent is contained in candidate skill or vice versa
-                    if len(equivalent_normalized) > 2 and len(candidate_skill_normalized) > 2:
-                        if equivalent_normalized in candidate_skill_normalized or candidate_skill_normalized in equivalent_normalized:
-                            return True
-            
-            # Also check reverse: if candidate skill has equivalents, check if job skill matches any equivalent
-            if candidate_skill_normalized in skill_equivalences:
-                for equivalent in skill_equivalences[candidate_skill_normalized]:
-                    equivalent_normalized = equivalent.lower().strip().replace('-', ' ').replace('_', ' ')
-                    equivalent_normalized = re.sub(r'\s+(skills?|experience|expertise|knowledge|proficiency)$', '', equivalent_normalized).strip()
-                    
-                    # Check if equivalent matches job skill (exact match preferred)
-                    if equivalent_normalized == job_skill_normalized:
-                        return True
-                    # Also check if equivalent is contained in job skill or vice versa
-                    if len(equivalent_normalized) > 2 and len(job_skill_normalized) > 2:
-                        if equivalent_normalized in job_skill_normalized or job_skill_normalized in equivalent_normalized:
-                            return True
+            # Check for skill equivalences in both directions (only if direct match failed)
+            if graph.related(job_skill_normalized, candidate_skill_normalized):
+                return True
                     
         # No match found
         return False
@@ -1601,53 +1752,14 @@ class PreliminaryMatcher:
         # Normalize job skill
         normalized_result = self.skill_normalizer.normalize(job_skill, fuzzy=True)
         job_skill_normalized = normalized_result.lower() if normalized_result else job_skill.lower().strip()
-        job_skill_normalized = job_skill_normalized.replace('-', ' ').replace('_', ' ')
-        job_skill_normalized = re.sub(r'\s+(skills?|experience|expertise|knowledge|proficiency)$', '', job_skill_normalized).strip()
-        
-        # Check if job skill has equivalents defined
-        if job_skill_normalized in self.skill_equivalencies:
-            equivalents = self.skill_equivalencies[job_skill_normalized]
-            # Check if any candidate skill matches any equivalent
-            for candidate_skill in candidate_skills:
-                candidate_normalized = self._get_normalized_skill(candidate_skill)
-                if not candidate_normalized:
-                    candidate_normalized = candidate_skill.lower().strip()
-                candidate_normalized = candidate_normalized.replace('-', ' ').replace('_', ' ')
-                candidate_normalized = re.sub(r'\s+(skills?|experience|expertise|knowledge|proficiency)$', '', candidate_normalized).strip()
-                
-                # Check if candidate skill matches any equivalent
-                for equivalent in equivalents:
-                    equiv_normalized = equivalent.lower().strip().replace('-', ' ').replace('_', ' ')
-                    equiv_normalized = re.sub(r'\s+(skills?|experience|expertise|knowledge|proficiency)$', '', equiv_normalized).strip()
-                    
-                    if equiv_normalized == candidate_normalized:
-                        return True
-                    # Also check substring match for variations
-                    if equiv_normalized in candidate_normalized or candidate_normalized in equiv_normalized:
-                        return True
-        
-        # Check reverse direction: if any candidate skill has equivalents, check if job skill matches any equivalent
-        for candidate_skill in candidate_skills:
-            candidate_normalized = self._get_normalized_skill(candidate_skill)
-            if not candidate_normalized:
-                candidate_normalized = candidate_skill.lower().strip()
-            candidate_normalized = candidate_normalized.replace('-', ' ').replace('_', ' ')
-            candidate_normalized = re.sub(r'\s+(skills?|experience|expertise|knowledge|proficiency)$', '', candidate_normalized).strip()
-            
-            if candidate_normalized in self.skill_equivalencies:
-                equivalents = self.skill_equivalencies[candidate_normalized]
-                # Check if job skill matches any equivalent
-                for equivalent in equivalents:
-                    equiv_normalized = equivalent.lower().strip().replace('-', ' ').replace('_', ' ')
-                    equiv_normalized = re.sub(r'\s+(skills?|experience|expertise|knowledge|proficiency)$', '', equiv_normalized).strip()
-                    
-                    if equiv_normalized == job_skill_normalized:
-                        return True
-                    # Also check substring match for variations
-                    if equiv_normalized in job_skill_normalized or job_skill_normalized in equiv_normalized:
-                        return True
-        
-        return False
+        job_skill_normalized = _clean_skill_name(job_skill_normalized)
+        
+        # Job skill -> equivalent -> candidate skill, and candidate skill -> equivalent -> job skill
+        graph = self._equivalence_graph
+        return any(
+            graph.yaml_related(job_skill_normalized, self._clean_normalized_skill(candidate_skill))
+            for candidate_skill in candidate_skills
+        )
     
     def _find_exact_candidate_skill(self, job_skill: str, candidate_skills: set) -> str:
         """
@@ -1701,6 +1813,17 @@ class PreliminaryMatcher:
         
         return ""
     
+    def _is_partial_phrase_match(self, skill: str, found_phrases: Set[str]) -> bool:
+        """_is_partial_match against the phrases the skill scanner found in the JD"""
+        skill_words = skill.split()
+        if len(skill_words) == 1:
+            return skill in found_phrases
+        meaningful_words = [w for w in skill_words if len(w) > 2]
+        if not meaningful_words:
+            return False
+        matches = sum(1 for word in meaningful_words if word in found_phrases)
+        return matches >= len(meaningful_words) * 0.6  # 60% of meaningful words must match
+    
     def _is_partial_match(self, skill: str, job_desc: str) -> bool:
         """Check for partial matches using fuzzy logic with word boundaries"""
         # Split skill into words
@@ -2059,41 +2182,13 @@ Please focus your analysis on the areas above and provide detailed insights on:
             if candidate_normalized_clean == job_skill_normalized_clean:
                 return job_skill
         
-        # Second pass: Check equivalencies
-        # Combine hardcoded and loaded equivalencies
-        skill_equivalences = {
-            'aws lake formation': ['aws', 'lake formation', 'data lake', 'data warehousing'],
-            'amazon kinesis': ['aws', 'kinesis', 'streaming', 'data streaming'],
-            'insights': ['insight', 'analytics', 'data insights', 'business insights'],
-        }
-        for key, values in self.skill_equivalencies.items():
-            key_normalized = key.lower().strip()
-            values_normalized = [v.lower().strip() for v in values]
-            if key_normalized not in skill_equivalences:
-                skill_equivalences[key_normalized] = values_normalized
-        
-        # Check if candidate skill or its equivalents match any job skill
+        # Second pass: Check equivalencies (either skill listing the other as an equivalent)
+        graph = self._equivalence_graph
         for job_skill in job_skills:
             normalized_result = self.skill_normalizer.normalize(job_skill, fuzzy=True)
             job_skill_normalized = normalized_result.lower() if normalized_result else job_skill.lower()
-            job_skill_normalized_clean = job_skill_normalized.replace('-', ' ').replace('_', ' ')
-            job_skill_normalized_clean = re.sub(r'\s+(skills?|experience|expertise|knowledge|proficiency)$', '', job_skill_normalized_clean).strip()
-            
-            # Check if candidate skill has equivalents that match job skill
-            if candidate_normalized_clean in skill_equivalences:
-                for equivalent in skill_equivalences[candidate_normalized_clean]:
-                    equiv_clean = equivalent.replace('-', ' ').replace('_', ' ')
-                    equiv_clean = re.sub(r'\s+(skills?|experience|expertise|knowledge|proficiency)$', '', equiv_clean).strip()
-                    if equiv_clean == job_skill_normalized_clean:
-                        return job_skill
-            
-            # Check if job skill has equivalents that match candidate skill
-            if job_skill_normalized_clean in skill_equivalences:
-                for equivalent in skill_equivalences[job_skill_normalized_clean]:
-                    equiv_clean = equivalent.replace('-', ' ').replace('_', ' ')
-                    equiv_clean = re.sub(r'\s+(skills?|experience|expertise|knowledge|proficiency)$', '', equiv_clean).strip()
-                    if equiv_clean == candidate_normalized_clean:
-                        return job_skill
+            if graph.job_skill_related(candidate_normalized_clean, _clean_skill_name(job_skill_normalized)):
+                return job_skill
         
         return ""
     
@@ -0,0 +1,177 @@
+"""Resume-side matching facts, computed once per resume version and shared by the analyzers"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.utils.file_utils import ensure_dir_exists, get_data_path, load_yaml, read_text_file
+
+
+# Profiles kept on disk (one per resume version), newest first
+MAX_STORED_PROFILES = 10
+
+
+@dataclass
+class ResumeProfile:
+    """
+    Everything matching needs to know about the candidate, independent of
+    any job: skills.yaml skills, their normalized forms, which of them are
+    technologies, and the technologies recorded in tech.yaml. Identified by
+    a hash of the inputs it was derived from.
+    """
+    content_hash: str
+    created_at: str
+    candidate_skills: List[str] = field(default_factory=list)
+    # skill -> lowercased canonical name ('' when the taxonomy has none)
+    normalized_skills: Dict[str, str] = field(default_factory=dict)
+    candidate_skills_lower: List[str] = field(default_factory=list)
+    candidate_technologies_lower: List[str] = field(default_factory=list)
+    # Technology names from tech.yaml (what ResumeManager.get_technology_list returns)
+    technologies: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ResumeProfile':
+        """Create a ResumeProfile from its stored JSON form"""
+        return cls(**{key: data[key] for key in cls.__dataclass_fields__ if key in data})
+
+
+_shared_matcher = None
+_shared_matcher_lock = threading.Lock()
+_profiles: Dict[str, ResumeProfile] = {}
+# Input file signatures -> content hash they were last seen with
+_signatures: Dict[Tuple, str] = {}
+_profiles_lock = threading.Lock()
+
+
+def get_resume_profile(matcher=None) -> ResumeProfile:
+    """
+    Return the profile for the current resume inputs, loading it from
+    data/output/resume_profiles/ or computing (and storing) it if this
+    resume version has not been seen before. matcher is the
+    PreliminaryMatcher whose normalizer and skills to use (a shared one
+    if not given).
+    """
+    global _shared_matcher
+    if matcher is None:
+        with _shared_matcher_lock:
+            if _shared_matcher is None:
+                from app.services.preliminary_matcher import PreliminaryMatcher
+                _shared_matcher = PreliminaryMatcher()
+            matcher = _shared_matcher
+        matcher._refresh_candidate_skills()
+        matcher._refresh_skill_equivalencies()
+    resume_paths = _resume_paths()
+    signature = (
+        tuple(_file_signature(path) for path in resume_paths),
+        matcher._skills_signature,
+        matcher._equivalencies_signature,
+        matcher.skill_normalizer.config_hash,
+    )
+    with _profiles_lock:
+        content_hash = _signatures.get(signature)
+        profile = _profiles.get(content_hash) if content_hash else None
+    if profile is not None:
+        return profile
+
+    content_hash = _content_hash(matcher, resume_paths)
+    with _profiles_lock:
+        profile = _profiles.get(content_hash)
+    if profile is None:
+        profile = _load_profile(content_hash)
+    if profile is None:
+        profile = _build_profile(matcher, content_hash, resume_paths[2])
+        _save_profile(profile)
+    with _profiles_lock:
+        _profiles[content_hash] = profile
+        _signatures[signature] = content_hash
+    return profile
+
+
+def _resume_paths() -> Tuple[Path, Path, Path]:
+    """Base resume, its metadata and tech.yaml (as laid out by ResumeManager)"""
+    resumes_dir = get_data_path('resumes')
+    return resumes_dir / 'base_resume.md', resumes_dir / 'base_resume.yaml', resumes_dir / 'tech.yaml'
+
+
+def _file_signature(path: Path) -> Optional[Tuple]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _content_hash(matcher, resume_paths: Tuple[Path, ...]) -> str:
+    """Hash of the resume files, the parsed skills, the equivalencies and the taxonomy version"""
+    digest = hashlib.sha256()
+    for path in resume_paths:
+        digest.update(path.name.encode('utf-8'))
+        digest.update(read_text_file(path).encode('utf-8') if path.exists() else b'\0')
+    digest.update(json.dumps(
+        [matcher.candidate_skills, matcher.skill_equivalencies, matcher.skill_normalizer.config_hash],
+        sort_keys=True, default=str
+    ).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _build_profile(matcher, content_hash: str, tech_yaml_path: Path) -> ResumeProfile:
+    candidate_skills = list(matcher.candidate_skills.keys())
+    known_technologies_lower = {tech.lower() for tech in matcher.tech_extractor.TECHNOLOGIES.keys()}
+    candidate_skills_lower = sorted({skill.lower() for skill in candidate_skills})
+
+    technologies = []
+    if tech_yaml_path.exists():
+        try:
+            technologies = list((load_yaml(tech_yaml_path).get('technologies') or {}).keys())
+        except Exception as e:
+            print(f"Warning: Could not load technologies from {tech_yaml_path}: {e}")
+
+    return ResumeProfile(
+        content_hash=content_hash,
+        created_at=datetime.now().isoformat(),
+        candidate_skills=candidate_skills,
+        normalized_skills={skill: matcher._get_normalized_skill(skill) for skill in candidate_skills},
+        candidate_skills_lower=candidate_skills_lower,
+        candidate_technologies_lower=[skill for skill in candidate_skills_lower if skill in known_technologies_lower],
+        technologies=technologies,
+    )
+
+
+def _profiles_dir() -> Path:
+    return get_data_path('output') / 'resume_profiles'
+
+
+def _load_profile(content_hash: str) -> Optional[ResumeProfile]:
+    path = _profiles_dir() / f"{content_hash}.json"
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return ResumeProfile.from_dict(json.load(f))
+    except (OSError, ValueError, TypeError) as e:
+        print(f"Warning: Ignoring unreadable resume profile {path}: {e}")
+        return None
+
+
+def _save_profile(profile: ResumeProfile) -> None:
+    """Write the profile atomically and drop the oldest stored versions"""
+    profiles_dir = _profiles_dir()
+    tmp_path = None
+    try:
+        ensure_dir_exists(profiles_dir)
+        fd, tmp_path = tempfile.mkstemp(dir=profiles_dir, prefix='.profile.')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(asdict(profile), f, ensure_ascii=False)
+        os.replace(tmp_path, profiles_dir / f"{profile.content_hash}.json")
+        stored = sorted(profiles_dir.glob('*.json'), key=lambda p: p.stat().st_mtime, reverse=True)
+        for old_path in stored[MAX_STORED_PROFILES:]:
+            old_path.unlink()
+    except OSError as e:
+        print(f"Warning: Could not save resume profile: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
@@ -0,0 +1,360 @@
+"""Persistent full-text index (SQLite FTS5) over applications, contacts and their notes"""
+import html
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from app.models.application import Application
+from app.models.networking_contact import NetworkingContact
+from app.services.status_update_store import StatusUpdateStore
+from app.utils.file_utils import ensure_dir_exists, get_data_path, load_yaml, read_text_file
+from app.utils.sqlite_utils import ClosingConnection, connect
+
+
+# Column weights for bm25(): title, company, status, content, notes
+RANK_WEIGHTS = (10.0, 5.0, 2.0, 1.0, 1.0)
+DEFAULT_RESULT_LIMIT = 20
+# Bumped when what gets indexed changes; an index built by an older version is fully re-indexed
+INDEX_VERSION = 2
+
+_SNIPPET_START = '\x02'
+_SNIPPET_END = '\x03'
+_QUERY_TOKEN = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def build_match_query(text: str, prefix_last: bool = False) -> Optional[str]:
+    """
+    Translate a user query into an FTS5 MATCH expression: every term must
+    match; "quoted words" match as a phrase, term* as a prefix, and
+    prefix_last makes the last bare term a prefix (search-as-you-type).
+    None if the query has no searchable words.
+    """
+    terms = []
+    tokens = list(_QUERY_TOKEN.finditer(text or ''))
+    for position, token in enumerate(tokens):
+        phrase, word = token.groups()
+        words = re.findall(r'\w+', phrase if phrase is not None else word)
+        if not words:
+            continue
+        term = '"' + ' '.join(words) + '"'
+        is_last = position == len(tokens) - 1
+        if phrase is None and (word.endswith('*') or (prefix_last and is_last)):
+            term += '*'
+        terms.append(term)
+    return ' '.join(terms) if terms else None
+
+
+def _folder_signature(folder_path: Path, metadata_name: str) -> Optional[str]:
+    """Stat fingerprint of a record folder: its metadata file, the folder itself and updates/"""
+    try:
+        meta_stat = os.stat(folder_path / metadata_name)
+        folder_mtime = os.stat(folder_path).st_mtime_ns
+    except OSError:
+        return None
+    try:
+        updates_mtime = os.stat(folder_path / 'updates').st_mtime_ns
+    except OSError:
+        updates_mtime = 0
+    return f"{meta_stat.st_mtime_ns}:{meta_stat.st_size}:{folder_mtime}:{updates_mtime}"
+
+
+def _is_archived_folder(folder_path: Path) -> bool:
+    """True for an application folder inside the archived applications directory"""
+    return Path(folder_path).resolve().parent == get_data_path('applications_archived').resolve()
+
+
+def _read_optional(path) -> str:
+    if not path:
+        return ''
+    try:
+        return read_text_file(Path(path)) if Path(path).exists() else ''
+    except Exception:
+        return ''
+
+
+def _update_notes(folder_path: Path) -> str:
+    """Notes text of every status update of a record folder, oldest first"""
+    if not (folder_path / 'updates').is_dir():
+        return ''
+    records = StatusUpdateStore(folder_path).records()
+    return '\n'.join(record['notes_text'] for record in records if record.get('notes_text'))
+
+
+class SearchIndex:
+    """
+    Ranked full-text search over application metadata and job descriptions,
+    networking contact metadata and profiles, and the notes of both kinds'
+    status updates, stored in data/output/search.sqlite3.
+
+    The processors re-index a record on every write (index_application,
+    index_contact, remove). Each record also stores a stat fingerprint of
+    its folder, so the first search in a process re-indexes only folders
+    changed outside the app and drops deleted ones (sync).
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._write_lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._synced = False
+        ensure_dir_exists(self.db_path.parent)
+        self._init_db()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        kinds: Optional[Iterable[str]] = None,
+        limit: int = DEFAULT_RESULT_LIMIT,
+        prefix_last: bool = False,
+        include_archived: bool = True
+    ) -> List[Dict]:
+        """
+        Return the best matches for query (see build_match_query), best
+        first, as dicts with type, id, title, company, status, url,
+        archived, score and an HTML-escaped snippet with matches wrapped in
+        <mark>. include_archived=False leaves out archived applications.
+        """
+        match = build_match_query(query, prefix_last=prefix_last)
+        if match is None:
+            return []
+        self.sync()
+        sql = (
+            "SELECT d.kind, d.ref_id, d.title, d.company, d.status, d.url, d.archived, "
+            f"bm25(documents_fts, {', '.join(str(weight) for weight in RANK_WEIGHTS)}) AS rank, "
+            f"snippet(documents_fts, -1, '{_SNIPPET_START}', '{_SNIPPET_END}', '…', 16) AS snippet "
+            "FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid "
+            "WHERE documents_fts MATCH ?"
+        )
+        params: list = [match]
+        kinds = list(kinds or ())
+        if kinds:
+            sql += f" AND d.kind IN ({', '.join('?' for _ in kinds)})"
+            params += kinds
+        if not include_archived:
+            sql += " AND d.archived = 0"
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [{
+            'type': row['kind'],
+            'id': row['ref_id'],
+            'title': row['title'],
+            'company': row['company'],
+            'status': row['status'],
+            'url': row['url'],
+            'archived': bool(row['archived']),
+            'score': -row['rank'],
+            'snippet': html.escape(row['snippet'] or '')
+                .replace(_SNIPPET_START, '<mark>').replace(_SNIPPET_END, '</mark>'),
+        } for row in rows]
+
+    def index_application(self, application: Application) -> None:
+        """(Re-)index an application from its metadata, job description and update notes"""
+        try:
+            folder_path = application.folder_path
+            if not folder_path:
+                return
+            if application.summary_path:
+                url = f"/applications/{folder_path.name}/{Path(application.summary_path).name}"
+            else:
+                url = f"/applications/{folder_path.name}/"
+            # Read first: reading the update log can rewrite it, which changes the signature
+            notes = _update_notes(folder_path)
+            content = '\n'.join(str(value) for value in (
+                application.job_title, application.company, application.location,
+                application.salary_range, application.hiring_manager, application.posted_date,
+                application.job_url, application.id,
+                _read_optional(application.job_description_path),
+            ) if value)
+            self._upsert(
+                kind='application',
+                ref_id=application.id,
+                folder_path=folder_path,
+                signature=_folder_signature(folder_path, 'application.yaml') or '',
+                title=f"{application.company} - {application.job_title}",
+                company=application.company,
+                status=application.status,
+                url=url,
+                archived=_is_archived_folder(folder_path),
+                content=content,
+                notes=notes,
+            )
+        except Exception as e:
+            print(f"Warning: Could not update search index for application {application.id}: {e}")
+
+    def index_contact(self, contact: NetworkingContact) -> None:
+        """(Re-)index a networking contact from its metadata, profile and update notes"""
+        try:
+            folder_path = contact.folder_path
+            if not folder_path:
+                return
+            if contact.summary_path:
+                url = f"/networking/{folder_path.name}/{Path(contact.summary_path).name}"
+            else:
+                url = f"/networking/{folder_path.name}/"
+            notes = _update_notes(folder_path)
+            content = '\n'.join(str(value) for value in (
+                contact.person_name, contact.company_name, contact.job_title, contact.location,
+                contact.email, contact.linkedin_url, contact.id,
+                _read_optional(contact.profile_path),
+            ) if value)
+            self._upsert(
+                kind='contact',
+                ref_id=contact.id,
+                folder_path=folder_path,
+                signature=_folder_signature(folder_path, 'metadata.yaml') or '',
+                title=f"{contact.person_name} - {contact.company_name}",
+                company=contact.company_name,
+                status=contact.status,
+                url=url,
+                content=content,
+                notes=notes,
+            )
+        except Exception as e:
+            print(f"Warning: Could not update search index for contact {contact.id}: {e}")
+
+    def remove(self, kind: str, ref_id: str) -> None:
+        """Drop a record from the index"""
+        try:
+            with self._write_lock, self._connect() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                self._delete(conn, f"{kind}:{ref_id}")
+        except sqlite3.Error as e:
+            print(f"Warning: Could not remove {kind} {ref_id} from search index: {e}")
+
+    def sync(self, force: bool = False) -> None:
+        """Re-index folders whose fingerprint changed and drop records whose folder is gone (once per process)"""
+        with self._sync_lock:
+            if self._synced and not force:
+                return
+            self._sync()
+            self._synced = True
+
+    def _sync(self) -> None:
+        with self._connect() as conn:
+            stored = {
+                row['folder']: (row['doc_key'], row['signature'])
+                for row in conn.execute("SELECT doc_key, folder, signature FROM documents")
+            }
+
+        sources = (
+            (get_data_path('applications'), 'application.yaml', Application, self.index_application),
+            (get_data_path('applications_archived'), 'application.yaml', Application, self.index_application),
+            (get_data_path('networking'), 'metadata.yaml', NetworkingContact, self.index_contact),
+        )
+        seen = set()
+        for root_dir, metadata_name, model, index in sources:
+            if not root_dir.is_dir():
+                continue
+            for folder_path in root_dir.iterdir():
+                signature = _folder_signature(folder_path, metadata_name) if folder_path.is_dir() else None
+                if signature is None:
+                    continue
+                seen.add(str(folder_path))
+                if stored.get(str(folder_path), (None, None))[1] == signature:
+                    continue
+                try:
+                    metadata = load_yaml(folder_path / metadata_name)
+                    metadata['folder_path'] = str(folder_path)
+                    record = model.from_dict(metadata)
+                except Exception as e:
+                    print(f"Warning: Could not index {folder_path.name}: {e}")
+                    continue
+                index(record)
+
+        stale = [doc_key for folder, (doc_key, _) in stored.items() if folder not in seen]
+        if stale:
+            with self._write_lock, self._connect() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                for doc_key in stale:
+                    row = conn.execute("SELECT folder FROM documents WHERE doc_key = ?", (doc_key,)).fetchone()
+                    # The record may have been re-indexed from its new folder (e.g. archived) meanwhile
+                    if row is not None and row['folder'] not in seen:
+                        self._delete(conn, doc_key)
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _upsert(self, kind: str, ref_id: str, folder_path: Path, signature: str, title: str,
+                company: str, status: str, url: str, content: str, notes: str,
+                archived: bool = False) -> None:
+        doc_key = f"{kind}:{ref_id}"
+        with self._write_lock, self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._delete(conn, doc_key)
+            cursor = conn.execute(
+                "INSERT INTO documents (doc_key, kind, ref_id, folder, signature, title, company, status, url, archived) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (doc_key, kind, ref_id, str(folder_path), signature, title, company, status, url, int(archived))
+            )
+            conn.execute(
+                "INSERT INTO documents_fts (rowid, title, company, status, content, notes) VALUES (?, ?, ?, ?, ?, ?)",
+                (cursor.lastrowid, title, company or '', status or '', content, notes)
+            )
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, doc_key: str) -> None:
+        row = conn.execute("SELECT id FROM documents WHERE doc_key = ?", (doc_key,)).fetchone()
+        if row is not None:
+            conn.execute("DELETE FROM documents_fts WHERE rowid = ?", (row['id'],))
+            conn.execute("DELETE FROM documents WHERE id = ?", (row['id'],))
+
+    def _connect(self) -> ClosingConnection:
+        return connect(self.db_path)
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS documents (
+                    id INTEGER PRIMARY KEY,
+                    doc_key TEXT NOT NULL UNIQUE,
+                    kind TEXT NOT NULL,
+                    ref_id TEXT NOT NULL,
+                    folder TEXT NOT NULL,
+                    signature TEXT NOT NULL,
+                    title TEXT,
+                    company TEXT,
+                    status TEXT,
+                    url TEXT,
+                    archived INTEGER NOT NULL DEFAULT 0
+                )"""
+            )
+            columns = {row['name'] for row in conn.execute("PRAGMA table_info(documents)")}
+            if 'archived' not in columns:
+                # Index from before the column existed: add it and have sync re-index every record
+                conn.execute("ALTER TABLE documents ADD COLUMN archived INTEGER NOT NULL DEFAULT 0")
+                conn.execute("UPDATE documents SET signature = ''")
+            conn.execute(
+                """CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+                    title, company, status, content, notes,
+                    tokenize = 'unicode61 remove_diacritics 2',
+                    prefix = '2 3'
+                )"""
+            )
+            if conn.execute("PRAGMA user_version").fetchone()[0] < INDEX_VERSION:
+                # Built from older notes text (e.g. with undecoded HTML entities): have sync re-index it all
+                conn.execute("UPDATE documents SET signature = ''")
+                conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+
+
+_index: Optional[SearchIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_search_index() -> SearchIndex:
+    """Return the process-wide search index (data/output/search.sqlite3)"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = SearchIndex(get_data_path('output') / 'search.sqlite3')
+        return _index
@@ -0,0 +1,119 @@
+"""Small dependency-aware pipeline: stages with declared inputs run as soon as their inputs are ready"""
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.utils.file_utils import get_project_root, load_yaml
+
+
+@dataclass
+class Stage:
+    """
+    A pipeline step. run is called with one keyword argument per declared
+    input (the results of those stages) and its return value becomes this
+    stage's result.
+    """
+    name: str
+    run: Callable[..., Any]
+    inputs: Tuple[str, ...] = ()
+
+
+class StagePipeline:
+    """
+    Runs a DAG of stages on a shared, bounded executor. Independent stages
+    run concurrently; each stage runs in a copy of the caller's context, so
+    context variables (generation streaming, LLM cache bypass) still apply.
+
+    If a stage raises, stages that have not started are skipped, stages
+    already running are allowed to finish, and the first error is re-raised.
+    """
+
+    def __init__(self, stages: List[Stage], executor: Optional[Executor] = None):
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Stage names must be unique")
+        self.executor = executor or get_stage_executor()
+        self._check_graph()
+
+    def run(self) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """Run every stage; return (results by stage, seconds taken by stage)"""
+        results: Dict[str, Any] = {}
+        timings: Dict[str, float] = {}
+        waiting = dict(self.stages)
+        running: Dict[Future, str] = {}
+        error: Optional[BaseException] = None
+
+        while waiting or running:
+            if error is None:
+                for name, stage in list(waiting.items()):
+                    if all(dep in results for dep in stage.inputs):
+                        del waiting[name]
+                        kwargs = {dep: results[dep] for dep in stage.inputs}
+                        context = contextvars.copy_context()
+                        running[self.executor.submit(context.run, self._timed, stage, kwargs)] = name
+            else:
+                waiting.clear()
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name], timings[name] = future.result()
+                except BaseException as e:
+                    if error is None:
+                        error = e
+
+        if error is not None:
+            raise error
+        return results, timings
+
+    @staticmethod
+    def _timed(stage: Stage, kwargs: Dict[str, Any]) -> Tuple[Any, float]:
+        started = time.perf_counter()
+        result = stage.run(**kwargs)
+        return result, round(time.perf_counter() - started, 3)
+
+    def _check_graph(self) -> None:
+        """Reject unknown inputs and cycles up front instead of hanging"""
+        for stage in self.stages.values():
+            for dep in stage.inputs:
+                if dep not in self.stages:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+        resolved = set()
+        remaining = dict(self.stages)
+        while remaining:
+            ready = [name for name, stage in remaining.items() if set(stage.inputs) <= resolved]
+            if not ready:
+                raise ValueError(f"Stage dependency cycle among: {', '.join(sorted(remaining))}")
+            for name in ready:
+                resolved.add(name)
+                del remaining[name]
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_stage_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide stage executor. Its size (ai.parallel_stages in
+    config.yaml) bounds how many stages - and so LLM calls - run at once
+    across all pipelines.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            try:
+                config = load_yaml(get_project_root() / 'config' / 'config.yaml').get('ai') or {}
+            except Exception:
+                config = {}
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, int(config.get('parallel_stages', 2))),
+                thread_name_prefix='pipeline-stage'
+            )
+        return _executor
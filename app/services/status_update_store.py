@@ -0,0 +1,204 @@
+"""Structured status-update records, stored next to the update pages they describe"""
+import html
+import json
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+UPDATES_LOG_FILENAME = 'updates.jsonl'
+
+_NOTES_START = re.compile(r'<div class="notes-text">')
+_LEGACY_NOTES_START = re.compile(r'<div class="notes">')
+
+
+def extract_notes_html(page_html: str) -> Optional[str]:
+    """
+    The notes HTML of a generated update page: the content of its
+    notes-text div (or the older notes div), nested divs included.
+    """
+    start_match = _NOTES_START.search(page_html) or _LEGACY_NOTES_START.search(page_html)
+    if not start_match:
+        return None
+    start_pos = pos = start_match.end()
+    depth = 1
+    while pos < len(page_html):
+        next_open = page_html.find('<div', pos)
+        next_close = page_html.find('</div>', pos)
+        if next_close == -1:
+            return None
+        if next_open != -1 and next_open < next_close:
+            depth += 1
+            pos = next_open + 4
+        else:
+            depth -= 1
+            if depth == 0:
+                return page_html[start_pos:next_close].strip() or None
+            pos = next_close + 6
+    return None
+
+
+def notes_to_text(notes_html: Optional[str]) -> Optional[str]:
+    """Plain text of notes HTML (tags dropped, entities decoded, whitespace collapsed); None if empty"""
+    if not notes_html:
+        return None
+    text = re.sub(r'</(p|div|br|li)>', '\n', notes_html, flags=re.IGNORECASE)
+    text = re.sub(r'<(p|div|br|li)[^>]*>', '\n', text, flags=re.IGNORECASE)
+    text = re.sub(r'<[^>]+>', ' ', text)
+    text = html.unescape(text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text or None
+
+
+def _status_from_filename(filename: str) -> str:
+    """Status encoded in an update page name (YYYYMMDDHHMMSS-[networking-Contact-]Status.html)"""
+    rest = Path(filename).stem.split('-', 1)[-1]
+    if rest.startswith('networking-'):
+        parts = rest.split('-', 2)
+        if len(parts) == 3:
+            return parts[2]
+    return rest
+
+
+# log path -> ((updates dir mtime, log signature), records)
+_records: Dict[str, Tuple[tuple, List[Dict]]] = {}
+_lock = threading.Lock()
+
+
+class StatusUpdateStore:
+    """
+    The status updates of one application or contact folder, kept as one
+    JSON record per line in updates/updates.jsonl:
+    {timestamp, status, notes_html, notes_text, file, ...}, where file is
+    the name of the generated HTML page (a derived view of the record).
+
+    Writers append a record when they write a page. Readers get every
+    record from one sequential read, cached until the folder changes. Pages
+    without a record (written before this log existed, or by hand) are
+    parsed once and added, and records whose page was deleted are dropped.
+    """
+
+    def __init__(self, folder_path: Path):
+        self.updates_dir = Path(folder_path) / 'updates'
+        self.log_path = self.updates_dir / UPDATES_LOG_FILENAME
+
+    def append(self, update_file: Path, timestamp: str, status: str, notes_html: Optional[str] = None, **extra) -> Dict:
+        """Record the update whose page was just written to update_file"""
+        notes_html = notes_html.strip() if notes_html and notes_html.strip() else None
+        record = {
+            'timestamp': timestamp,
+            'status': status,
+            'notes_html': notes_html,
+            'notes_text': notes_to_text(notes_html),
+            'file': Path(update_file).name,
+            **extra,
+        }
+        try:
+            with _lock:
+                with open(self.log_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        except OSError as e:
+            print(f"Warning: Could not record status update in {self.log_path}: {e}")
+        return record
+
+    def records(self) -> List[Dict]:
+        """All updates, oldest first (in page file name order); copies, so callers may modify them"""
+        key = str(self.log_path)
+        with _lock:
+            signature = self._signature()
+            if signature is None:
+                return []
+            cached = _records.get(key)
+            if cached is None or cached[0] != signature:
+                records = self._reconcile(self._read())
+                cached = _records[key] = (self._signature(), records)
+            return [dict(record) for record in cached[1]]
+
+    def by_file(self) -> Dict[str, Dict]:
+        """Records keyed by page file name"""
+        return {record['file']: record for record in self.records()}
+
+    def _signature(self) -> Optional[tuple]:
+        try:
+            dir_mtime = os.stat(self.updates_dir).st_mtime_ns
+        except OSError:
+            return None
+        try:
+            log_stat = os.stat(self.log_path)
+            return (dir_mtime, log_stat.st_mtime_ns, log_stat.st_size)
+        except OSError:
+            return (dir_mtime, None, None)
+
+    def _read(self) -> List[Dict]:
+        if not self.log_path.exists():
+            return []
+        records = []
+        try:
+            with open(self.log_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # A torn last line from an interrupted append
+                        continue
+        except OSError as e:
+            print(f"Warning: Could not read {self.log_path}: {e}")
+        return records
+
+    def _reconcile(self, records: List[Dict]) -> List[Dict]:
+        """Match the records to the pages on disk, rewriting the log if they differ"""
+        pages = sorted(entry.name for entry in os.scandir(self.updates_dir)
+                       if entry.name.endswith('.html') and entry.is_file())
+        # Last record per page wins, should one have been appended twice
+        by_file = {record.get('file'): record for record in records}
+        reconciled = []
+        changed = [record.get('file') for record in records] != pages
+        for name in pages:
+            record = by_file.get(name)
+            if record is None:
+                record = self._parse_page(name)
+            else:
+                # notes_text is derived; refresh records written by an older notes_to_text
+                notes_text = notes_to_text(record.get('notes_html'))
+                if record.get('notes_text') != notes_text:
+                    record['notes_text'] = notes_text
+                    changed = True
+            reconciled.append(record)
+        if changed:
+            self._write(reconciled)
+        return reconciled
+
+    def _parse_page(self, name: str) -> Dict:
+        notes_html = None
+        try:
+            with open(self.updates_dir / name, 'r', encoding='utf-8') as f:
+                notes_html = extract_notes_html(f.read())
+        except OSError as e:
+            print(f"Warning: Could not read update page {self.updates_dir / name}: {e}")
+        return {
+            'timestamp': name.split('-', 1)[0],
+            'status': _status_from_filename(name),
+            'notes_html': notes_html,
+            'notes_text': notes_to_text(notes_html),
+            'file': name,
+        }
+
+    def _write(self, records: List[Dict]) -> None:
+        """Rewrite the log atomically (temp file + rename)"""
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.updates_dir, prefix=f".{UPDATES_LOG_FILENAME}.")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            os.replace(tmp_path, self.log_path)
+        except OSError as e:
+            print(f"Warning: Could not rewrite {self.log_path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
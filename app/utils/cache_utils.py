@@ -1,15 +1,108 @@
-"""Simple file-based JSON cache utilities used by heavy analytics endpoints."""
+"""Two-tier (memory + disk) JSON cache utilities used by heavy analytics endpoints."""
 
 from __future__ import annotations
 
 import json
+import os
+import tempfile
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from app.utils.file_utils import ensure_dir_exists
 
 
+# Bounds for the in-process memory tier. Sizes are measured as the length of
+# the serialized JSON, which is a reasonable proxy for the parsed footprint.
+MEMORY_CACHE_MAX_ENTRIES = 256
+MEMORY_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class _MemoryTier:
+    """
+    Process-level LRU of parsed cache files.
+
+    Each entry remembers the (mtime, inode, size) of the file it was read from
+    or written to, so a hit costs one stat() instead of a read + json.load,
+    and a file rewritten by another process is never served stale.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # path -> (file signature, data, size in bytes)
+        self._entries: "OrderedDict[str, Tuple[tuple, Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, signature: tuple) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != signature:
+                return False, None
+            self._entries.move_to_end(key)
+            self.memory_hits += 1
+            return True, entry[1]
+
+    def put(self, key: str, signature: tuple, data: Any, size: int) -> None:
+        with self._lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                # Too large to keep in memory; the disk tier still serves it
+                return
+            self._entries[key] = (signature, data, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._discard(key)
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def record_disk_hit(self) -> None:
+        with self._lock:
+            self.disk_hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+
+_memory_tier = _MemoryTier(MEMORY_CACHE_MAX_ENTRIES, MEMORY_CACHE_MAX_BYTES)
+
+
+def _file_signature(cache_path: Path) -> Optional[tuple]:
+    try:
+        stat = os.stat(cache_path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+
+
 def is_cache_stale(cache_path: Path, ttl_seconds: int = 300) -> bool:
     """
     Return True if the cache file should be regenerated.
@@ -32,24 +125,82 @@ def is_cache_stale(cache_path: Path, ttl_seconds: int = 300) -> bool:
 
 
 def get_cached_json(cache_path: Path) -> Optional[Any]:
-    """Load JSON from cache_path if it exists; return None on any failure."""
-    if not cache_path.exists():
+    """
+    Load JSON from cache_path if it exists; return None on any failure.
+
+    Served from the in-process memory tier when the file is unchanged since
+    it was last read or written. The returned object is shared with the
+    memory tier and must not be mutated.
+    """
+    key = str(cache_path)
+    signature = _file_signature(cache_path)
+    if signature is None:
+        _memory_tier.discard(key)
+        _memory_tier.record_miss()
         return None
 
+    found, data = _memory_tier.get(key, signature)
+    if found:
+        return data
+
     try:
         with cache_path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+            data = json.load(f)
     except Exception:
         # If the cache is unreadable or invalid JSON, ignore it.
+        _memory_tier.record_miss()
         return None
 
+    _memory_tier.record_disk_hit()
+    _memory_tier.put(key, signature, data, signature[2])
+    return data
+
 
 def save_cached_json(cache_path: Path, data: Any) -> None:
-    """Persist data as JSON to cache_path, creating parent directories as needed."""
+    """
+    Persist data as compact JSON to cache_path, creating parent directories
+    as needed. The file is written atomically (temp file + rename), so
+    concurrent readers never see a partial cache file.
+    """
     ensure_dir_exists(cache_path.parent)
-    with cache_path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=f".{cache_path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    signature = _file_signature(cache_path)
+    if signature is not None:
+        _memory_tier.put(str(cache_path), signature, data, len(payload))
 
 
+def get_cache_stats() -> Dict[str, int]:
+    """Return memory-tier hit/miss/eviction counters and current usage."""
+    return _memory_tier.stats()
+
+
+def get_generation_cached_json(cache_path: Path, generation: Any) -> Optional[Any]:
+    """
+    Return the payload cached at cache_path if it was built from the given
+    data generation (see app.utils.data_generation); otherwise None.
+
+    Unlike the TTL-based helpers above, such an entry never expires on its
+    own - it is only replaced once the underlying data has changed.
+    """
+    entry = get_cached_json(cache_path)
+    if not isinstance(entry, dict) or "generation" not in entry:
+        return None
+    if entry["generation"] != generation:
+        return None
+    return entry.get("data")
 
 
+def save_generation_cached_json(cache_path: Path, data: Any, generation: Any) -> None:
+    """Persist data along with the data generation it was built from."""
+    save_cached_json(cache_path, {"generation": generation, "data": data})
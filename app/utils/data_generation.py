@@ -0,0 +1,58 @@
+"""Monotonic data generation counter used to invalidate derived caches."""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+from app.utils.file_utils import ensure_dir_exists, get_data_path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+_lock = threading.Lock()
+
+
+def _generation_path() -> Path:
+    return get_data_path('output') / 'data_generation'
+
+
+def current_generation() -> int:
+    """
+    Return the current data generation.
+
+    Every write to applications, contacts or the activity log bumps the
+    generation, so a cache built at generation N is valid for as long as
+    current_generation() still returns N.
+    """
+    try:
+        return int(_generation_path().read_text(encoding='utf-8').strip() or 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def bump_generation() -> int:
+    """Increment the data generation (safe across threads and processes) and return it."""
+    path = _generation_path()
+    ensure_dir_exists(path.parent)
+    with _lock:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            raw = os.read(fd, 64).decode('utf-8').strip()
+            try:
+                generation = int(raw or 0) + 1
+            except ValueError:
+                generation = 1
+            data = str(generation).encode('utf-8')
+            # Only ever grows in length, so no reader can see a truncated value
+            os.pwrite(fd, data, 0)
+            os.ftruncate(fd, len(data))
+            return generation
+        finally:
+            os.close(fd)  # also releases the flock
@@ -0,0 +1,150 @@
+"""Persistent record id -> folder index for the folder-per-record data directories"""
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from app.utils.file_utils import ensure_dir_exists, load_yaml
+
+
+class IdIndex:
+    """
+    Maps record ids to folder names inside a data directory (applications,
+    archived applications, networking contacts) so a single record can be
+    located without loading every metadata file.
+
+    The index is persisted as JSON and rebuilt lazily: when the index file is
+    missing, or when an id is not found and the directory has changed since
+    the last rebuild. Entries whose folder has disappeared are dropped on
+    lookup.
+    """
+
+    def __init__(
+        self,
+        root_dir: Path,
+        index_path: Path,
+        metadata_filename: str,
+        scan: Optional[Callable[[], Dict[str, str]]] = None
+    ):
+        self.root_dir = Path(root_dir)
+        self.index_path = Path(index_path)
+        self.metadata_filename = metadata_filename
+        self._scan = scan or self._scan_metadata_files
+        self._lock = threading.RLock()
+        self._folders: Optional[Dict[str, str]] = None
+        self._built_root_mtime: Optional[int] = None
+
+    def lookup(self, record_id: str) -> Optional[Path]:
+        """Return the folder holding record_id, or None if there is no such record"""
+        with self._lock:
+            self._ensure_loaded()
+            folder_path = self._existing_folder(record_id)
+            if folder_path is None and self._root_mtime() != self._built_root_mtime:
+                # New folders may have appeared since the index was built
+                self.rebuild()
+                folder_path = self._existing_folder(record_id)
+            return folder_path
+
+    def set(self, record_id: str, folder_path: Path) -> None:
+        """Record that record_id lives in folder_path"""
+        with self._lock:
+            self._ensure_loaded()
+            folder_name = Path(folder_path).name
+            if self._folders.get(record_id) != folder_name:
+                self._folders[record_id] = folder_name
+                self._save()
+
+    def remove(self, record_id: str) -> None:
+        """Forget record_id"""
+        with self._lock:
+            self._ensure_loaded()
+            if self._folders.pop(record_id, None) is not None:
+                self._save()
+
+    def rebuild(self) -> None:
+        """Rescan the data directory and rewrite the index"""
+        with self._lock:
+            self._built_root_mtime = self._root_mtime()
+            self._folders = self._scan()
+            self._save()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _existing_folder(self, record_id: str) -> Optional[Path]:
+        folder_name = self._folders.get(record_id)
+        if folder_name is None:
+            return None
+        folder_path = self.root_dir / folder_name
+        if not (folder_path / self.metadata_filename).exists():
+            # Folder was moved or deleted behind our back
+            del self._folders[record_id]
+            self._save()
+            return None
+        return folder_path
+
+    def _ensure_loaded(self) -> None:
+        if self._folders is not None:
+            return
+        try:
+            with self.index_path.open('r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._folders = dict(data['ids'])
+            self._built_root_mtime = data.get('root_mtime_ns')
+        except Exception:
+            # Missing or unreadable index - build it from the folders on disk
+            self.rebuild()
+
+    def _root_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.root_dir).st_mtime_ns
+        except OSError:
+            return None
+
+    def _scan_metadata_files(self) -> Dict[str, str]:
+        folders = {}
+        if not self.root_dir.exists():
+            return folders
+        for folder_path in self.root_dir.iterdir():
+            metadata_path = folder_path / self.metadata_filename
+            if folder_path.is_dir() and metadata_path.exists():
+                try:
+                    record_id = load_yaml(metadata_path).get('id')
+                except Exception as e:
+                    print(f"Warning: Could not index {folder_path.name}: {e}")
+                    continue
+                if record_id:
+                    folders[record_id] = folder_path.name
+        return folders
+
+    def _save(self) -> None:
+        """Write the index atomically (temp file + rename)"""
+        tmp_path = None
+        try:
+            ensure_dir_exists(self.index_path.parent)
+            fd, tmp_path = tempfile.mkstemp(dir=self.index_path.parent, prefix=f".{self.index_path.name}.")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'root_mtime_ns': self._built_root_mtime, 'ids': self._folders}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"Warning: Could not save id index {self.index_path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+
+_indexes: Dict[Path, IdIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_id_index(root_dir: Path, index_path: Path, metadata_filename: str) -> IdIndex:
+    """Return the process-wide id index for a data directory"""
+    root_dir = Path(root_dir).resolve()
+    with _indexes_lock:
+        index = _indexes.get(root_dir)
+        if index is None:
+            index = IdIndex(root_dir, index_path, metadata_filename)
+            _indexes[root_dir] = index
+        return index
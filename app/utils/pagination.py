@@ -0,0 +1,90 @@
+"""Cursor (keyset) pagination over records kept in a sorted key order"""
+import base64
+import json
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.utils.file_utils import get_project_root, load_yaml
+
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 200
+
+
+def listing_defaults() -> Dict:
+    """The dashboard section of config.yaml: items_per_page, sort_by and sort_order"""
+    try:
+        config = load_yaml(get_project_root() / 'config' / 'config.yaml').get('dashboard') or {}
+    except Exception:
+        config = {}
+    return {
+        'items_per_page': config.get('items_per_page') or DEFAULT_PAGE_SIZE,
+        'sort_by': config.get('sort_by') or 'created_at',
+        'sort_order': config.get('sort_order') or 'desc',
+    }
+
+
+def page_size(limit: Optional[str], default: int) -> int:
+    """Parse a requested page size, falling back to default and capped at MAX_PAGE_SIZE"""
+    if limit in (None, ''):
+        return max(1, min(int(default), MAX_PAGE_SIZE))
+    try:
+        value = int(limit)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid limit: {limit!r}")
+    return max(1, min(value, MAX_PAGE_SIZE))
+
+
+def encode_cursor(sort_by: str, sort_order: str, key: Sequence) -> str:
+    """Opaque cursor pointing just past the record with the given sort key"""
+    payload = json.dumps({'s': sort_by, 'o': sort_order, 'k': list(key)}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, sort_by: str, sort_order: str) -> tuple:
+    """Return the sort key a cursor points past; ValueError if it is malformed or for another ordering"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+        key = tuple(payload['k'])
+        cursor_sort = (payload['s'], payload['o'])
+    except (ValueError, TypeError, KeyError, UnicodeError):
+        raise ValueError("Invalid cursor")
+    if cursor_sort != (sort_by, sort_order):
+        raise ValueError("Cursor was issued for a different sort order")
+    return key
+
+
+def keyset_page(
+    keys: List[tuple],
+    after: Optional[tuple],
+    limit: int,
+    descending: bool = False,
+    accept: Optional[Callable[[int], bool]] = None
+) -> Tuple[List[int], bool]:
+    """
+    Return the positions in keys (sorted ascending, unique) of the next
+    limit records after the cursor key, walking in the requested direction
+    and skipping positions accept rejects, plus whether more records follow.
+
+    The start is found by bisection, so a page costs O(log n + page size)
+    when nothing is filtered out.
+    """
+    try:
+        if descending:
+            start = bisect_left(keys, after) if after is not None else len(keys)
+            positions = range(start - 1, -1, -1)
+        else:
+            start = bisect_right(keys, after) if after is not None else 0
+            positions = range(start, len(keys))
+    except TypeError:
+        raise ValueError("Invalid cursor")
+
+    page = []
+    for position in positions:
+        if accept is not None and not accept(position):
+            continue
+        if len(page) == limit:
+            return page, True
+        page.append(position)
+    return page, False
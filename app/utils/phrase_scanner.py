@@ -0,0 +1,60 @@
+"""Single-pass multi-phrase search with regex word-boundary semantics"""
+from typing import Iterable, Set
+
+
+_END = None  # Trie key marking the end of a phrase
+
+
+class PhraseScanner:
+    """
+    Finds which of a fixed set of phrases occur in a text, as if each phrase
+    had been searched with re.search(r'\\b' + re.escape(phrase) + r'\\b', text).
+
+    The phrases are compiled once into a character trie. A scan walks the
+    trie from every word-boundary position of the text, so its cost depends
+    on the text length and phrase depth, not on the number of phrases.
+    Matching is case-sensitive; callers lowercase both sides as needed.
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        self._trie = {}
+        self.phrases: Set[str] = set()
+        for phrase in phrases:
+            if not isinstance(phrase, str) or not phrase or phrase in self.phrases:
+                continue
+            self.phrases.add(phrase)
+            node = self._trie
+            for char in phrase:
+                node = node.setdefault(char, {})
+            node[_END] = phrase
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+    def find_all(self, text: str) -> Set[str]:
+        """Return the set of phrases that occur in text between word boundaries"""
+        found = set()
+        if not self._trie or not text:
+            return found
+        # Same notion of a word character as re's \b for str patterns
+        is_word = [char.isalnum() or char == '_' for char in text]
+        length = len(text)
+        trie = self._trie
+        previous = False
+        for start in range(length):
+            current = is_word[start]
+            at_boundary = previous != current
+            previous = current
+            if not at_boundary:
+                continue
+            node = trie.get(text[start])
+            end = start
+            while node is not None:
+                end += 1
+                phrase = node.get(_END)
+                if phrase is not None and is_word[end - 1] != (is_word[end] if end < length else False):
+                    found.add(phrase)
+                if end >= length:
+                    break
+                node = node.get(text[end])
+        return found
@@ -0,0 +1,77 @@
+"""Pre-serialized response cache for read-only JSON API endpoints."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import date
+from functools import wraps
+from typing import Callable, Hashable, Optional, Tuple
+
+from flask import Response, make_response, request
+
+from app.utils.data_generation import current_generation
+
+
+RESPONSE_CACHE_MAX_ENTRIES = 128
+
+_responses: "OrderedDict[Hashable, Tuple[bytes, str]]" = OrderedDict()
+_responses_lock = threading.Lock()
+
+
+def _get(key: Hashable) -> Optional[Tuple[bytes, str]]:
+    with _responses_lock:
+        entry = _responses.get(key)
+        if entry is not None:
+            _responses.move_to_end(key)
+        return entry
+
+
+def _put(key: Hashable, entry: Tuple[bytes, str]) -> None:
+    with _responses_lock:
+        _responses[key] = entry
+        _responses.move_to_end(key)
+        while len(_responses) > RESPONSE_CACHE_MAX_ENTRIES:
+            _responses.popitem(last=False)
+
+
+def cached_json_response(vary_by_day: bool = False) -> Callable:
+    """
+    Cache a GET view's encoded JSON body per (route, query args, data generation).
+
+    The cached bytes are served directly with a strong ETag, and requests
+    carrying a matching If-None-Match get an empty 304. Entries become
+    unreachable as soon as any write bumps the data generation. Set
+    vary_by_day for payloads with values relative to today (e.g. "days since
+    update"). Only successful JSON responses are cached.
+    """
+    def decorator(view: Callable) -> Callable:
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = (
+                request.endpoint,
+                tuple(sorted(request.args.items(multi=True))),
+                current_generation(),
+                date.today().isoformat() if vary_by_day else None,
+            )
+            entry = _get(key)
+            if entry is None:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200 or not response.is_json or response.direct_passthrough:
+                    return response
+                body = response.get_data()
+                entry = (body, hashlib.sha256(body).hexdigest()[:32])
+                _put(key, entry)
+
+            body, etag = entry
+            if request.if_none_match.contains(etag):
+                response = Response(status=304)
+            else:
+                response = Response(body, mimetype='application/json')
+            response.set_etag(etag)
+            # Let clients keep the body but always revalidate with the ETag
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        return wrapper
+    return decorator
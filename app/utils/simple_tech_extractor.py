@@ -1,8 +1,9 @@
 """Simplified technology extraction and comparison system"""
 
-import re
 from typing import Dict, List, Set, Tuple
 
+from app.utils.tech_mentions import TechnologyCatalog
+
 
 class SimpleTechExtractor:
     """Simple, clean technology extraction and comparison"""
@@ -158,6 +159,9 @@ class SimpleTechExtractor:
         'Cursor AI': ['cursor ai', 'cursor'],
     }
     
+    # Compiled once for all instances (see app.utils.tech_mentions)
+    _catalog = TechnologyCatalog(TECHNOLOGIES)
+    
     def __init__(self):
         """Initialize the simple tech extractor"""
         pass
@@ -169,23 +173,20 @@ class SimpleTechExtractor:
         Returns:
             List of technology names found in the text
         """
-        text_lower = text.lower()
-        found_technologies = []
-        
-        for tech_name, variations in self.TECHNOLOGIES.items():
-            for variation in variations:
-                # Check if variation is a regex pattern
-                if variation.startswith(r'\b'):
-                    if re.search(variation, text_lower, re.IGNORECASE):
-                        found_technologies.append(tech_name)
-                        break
-                else:
-                    # Simple substring search
-                    if variation in text_lower:
-                        found_technologies.append(tech_name)
-                        break
+        return sorted(self._catalog.find(text))
+    
+    def find_technology_mentions(self, text: str) -> Dict[str, Dict[str, List[Tuple[int, int]]]]:
+        """
+        Find where each technology is mentioned.
         
-        return sorted(list(set(found_technologies)))  # Remove duplicates and sort
+        Returns:
+            {technology: {variation: [(start, end), ...]}} with spans into text.lower()
+        """
+        return self._catalog.find(text)
+    
+    def is_known_technology(self, skill: str) -> bool:
+        """Check if a skill is a technology name or one of its variations (case-insensitive)"""
+        return self._catalog.is_known(skill)
     
     def compare_technologies(self, job_description: str, resume: str) -> Dict[str, any]:
         """
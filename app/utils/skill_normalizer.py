@@ -3,12 +3,176 @@ Advanced Skill Normalization Service
 Supports configurable taxonomy, aliases, and fuzzy matching
 """
 
+import atexit
+import hashlib
+import json
+import os
 import re
+import tempfile
+import threading
 import yaml
+from collections import Counter, OrderedDict
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Tuple
 from difflib import SequenceMatcher
 
+from app.utils.file_utils import ensure_dir_exists, get_data_path
+
+
+# Most normalize() results kept per taxonomy (and in its sidecar file)
+NORMALIZATION_MEMO_MAX_ENTRIES = 20000
+# New results gathered before the sidecar file is rewritten
+NORMALIZATION_MEMO_FLUSH_EVERY = 50
+
+
+class _FuzzyIndex:
+    """
+    Length buckets and character counts for every alias, used to skip
+    aliases whose SequenceMatcher ratio provably cannot reach the threshold.
+
+    ratio() is 2*M/T, where T is the combined length and M the matched
+    characters. M can exceed neither the shorter length nor the characters
+    the two strings have in common (the real_quick_ratio and quick_ratio
+    bounds). Only aliases whose bound clears the threshold are compared,
+    highest bound first, stopping once no remaining bound can beat the best
+    score. Ties resolve to the earliest alias, exactly like a full scan in
+    alias_map order.
+    """
+
+    def __init__(self, alias_map: Dict[str, str]):
+        self.by_length: Dict[int, List[Tuple[int, str, str, Counter]]] = {}
+        for order, (alias, canonical) in enumerate(alias_map.items()):
+            self.by_length.setdefault(len(alias), []).append((order, alias, canonical, Counter(alias)))
+        self.lengths = sorted(self.by_length)
+
+    def best_match(self, text: str, threshold: float) -> Optional[str]:
+        text_length = len(text)
+        text_counts = Counter(text)
+        candidates = []
+        for alias_length in self.lengths:
+            total = text_length + alias_length
+            if not total or 2.0 * min(text_length, alias_length) / total < threshold:
+                continue
+            for order, alias, canonical, alias_counts in self.by_length[alias_length]:
+                if alias == text:
+                    continue
+                common = sum(min(count, alias_counts[char]) for char, count in text_counts.items())
+                bound = 2.0 * common / total
+                if bound >= threshold and bound > 0:
+                    candidates.append((bound, order, alias, canonical))
+
+        candidates.sort(key=lambda candidate: (-candidate[0], candidate[1]))
+        best_match = None
+        best_score = 0.0
+        best_order = None
+        for bound, order, alias, canonical in candidates:
+            if bound < best_score:
+                break
+            if bound == best_score and order > best_order:
+                continue
+            score = SequenceMatcher(None, text, alias).ratio()
+            if score > best_score or (score == best_score and best_match is not None and order < best_order):
+                best_match, best_score, best_order = canonical, score, order
+        # The bounds only prune; the actual ratio must still clear the threshold
+        return best_match if best_score >= threshold else None
+
+
+class _NormalizationMemo:
+    """
+    Bounded LRU of normalize() results - including None - for one taxonomy,
+    persisted to a JSON sidecar so new processes start warm. The sidecar
+    records the taxonomy hash it was built for and is ignored when that no
+    longer matches, so edits to the YAML invalidate it.
+    """
+
+    def __init__(self, path: Path, config_hash: str):
+        self.path = path
+        self.config_hash = config_hash
+        self._entries: "OrderedDict[Tuple[bool, str], Optional[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._unsaved = 0
+        for key, value in self._read_sidecar().items():
+            self._entries[key] = value
+
+    def get(self, key: Tuple[bool, str]) -> Tuple[bool, Optional[str]]:
+        """Return (found, canonical name or None)"""
+        with self._lock:
+            if key not in self._entries:
+                return False, None
+            self._entries.move_to_end(key)
+            return True, self._entries[key]
+
+    def put(self, key: Tuple[bool, str], value: Optional[str], flush: bool = True) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > NORMALIZATION_MEMO_MAX_ENTRIES:
+                self._entries.popitem(last=False)
+            self._unsaved += 1
+            due = flush and self._unsaved >= NORMALIZATION_MEMO_FLUSH_EVERY
+        if due:
+            self.save()
+
+    def save(self) -> None:
+        """Merge in entries other processes saved, then write the sidecar atomically"""
+        with self._lock:
+            if not self._unsaved:
+                return
+            entries = self._read_sidecar()
+            entries.update(self._entries)
+            entries = list(entries.items())[-NORMALIZATION_MEMO_MAX_ENTRIES:]
+            self._unsaved = 0
+        tmp_path = None
+        try:
+            ensure_dir_exists(self.path.parent)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'config_hash': self.config_hash,
+                    'entries': [[fuzzy, name, value] for (fuzzy, name), value in entries],
+                }, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: Could not save skill normalization memo {self.path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def _read_sidecar(self) -> "OrderedDict[Tuple[bool, str], Optional[str]]":
+        entries = OrderedDict()
+        if not self.path.exists():
+            return entries
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('config_hash') == self.config_hash:
+                for fuzzy, name, value in data.get('entries', []):
+                    entries[(bool(fuzzy), name)] = value
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            print(f"Warning: Ignoring unreadable skill normalization memo {self.path}: {e}")
+        return entries
+
+
+_memos: Dict[Tuple[Path, str], _NormalizationMemo] = {}
+_memos_lock = threading.Lock()
+
+
+def _get_memo(path: Path, config_hash: str) -> _NormalizationMemo:
+    """Return the process-wide memo for a taxonomy, shared by all SkillNormalizer instances"""
+    with _memos_lock:
+        memo = _memos.get((path, config_hash))
+        if memo is None:
+            memo = _NormalizationMemo(path, config_hash)
+            _memos[(path, config_hash)] = memo
+        return memo
+
+
+@atexit.register
+def _save_memos() -> None:
+    with _memos_lock:
+        memos = list(_memos.values())
+    for memo in memos:
+        memo.save()
+
 
 class SkillNormalizer:
     """
@@ -38,6 +202,10 @@ class SkillNormalizer:
         self.alias_map = self._build_alias_map()
         self.canonical_names = set(self.config.get('skills', {}).keys())
         self.similarity_threshold = self.config.get('fuzzy_rules', {}).get('similarity_threshold', 0.85)
+        # Built on first fuzzy match; rebuilt whenever alias_map is replaced
+        self._fuzzy_index: Optional[_FuzzyIndex] = None
+        self._fuzzy_index_source: Optional[Dict[str, str]] = None
+        self._memo = self._open_memo()
         
     def _load_config(self) -> Dict:
         """Load configuration from YAML file."""
@@ -49,6 +217,19 @@ class SkillNormalizer:
         
         return config or {}
     
+    @property
+    def config_hash(self) -> str:
+        """Hash identifying the taxonomy (and threshold) results are computed with"""
+        return self._memo.config_hash
+    
+    def _open_memo(self) -> _NormalizationMemo:
+        """Memo of normalize() results for the taxonomy as currently configured"""
+        config_hash = hashlib.sha256(
+            json.dumps([self.config, self.similarity_threshold], sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()
+        sidecar = get_data_path('output') / f"{self.config_path.stem}.memo.json"
+        return _get_memo(sidecar, config_hash)
+    
     def _build_alias_map(self) -> Dict[str, str]:
         """
         Build reverse mapping from aliases to canonical names.
@@ -142,6 +323,9 @@ class SkillNormalizer:
         """
         Normalize a skill name to its canonical form.
         
+        Results (including misses) are memoized per taxonomy and persisted
+        to data/output, so repeated names skip matching entirely.
+        
         Args:
             skill_name: Input skill name
             fuzzy: Enable fuzzy matching if exact match not found
@@ -149,10 +333,21 @@ class SkillNormalizer:
         Returns:
             Canonical name if found, None otherwise
         """
+        return self._memoized_normalize(skill_name, fuzzy)
+    
+    def _memoized_normalize(self, skill_name: str, fuzzy: bool, flush: bool = True) -> Optional[str]:
         # Early return for empty input
         if not skill_name or not skill_name.strip():
             return None
         
+        key = (bool(fuzzy), skill_name)
+        found, result = self._memo.get(key)
+        if not found:
+            result = self._normalize_uncached(skill_name, fuzzy)
+            self._memo.put(key, result, flush=flush)
+        return result
+    
+    def _normalize_uncached(self, skill_name: str, fuzzy: bool) -> Optional[str]:
         # Normalize the input
         normalized_input = self._normalize_string(skill_name)
         
@@ -190,27 +385,13 @@ class SkillNormalizer:
         Returns:
             Canonical name if similarity above threshold, None otherwise
         """
-        best_match = None
-        best_score = 0.0
-        
-        # Compare against all aliases
-        for alias, canonical in self.alias_map.items():
-            # Skip if already tested exact
-            if alias == text:
-                continue
-            
-            # Calculate similarity score
-            score = SequenceMatcher(None, text, alias).ratio()
-            
-            if score > best_score:
-                best_score = score
-                best_match = canonical
-        
-        # Return only if above threshold
-        if best_score >= self.similarity_threshold:
-            return best_match
-        
-        return None
+        # Same result as comparing against every alias, but only the few
+        # aliases that could reach the threshold are compared (see _FuzzyIndex)
+        index = self._fuzzy_index
+        if index is None or self._fuzzy_index_source is not self.alias_map:
+            index = _FuzzyIndex(self.alias_map)
+            self._fuzzy_index, self._fuzzy_index_source = index, self.alias_map
+        return index.best_match(text, self.similarity_threshold)
     
     def get_category(self, canonical_name: str) -> Optional[str]:
         """
@@ -332,7 +513,9 @@ class SkillNormalizer:
         Returns:
             Dictionary mapping original -> canonical
         """
-        return {skill: self.normalize(skill, fuzzy=fuzzy) for skill in skill_names}
+        results = {skill: self._memoized_normalize(skill, fuzzy, flush=False) for skill in skill_names}
+        self._memo.save()
+        return results
     
     def add_skill(self, canonical_name: str, aliases: List[str], 
                   category: Optional[str] = None, tags: Optional[List[str]] = None,
@@ -363,6 +546,7 @@ class SkillNormalizer:
         # Rebuild alias map
         self.alias_map = self._build_alias_map()
         self.canonical_names.add(canonical_name)
+        self._memo = self._open_memo()
     
     def save_config(self, output_path: Optional[str] = None) -> None:
         """
@@ -0,0 +1,33 @@
+"""Shared helpers for the app's SQLite databases (job queue, search index)"""
+import sqlite3
+from pathlib import Path
+
+
+class ClosingConnection:
+    """sqlite3 connection context manager that also closes the connection"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if self.conn.in_transaction:
+                if exc_type is None:
+                    self.conn.commit()
+                else:
+                    self.conn.rollback()
+        finally:
+            self.conn.close()
+
+
+def connect(db_path: Path) -> ClosingConnection:
+    """
+    Open db_path in autocommit mode (transactions are started explicitly,
+    e.g. BEGIN IMMEDIATE) with rows as sqlite3.Row; use as a context manager.
+    """
+    conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    return ClosingConnection(conn)
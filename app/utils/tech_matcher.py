@@ -1,8 +1,9 @@
 """Technology matching utility - uses string matching instead of AI to avoid hallucination"""
-import re
 from typing import Dict, List, Set, Tuple
 from difflib import SequenceMatcher
 
+from app.utils.tech_mentions import TechnologyCatalog
+
 
 class TechnologyMatcher:
     """Matches technologies between job descriptions and resumes using direct string comparison"""
@@ -351,6 +352,9 @@ class TechnologyMatcher:
         'dataops': ['dataops', 'data ops'],
     }
     
+    # Compiled once for all instances (see app.utils.tech_mentions)
+    _catalog = TechnologyCatalog(TECHNOLOGIES)
+    
     def __init__(self):
         """Initialize the technology matcher"""
         self.fuzzy_threshold = 0.85  # Threshold for fuzzy string matching
@@ -362,25 +366,10 @@ class TechnologyMatcher:
         Returns:
             Dict with technology names as keys and list of matched variations as values
         """
-        text_lower = text.lower()
-        found_technologies = {}
-        
-        for tech_name, variations in self.TECHNOLOGIES.items():
-            matches = []
-            for variation in variations:
-                # Check if variation is a regex pattern
-                if variation.startswith(r'\b'):
-                    if re.search(variation, text_lower, re.IGNORECASE):
-                        matches.append(variation)
-                else:
-                    # Simple substring search
-                    if variation in text_lower:
-                        matches.append(variation)
-            
-            if matches:
-                found_technologies[tech_name] = matches
-        
-        return found_technologies
+        return {
+            tech_name: list(variations)
+            for tech_name, variations in self._catalog.find(text).items()
+        }
     
     def compare_technologies(self, job_description: str, resume: str) -> Dict[str, any]:
         """
@@ -0,0 +1,193 @@
+"""Single-pass technology mention scanning shared by the technology extractors"""
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Scans kept (per text hash) so the same resume or job description is only scanned once
+SCAN_CACHE_MAX_ENTRIES = 256
+
+# r'\bword\b' variations whose body is plain text can be matched by the automaton itself
+_WORD_BOUNDED = re.compile(r'\\b([\w ]+)\\b')
+
+Span = Tuple[int, int]
+
+
+def _is_word_char(char: str) -> bool:
+    # Same notion of a word character as re's \b for str patterns
+    return char.isalnum() or char == '_'
+
+
+class MentionScanner:
+    """
+    Aho-Corasick automaton over a fixed set of technology variations.
+
+    Variations are matched the way the extractors always have: plain ones
+    as substrings anywhere in the lowercased text, and r'\\b...\\b' ones as
+    regexes (those with a plain-text body are matched by the automaton with
+    a boundary check, anything else falls back to a precompiled regex).
+    scan() finds every occurrence of every variation in one pass over the
+    text, whatever the number of variations.
+    """
+
+    def __init__(self, variations: Iterable[str]):
+        self.variations: List[str] = []
+        # The automaton: goto transitions, failure links and, per state, the
+        # (literal, variation, word bounded) entries that end there
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, str, bool]]] = [[]]
+        self._regexes: List[Tuple[str, re.Pattern]] = []
+
+        for variation in dict.fromkeys(variations):
+            if not isinstance(variation, str) or not variation:
+                continue
+            self.variations.append(variation)
+            if variation.startswith(r'\b'):
+                bounded = _WORD_BOUNDED.fullmatch(variation)
+                if bounded is None:
+                    self._regexes.append((variation, re.compile(variation, re.IGNORECASE)))
+                    continue
+                self._add(bounded.group(1), variation, True)
+            else:
+                self._add(variation, variation, False)
+        self._link()
+
+    def scan(self, text_lower: str) -> Dict[str, List[Span]]:
+        """Return {variation: [(start, end), ...]} for every variation found in text_lower"""
+        found: Dict[str, List[Span]] = {}
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for index, char in enumerate(text_lower):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                end = index + 1
+                for length, variation, word_bounded in out[state]:
+                    start = end - length
+                    if word_bounded and not self._at_boundaries(text_lower, start, end):
+                        continue
+                    found.setdefault(variation, []).append((start, end))
+        for variation, regex in self._regexes:
+            spans = [match.span() for match in regex.finditer(text_lower)]
+            if spans:
+                found[variation] = spans
+        return found
+
+    def _add(self, literal: str, variation: str, word_bounded: bool) -> None:
+        state = 0
+        for char in literal:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._out[state].append((len(literal), variation, word_bounded))
+
+    def _link(self) -> None:
+        """Breadth-first failure links; each state also reports what its fallback states report"""
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = link if link != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+                queue.append(next_state)
+
+    @staticmethod
+    def _at_boundaries(text: str, start: int, end: int) -> bool:
+        before = start > 0 and _is_word_char(text[start - 1])
+        after = end < len(text) and _is_word_char(text[end])
+        return before != _is_word_char(text[start]) and after != _is_word_char(text[end - 1])
+
+
+class TechnologyCatalog:
+    """
+    A technology -> variations mapping backed by the shared mention scanner.
+
+    Every catalog contributes its variations to one automaton, and scans are
+    cached by text hash, so the SimpleTechExtractor and TechnologyMatcher
+    lists are both answered from a single pass over each distinct text.
+    """
+
+    def __init__(self, technologies: Dict[str, List[str]]):
+        self.technologies = technologies
+        _register(variation for variations in technologies.values() for variation in variations)
+        # variation -> the technologies listing it, so results are built from what was found
+        self._owners: Dict[str, List[str]] = {}
+        for name, variations in technologies.items():
+            for variation in variations:
+                self._owners.setdefault(variation, []).append(name)
+        self._order = {name: index for index, name in enumerate(technologies)}
+        self._names_and_variations = {
+            value.lower()
+            for name, variations in technologies.items()
+            for value in [name, *variations]
+        }
+
+    def find(self, text: str) -> Dict[str, Dict[str, List[Span]]]:
+        """
+        Return {technology: {variation: spans}} for the technologies mentioned
+        in text, variations in catalog order. Spans index into text.lower().
+        """
+        mentions = scan_mentions(text)
+        names = {name for variation in mentions for name in self._owners.get(variation, ())}
+        found = {}
+        for name in sorted(names, key=self._order.__getitem__):
+            found[name] = {
+                variation: mentions[variation]
+                for variation in self.technologies[name] if variation in mentions
+            }
+        return found
+
+    def is_known(self, skill: str) -> bool:
+        """True if skill is (case-insensitively) a technology name or one of its variations"""
+        return skill.lower() in self._names_and_variations
+
+
+_variations: Dict[str, None] = {}
+_scanner: Optional[MentionScanner] = None
+_scans: "OrderedDict[str, Dict[str, List[Span]]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _register(variations: Iterable[str]) -> None:
+    global _scanner
+    with _lock:
+        before = len(_variations)
+        _variations.update(dict.fromkeys(variations))
+        if len(_variations) != before:
+            # Recompiled on the next scan; earlier scans may lack the new variations
+            _scanner = None
+            _scans.clear()
+
+
+def scan_mentions(text: str) -> Dict[str, List[Span]]:
+    """Return {variation: spans} for every registered variation in text (cached by text hash)"""
+    global _scanner
+    text_lower = (text or '').lower()
+    key = hashlib.sha256(text_lower.encode('utf-8')).hexdigest()
+    with _lock:
+        mentions = _scans.get(key)
+        if mentions is not None:
+            _scans.move_to_end(key)
+            return mentions
+        if _scanner is None:
+            _scanner = MentionScanner(_variations)
+        scanner = _scanner
+    mentions = scanner.scan(text_lower)
+    with _lock:
+        if scanner is _scanner:
+            _scans[key] = mentions
+            while len(_scans) > SCAN_CACHE_MAX_ENTRIES:
+                _scans.popitem(last=False)
+    return mentions
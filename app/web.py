@@ -25,9 +25,19 @@ from app.services.networking_processor import NetworkingProcessor
 from app.services.networking_document_generator import NetworkingDocumentGenerator
 from app.services.activity_log_service import ActivityLogService
 from app.services.contact_count_cache import ContactCountCache
+from app.services.llm_response_cache import bypass_llm_cache
+from app.services.generation_stream import stream_stage, sse_events, finish as finish_stream
+from app.services.job_queue import get_job_queue
+from app.services.bulk_importer import BulkImporter, parse_jsonl
+from app.services.match_rescorer import MatchRescorer
+from app.services.search_index import get_search_index
+from app.services.application_repository import APPLICATION_SORT_KEYS
 from app.utils.datetime_utils import format_for_display
 from app.utils.file_utils import get_project_root, get_data_path, load_yaml
-from app.utils.cache_utils import is_cache_stale, get_cached_json, save_cached_json
+from app.utils.cache_utils import get_generation_cached_json, save_generation_cached_json
+from app.utils.data_generation import current_generation
+from app.utils.response_cache import cached_json_response
+from app.utils.pagination import listing_defaults, page_size, encode_cursor, decode_cursor, keyset_page
 from app.utils.input_sanitizer import sanitize_text, sanitize_email, sanitize_phone
 
 app = Flask(__name__, 
@@ -770,10 +780,138 @@ def _is_rejected_status(status: str) -> bool:
     normalized = normalize_status_label(status)
     return normalized == 'rejected'
 
+# Any of these switches the listing APIs from the full list to one page
+LISTING_PAGE_ARGS = (
+    'cursor', 'limit', 'sort', 'order', 'status', 'company',
+    'created_after', 'created_before', 'min_match_score', 'max_match_score', 'type'
+)
+
+
+def _wants_page() -> bool:
+    return any(arg in request.args for arg in LISTING_PAGE_ARGS)
+
+
+def _listing_order(default_sort: str, default_order: str, sort_fields) -> tuple:
+    """Validated (sort, order, limit, cursor key) from the request, defaults from config.yaml's dashboard section"""
+    defaults = listing_defaults()
+    sort_by = request.args.get('sort') or default_sort or defaults['sort_by']
+    sort_order = (request.args.get('order') or default_order or defaults['sort_order']).lower()
+    if sort_by not in sort_fields:
+        raise ValueError(f"Invalid sort field: {sort_by} (expected one of {', '.join(sort_fields)})")
+    if sort_order not in ('asc', 'desc'):
+        raise ValueError(f"Invalid sort order: {sort_order} (expected asc or desc)")
+    limit = page_size(request.args.get('limit'), defaults['items_per_page'])
+    cursor = request.args.get('cursor')
+    after = decode_cursor(cursor, sort_by, sort_order) if cursor else None
+    return sort_by, sort_order, limit, after
+
+
+def _datetime_arg(name: str):
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).replace(tzinfo=None)
+    except ValueError:
+        raise ValueError(f"Invalid {name}: {value} (expected an ISO date or datetime)")
+
+
+def _float_arg(name: str):
+    value = request.args.get(name)
+    if value in (None, ''):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"Invalid {name}: {value}")
+
+
+def _list_arg(name: str):
+    values = [value.strip() for value in request.args.get(name, '').split(',') if value.strip()]
+    return values or None
+
+
+def _application_list_item(app) -> dict:
+    return {
+        'id': app.id,
+        'company': app.company,
+        'job_title': app.job_title,
+        'status': app.status,
+        'created_at': app.created_at.isoformat(),
+        'status_updated_at': app.status_updated_at.isoformat() if app.status_updated_at else None,
+        'match_score': app.match_score,
+        'posted_date': app.posted_date,
+        'job_url': app.job_url,
+        'salary_range': app.salary_range,
+        'location': app.location,
+        'hiring_manager': app.hiring_manager,
+        'summary_path': str(app.summary_path) if app.summary_path else None,
+        'flagged': app.flagged
+    }
+
+
+def _applications_page():
+    """
+    One page of active applications, filtered and sorted server-side.
+
+    Query args: status (comma-separated; rejected applications are only
+    included when asked for), company, flagged, created_after/created_before
+    (ISO, compared as local wall-clock time), min_match_score/max_match_score,
+    sort (see APPLICATION_SORT_KEYS), order (asc/desc), limit (default
+    dashboard.items_per_page) and cursor (next_cursor of the previous page).
+    """
+    sort_by, sort_order, limit, after = _listing_order(None, None, APPLICATION_SORT_KEYS)
+    statuses = _list_arg('status')
+    company = request.args.get('company') or None
+    flagged = request.args.get('flagged', '').lower()
+    created_after = _datetime_arg('created_after')
+    created_before = _datetime_arg('created_before')
+    min_score = _float_arg('min_match_score')
+    max_score = _float_arg('max_match_score')
+
+    def accept(app):
+        if statuses is None and _is_rejected_status(app.status):
+            return False
+        if flagged in ('true', 'false') and app.flagged != (flagged == 'true'):
+            return False
+        if created_after or created_before:
+            created = app.created_at.replace(tzinfo=None)
+            if (created_after and created < created_after) or (created_before and created > created_before):
+                return False
+        if min_score is not None and (app.match_score is None or app.match_score < min_score):
+            return False
+        if max_score is not None and (app.match_score is None or app.match_score > max_score):
+            return False
+        return True
+
+    applications, next_key = job_processor.list_applications_page(
+        sort_by=sort_by,
+        descending=sort_order == 'desc',
+        after=after,
+        limit=limit,
+        statuses=statuses,
+        company=company,
+        accept=accept
+    )
+    return jsonify({
+        'success': True,
+        'applications': [_application_list_item(app) for app in applications],
+        'count': len(applications),
+        'limit': limit,
+        'sort': sort_by,
+        'order': sort_order,
+        'next_cursor': encode_cursor(sort_by, sort_order, next_key) if next_key else None
+    })
+
+
 @app.route('/api/applications', methods=['GET'])
+@cached_json_response()
 def get_all_applications():
-    """Get all applications for dashboard cards"""
+    """Get all applications for dashboard cards (one page when paging, filter or sort args are given)"""
     try:
+        if _wants_page():
+            return _applications_page()
+
         applications = job_processor.list_all_applications()
         
         # Filter out rejected applications (they should only appear in archived dashboard)
@@ -786,150 +924,182 @@ def get_all_applications():
         elif flagged_filter == 'false':
             applications = [app for app in applications if not app.flagged]
         
-        return jsonify([{
+        return jsonify([_application_list_item(app) for app in applications])
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def _applications_and_contacts_index() -> tuple:
+    """
+    The combined application + contact list in display order, with each
+    item's sort key: applications first, then contacts, each by company and
+    then most recently updated. Rebuilt only when the data generation changes.
+    """
+    cache_path = get_data_path('output') / 'applications_and_contacts_index.json'
+    cache_generation = current_generation()
+    cached = get_generation_cached_json(cache_path, cache_generation)
+    if cached is not None:
+        return cached['items'], [tuple(key) for key in cached['keys']]
+
+    # Get all applications (including rejected ones for search)
+    applications = job_processor.list_all_applications()
+    
+    # Get archived applications
+    archived_applications = job_processor.list_archived_applications()
+    
+    # Combine applications, avoiding duplicates by ID
+    application_ids = {app.id for app in applications}
+    all_applications = applications + [app for app in archived_applications if app.id not in application_ids]
+    
+    # Get all contacts
+    contacts = networking_processor.list_all_contacts()
+    
+    # Combine into unified list
+    combined = []
+    
+    # Add applications (including archived and rejected)
+    for app in all_applications:
+        # Determine the URL to the details page
+        if app.summary_path and app.folder_path:
+            folder_name = app.folder_path.name
+            summary_filename = app.summary_path.name
+            detail_url = f"/applications/{folder_name}/{summary_filename}"
+        elif app.folder_path:
+            # Fallback: use folder name if no summary
+            detail_url = f"/applications/{app.folder_path.name}/"
+        else:
+            detail_url = f"/applications/{app.id}"
+        
+        combined.append({
+            'type': 'application',
             'id': app.id,
+            'name': f"{app.company} - {app.job_title}",
             'company': app.company,
-            'job_title': app.job_title,
-            'status': app.status,
-            'created_at': app.created_at.isoformat(),
-            'status_updated_at': app.status_updated_at.isoformat() if app.status_updated_at else None,
             'match_score': app.match_score,
-            'posted_date': app.posted_date,
-            'job_url': app.job_url,
-            'salary_range': app.salary_range,
-            'location': app.location,
-            'hiring_manager': app.hiring_manager,
-            'summary_path': str(app.summary_path) if app.summary_path else None,
-            'flagged': app.flagged
-        } for app in applications])
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+            'status': app.status,
+            'last_updated': app.status_updated_at if app.status_updated_at else app.created_at,
+            'detail_url': detail_url
+        })
+    
+    # Add contacts
+    for contact in contacts:
+        # Determine the URL to the details page
+        if contact.summary_path and contact.folder_path:
+            folder_name = contact.folder_path.name
+            summary_filename = contact.summary_path.name
+            detail_url = f"/networking/{folder_name}/{summary_filename}"
+        elif contact.folder_path:
+            # Fallback: use folder name if no summary
+            detail_url = f"/networking/{contact.folder_path.name}/"
+        else:
+            detail_url = f"/networking/{contact.id}"
+        
+        combined.append({
+            'type': 'contact',
+            'id': contact.id,
+            'name': f"{contact.person_name} - {contact.company_name}",
+            'company': contact.company_name,
+            'match_score': contact.match_score,
+            'status': contact.status,
+            'last_updated': contact.status_updated_at if contact.status_updated_at else contact.created_at,
+            'detail_url': detail_url
+        })
+    
+    # Helper function to get timestamp for sorting
+    def get_timestamp(item):
+        """Get timestamp from last_updated for sorting"""
+        last_updated = item['last_updated']
+        if isinstance(last_updated, datetime):
+            # Handle timezone-aware and timezone-naive datetimes
+            if last_updated.tzinfo is None:
+                # Naive datetime - assume UTC
+                from datetime import timezone
+                last_updated = last_updated.replace(tzinfo=timezone.utc)
+            return last_updated.timestamp()
+        elif isinstance(last_updated, str):
+            try:
+                dt = datetime.fromisoformat(last_updated)
+                if dt.tzinfo is None:
+                    from datetime import timezone
+                    dt = dt.replace(tzinfo=timezone.utc)
+                return dt.timestamp()
+            except (ValueError, AttributeError):
+                return 0
+        else:
+            return 0
+    
+    # Sort: Applications first, then Contacts; each by company name, then by
+    # last updated (newest to oldest). The id makes every key unique for paging.
+    def sort_key(item):
+        type_rank = 0 if item['type'] == 'application' else 1
+        return (type_rank, (item['company'] or '').lower(), -get_timestamp(item), str(item['id']))
+    
+    keyed = sorted(((sort_key(item), item) for item in combined), key=lambda pair: pair[0])
+    keys = [key for key, _ in keyed]
+    combined = [item for _, item in keyed]
+    
+    # Convert datetime objects to ISO format for JSON serialization
+    for item in combined:
+        if isinstance(item['last_updated'], datetime):
+            item['last_updated'] = item['last_updated'].isoformat()
+    
+    save_generation_cached_json(cache_path, {'items': combined, 'keys': keys}, cache_generation)
+    return combined, keys
+
 
 @app.route('/api/applications-and-contacts', methods=['GET'])
+@cached_json_response()
 def get_applications_and_contacts():
-    """Get combined list of applications and contacts for list view (includes rejected and archived applications)"""
+    """
+    Get combined list of applications and contacts for list view (includes
+    rejected and archived applications). With limit/cursor (or the type,
+    status, company and min_match_score/max_match_score filters) one page is
+    returned with a next_cursor; order=desc walks the listing backwards.
+    """
     try:
-        # Get all applications (including rejected ones for search)
-        applications = job_processor.list_all_applications()
-        
-        # Get archived applications
-        archived_applications = job_processor.list_archived_applications()
-        
-        # Combine applications, avoiding duplicates by ID
-        application_ids = {app.id for app in applications}
-        all_applications = applications + [app for app in archived_applications if app.id not in application_ids]
-        
-        # Get all contacts
-        contacts = networking_processor.list_all_contacts()
-        
-        # Combine into unified list
-        combined = []
-        
-        # Add applications (including archived and rejected)
-        for app in all_applications:
-            # Determine the URL to the details page
-            if app.summary_path and app.folder_path:
-                folder_name = app.folder_path.name
-                summary_filename = app.summary_path.name
-                detail_url = f"/applications/{folder_name}/{summary_filename}"
-            elif app.folder_path:
-                # Fallback: use folder name if no summary
-                detail_url = f"/applications/{app.folder_path.name}/"
-            else:
-                detail_url = f"/applications/{app.id}"
-            
-            combined.append({
-                'type': 'application',
-                'id': app.id,
-                'name': f"{app.company} - {app.job_title}",
-                'company': app.company,
-                'match_score': app.match_score,
-                'status': app.status,
-                'last_updated': app.status_updated_at if app.status_updated_at else app.created_at,
-                'detail_url': detail_url
-            })
-        
-        # Add contacts
-        for contact in contacts:
-            # Determine the URL to the details page
-            if contact.summary_path and contact.folder_path:
-                folder_name = contact.folder_path.name
-                summary_filename = contact.summary_path.name
-                detail_url = f"/networking/{folder_name}/{summary_filename}"
-            elif contact.folder_path:
-                # Fallback: use folder name if no summary
-                detail_url = f"/networking/{contact.folder_path.name}/"
-            else:
-                detail_url = f"/networking/{contact.id}"
-            
-            combined.append({
-                'type': 'contact',
-                'id': contact.id,
-                'name': f"{contact.person_name} - {contact.company_name}",
-                'company': contact.company_name,
-                'match_score': contact.match_score,
-                'status': contact.status,
-                'last_updated': contact.status_updated_at if contact.status_updated_at else contact.created_at,
-                'detail_url': detail_url
+        combined, keys = _applications_and_contacts_index()
+        if not _wants_page():
+            return jsonify({
+                'success': True,
+                'items': combined,
+                'count': len(combined)
             })
-        
-        # Helper function to get timestamp for sorting
-        def get_timestamp(item):
-            """Get timestamp from last_updated for sorting"""
-            last_updated = item['last_updated']
-            if isinstance(last_updated, datetime):
-                # Handle timezone-aware and timezone-naive datetimes
-                if last_updated.tzinfo is None:
-                    # Naive datetime - assume UTC
-                    from datetime import timezone
-                    last_updated = last_updated.replace(tzinfo=timezone.utc)
-                return last_updated.timestamp()
-            elif isinstance(last_updated, str):
-                try:
-                    dt = datetime.fromisoformat(last_updated)
-                    if dt.tzinfo is None:
-                        from datetime import timezone
-                        dt = dt.replace(tzinfo=timezone.utc)
-                    return dt.timestamp()
-                except (ValueError, AttributeError):
-                    return 0
-            else:
-                return 0
-        
-        # Sort: Applications first (by company name, then last updated), then Contacts (by company name, then last updated)
-        # Separate applications and contacts
-        applications_list = [item for item in combined if item['type'] == 'application']
-        contacts_list = [item for item in combined if item['type'] == 'contact']
-        
-        # Sort applications: by company name, then by last updated (newest to oldest)
-        def sort_key_app(item):
-            company = item['company'].lower()
-            timestamp = get_timestamp(item)
-            return (company, -timestamp)  # Negative timestamp for descending (newest first)
-        
-        applications_list.sort(key=sort_key_app)
-        
-        # Sort contacts: by company name, then by last updated (newest to oldest)
-        def sort_key_contact(item):
-            company = item['company'].lower()
-            timestamp = get_timestamp(item)
-            return (company, -timestamp)  # Negative timestamp for descending (newest first)
-        
-        contacts_list.sort(key=sort_key_contact)
-        
-        # Combine: applications first, then contacts
-        combined = applications_list + contacts_list
-        
-        # Convert datetime objects to ISO format for JSON serialization
-        for item in combined:
-            if isinstance(item['last_updated'], datetime):
-                item['last_updated'] = item['last_updated'].isoformat()
-        
+
+        unsupported = [arg for arg in ('created_after', 'created_before') if arg in request.args]
+        if unsupported:
+            raise ValueError(f"Unsupported filter for this listing: {', '.join(unsupported)}")
+        sort_by, sort_order, limit, after = _listing_order('company', 'asc', ('company',))
+        types = _list_arg('type')
+        statuses = {status.lower() for status in _list_arg('status') or ()}
+        company = (request.args.get('company') or '').lower().strip()
+        min_score = _float_arg('min_match_score')
+        max_score = _float_arg('max_match_score')
+
+        def accept(position):
+            item = combined[position]
+            if types and item['type'] not in types:
+                return False
+            if statuses and (item['status'] or '').lower() not in statuses:
+                return False
+            if company and (item['company'] or '').lower().strip() != company:
+                return False
+            if min_score is not None and (item['match_score'] is None or item['match_score'] < min_score):
+                return False
+            if max_score is not None and (item['match_score'] is None or item['match_score'] > max_score):
+                return False
+            return True
+
+        positions, has_more = keyset_page(keys, after, limit, descending=sort_order == 'desc', accept=accept)
         return jsonify({
             'success': True,
-            'items': combined,
-            'count': len(combined)
+            'items': [combined[position] for position in positions],
+            'count': len(positions),
+            'limit': limit,
+            'next_cursor': encode_cursor(sort_by, sort_order, keys[positions[-1]]) if has_more else None
         })
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -1080,11 +1250,75 @@ def regenerate_technologies():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+def _created_application_payload(application):
+    """Response body for a newly created application (shared by the sync route and background job)"""
+    # Generate relative URL for summary
+    summary_url = None
+    if application.summary_path:
+        folder_name = application.folder_path.name
+        summary_filename = application.summary_path.name
+        summary_url = f"/applications/{folder_name}/{summary_filename}"
+    # Load qualifications analysis for detailed response (best-effort)
+    qualifications_data = None
+    if application.qualifications_path and application.qualifications_path.exists():
+        try:
+            from app.utils.file_utils import read_text_file
+            qual_content = read_text_file(application.qualifications_path)
+            qualifications_data = {
+                'match_score': application.match_score or 0.0,
+                'features_compared': 0,
+                'strong_matches': [],
+                'missing_skills': [],
+                'partial_matches': [],
+                'soft_skills': [],
+                'recommendations': [],
+                'detailed_analysis': qual_content
+            }
+            import re
+            features_match = re.search(r'Features Compared:?\s*(\d+)', qual_content, re.IGNORECASE)
+            if features_match:
+                qualifications_data['features_compared'] = int(features_match.group(1))
+            strong_section = re.search(r'Strong Matches:?\s*([^\n]+)', qual_content, re.IGNORECASE)
+            if strong_section:
+                qualifications_data['strong_matches'] = [s.strip() for s in strong_section.group(1).split(',')]
+            missing_section = re.search(r'Missing Skills:?\s*([^\n]+)', qual_content, re.IGNORECASE)
+            if missing_section:
+                qualifications_data['missing_skills'] = [s.strip() for s in missing_section.group(1).split(',')]
+        except Exception as e:
+            print(f"Warning: Could not load qualifications data: {e}")
+            qualifications_data = None
+
+    return {
+        'success': True,
+        'message': 'Application created successfully',
+        'application_id': application.id,
+        'folder_path': str(application.folder_path),
+        'summary_path': str(application.summary_path),
+        'summary_url': summary_url,
+        'match_score': application.match_score,
+        'qualifications': qualifications_data,
+        'location': application.location,
+        'salary_range': application.salary_range,
+        'posted_date': application.posted_date,
+        'created_at': format_for_display(application.created_at) if application.created_at else None,
+        'job_url': application.job_url
+    }
+
+
+def _stream_error_response(stream_id, error, status_code):
+    """Error response for a request whose progress a client may be watching on stream_id"""
+    finish_stream(stream_id, error=error)
+    return jsonify({'success': False, 'error': error}), status_code
+
+
 @app.route('/api/applications', methods=['POST'])
 def create_application():
     """Create a new job application"""
+    stream_id = None
     try:
         data = request.json
+        # Optional generation_stream channel the client watches via /api/generation-stream/<id>
+        stream_id = data.get('stream_id')
         # Sanitize text inputs (trim spaces, remove dangerous chars)
         company = sanitize_text(data.get('company')) if data.get('company') else None
         job_title = sanitize_text(data.get('job_title')) if data.get('job_title') else None
@@ -1092,97 +1326,51 @@ def create_application():
         job_url = data.get('job_url')  # Exclude from sanitization (URL)
         
         if not all([company, job_title, job_description]):
-            return jsonify({
-                'success': False,
-                'error': 'Missing required fields: company, job_title, job_description'
-            }), 400
+            return _stream_error_response(stream_id, 'Missing required fields: company, job_title, job_description', 400)
         
         # Check if resume exists
         try:
             resume_manager.load_base_resume()
         except FileNotFoundError:
-            return jsonify({
-                'success': False,
-                'error': 'Base resume not found. Please create a resume first.'
-            }), 400
+            return _stream_error_response(stream_id, 'Base resume not found. Please create a resume first.', 400)
         
         # Check Ollama connection
         if not ai_analyzer.check_connection():
-            return jsonify({
-                'success': False,
-                'error': 'Cannot connect to Ollama. Please ensure Ollama is running.'
-            }), 503
+            return _stream_error_response(stream_id, 'Cannot connect to Ollama. Please ensure Ollama is running.', 503)
+        
+        job_details = {
+            'job_description': job_description,
+            'company': company,
+            'job_title': job_title,
+            'job_url': job_url
+        }
+        
+        # Background mode: queue the work and return right away; progress is
+        # available from /api/jobs/<id> and /api/generation-stream/<id>
+        if data.get('background') or request.args.get('background', '').lower() in ('1', 'true'):
+            job_id = job_queue.enqueue('create_application', job_details)
+            response = _queued_job_response(job_id)
+            # The job streams on its own channel; point a client watching stream_id there
+            finish_stream(stream_id, job_id=job_id, status='queued', stream_url=response['stream_url'])
+            return jsonify(response), 202
         
         # Create application
-        application = job_processor.create_job_application(
-            job_description=job_description,
-            company=company,
-            job_title=job_title,
-            job_url=job_url
-        )
+        with stream_stage(stream_id, 'extract'):
+            application = job_processor.create_job_application(**job_details)
         
         # Generate all documents synchronously
-        doc_generator.generate_all_documents(application)
+        doc_generator.generate_all_documents(application, stream_id=stream_id)
         
         # Save updated metadata with paths
         job_processor._save_application_metadata(application)
         
-        # Generate relative URL for summary
-        summary_url = None
-        if application.summary_path:
-            folder_name = application.folder_path.name
-            summary_filename = application.summary_path.name
-            summary_url = f"/applications/{folder_name}/{summary_filename}"
-        
-        # Load qualifications analysis for detailed response (best-effort)
-        qualifications_data = None
-        if application.qualifications_path and application.qualifications_path.exists():
-            try:
-                from app.utils.file_utils import read_text_file
-                qual_content = read_text_file(application.qualifications_path)
-                qualifications_data = {
-                    'match_score': application.match_score or 0.0,
-                    'features_compared': 0,
-                    'strong_matches': [],
-                    'missing_skills': [],
-                    'partial_matches': [],
-                    'soft_skills': [],
-                    'recommendations': [],
-                    'detailed_analysis': qual_content
-                }
-                import re
-                features_match = re.search(r'Features Compared:?\s*(\d+)', qual_content, re.IGNORECASE)
-                if features_match:
-                    qualifications_data['features_compared'] = int(features_match.group(1))
-                strong_section = re.search(r'Strong Matches:?\s*([^\n]+)', qual_content, re.IGNORECASE)
-                if strong_section:
-                    qualifications_data['strong_matches'] = [s.strip() for s in strong_section.group(1).split(',')]
-                missing_section = re.search(r'Missing Skills:?\s*([^\n]+)', qual_content, re.IGNORECASE)
-                if missing_section:
-                    qualifications_data['missing_skills'] = [s.strip() for s in missing_section.group(1).split(',')]
-            except Exception as e:
-                print(f"Warning: Could not load qualifications data: {e}")
-                qualifications_data = None
-
-        return jsonify({
-            'success': True,
-            'message': 'Application created successfully',
-            'application_id': application.id,
-            'folder_path': str(application.folder_path),
-            'summary_path': str(application.summary_path),
-            'summary_url': summary_url,
-            'match_score': application.match_score,
-            'qualifications': qualifications_data,
-            'location': application.location,
-            'salary_range': application.salary_range,
-            'posted_date': application.posted_date,
-            'created_at': format_for_display(application.created_at) if application.created_at else None,
-            'job_url': application.job_url
-        })
+        response = _created_application_payload(application)
+        finish_stream(stream_id, application_id=application.id, summary_url=response['summary_url'])
+        return jsonify(response)
     except Exception as e:
         import traceback
         traceback.print_exc()
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _stream_error_response(stream_id, str(e), 500)
 
 
 @app.route('/api/applications/<app_id>/comparison', methods=['GET'])
@@ -1327,25 +1515,26 @@ def get_application(app_id):
 
 @app.route('/api/applications/search', methods=['GET'])
 def search_applications():
-    """Search applications for dropdown selection"""
+    """Search applications for dropdown selection (full-text, the last word matched as a prefix)"""
     try:
-        query = request.args.get('q', '').lower()
-        applications = job_processor.list_all_applications()
+        query = request.args.get('q', '').strip()
+        if query:
+            hits = get_search_index().search(
+                query, kinds=['application'], limit=50, prefix_last=True, include_archived=False
+            )
+            applications = [job_processor.get_application_by_id(hit['id']) for hit in hits]
+            applications = [app for app in applications if app is not None]
+        else:
+            applications = job_processor.list_all_applications()
         
-        # Filter applications based on query
-        filtered_apps = []
-        for app in applications:
-            if (query in app.company.lower() or 
-                query in app.job_title.lower() or 
-                query in app.id.lower()):
-                filtered_apps.append({
-                    'id': app.id,
-                    'company': app.company,
-                    'job_title': app.job_title,
-                    'status': app.status,
-                    'flagged': app.flagged,
-                    'display_text': f"{app.company} - {app.job_title} ({app.id})"
-                })
+        filtered_apps = [{
+            'id': app.id,
+            'company': app.company,
+            'job_title': app.job_title,
+            'status': app.status,
+            'flagged': app.flagged,
+            'display_text': f"{app.company} - {app.job_title} ({app.id})"
+        } for app in applications]
         
         return jsonify({
             'success': True,
@@ -1356,6 +1545,35 @@ def search_applications():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/search', methods=['GET'])
+def full_text_search():
+    """
+    Ranked full-text search over applications (metadata, job descriptions,
+    update notes) and networking contacts (metadata, profiles, update notes).
+    q supports "phrases" and prefix* terms; type limits to application or
+    contact; limit caps the results.
+    """
+    try:
+        query = request.args.get('q', '').strip()
+        kinds = _list_arg('type')
+        limit = page_size(request.args.get('limit'), listing_defaults()['items_per_page'])
+        results = get_search_index().search(
+            query,
+            kinds=kinds,
+            limit=limit,
+            prefix_last=request.args.get('prefix', '').lower() == 'true'
+        )
+        return jsonify({
+            'success': True,
+            'results': results,
+            'count': len(results)
+        })
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @app.route('/api/applications/<app_id>/status', methods=['PUT'])
 def update_status(app_id):
     """Update application status"""
@@ -1542,17 +1760,37 @@ def update_checklist(app_id):
 @app.route('/api/applications/<app_id>/regenerate', methods=['POST'])
 def regenerate_documents(app_id):
     """Regenerate documents for an application"""
+    stream_id = None
     try:
         application = job_processor.get_application_by_id(app_id)
         
         if not application:
             return jsonify({'success': False, 'error': 'Application not found'}), 404
         
+        # Identical prompts are answered from the LLM response cache unless
+        # the caller asks for fresh generations ({"force_fresh": true} or ?fresh=1)
+        data = request.get_json(silent=True) or {}
+        force_fresh = bool(data.get('force_fresh')) or request.args.get('fresh', '').lower() in ('1', 'true')
+        # Optional generation_stream channel the client watches via /api/generation-stream/<id>
+        stream_id = data.get('stream_id')
+        
+        if data.get('background') or request.args.get('background', '').lower() in ('1', 'true'):
+            job_id = job_queue.enqueue('regenerate_documents', {
+                'application_id': application.id,
+                'force_fresh': force_fresh
+            })
+            return jsonify(_queued_job_response(job_id)), 202
+        
         # Regenerate all documents
-        doc_generator.generate_all_documents(application)
+        if force_fresh:
+            with bypass_llm_cache():
+                doc_generator.generate_all_documents(application, stream_id=stream_id)
+        else:
+            doc_generator.generate_all_documents(application, stream_id=stream_id)
         
         # Save updated metadata
         job_processor._save_application_metadata(application)
+        finish_stream(stream_id, application_id=application.id)
         
         return jsonify({
             'success': True,
@@ -1560,6 +1798,7 @@ def regenerate_documents(app_id):
             'application_id': application.id
         })
     except Exception as e:
+        finish_stream(stream_id, error=str(e))
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
@@ -1643,9 +1882,12 @@ def generate_resume(app_id):
 @app.route('/api/applications/<app_id>/generate-intros', methods=['POST'])
 def generate_intros(app_id):
     """Generate intro messages (hiring manager and/or recruiter) on demand"""
+    stream_id = None
     try:
         data = request.json
         message_type = data.get('message_type', 'both')  # 'hiring_manager', 'recruiter', or 'both'
+        # Optional generation_stream channel the client watches via /api/generation-stream/<id>
+        stream_id = data.get('stream_id')
         
         # Load application
         application = job_processor.get_application_by_id(app_id)
@@ -1662,7 +1904,8 @@ def generate_intros(app_id):
         qualifications = doc_generator._load_qualifications(application)
         
         # Generate intro messages (both types always generated together for efficiency)
-        doc_generator.generate_intro_messages(application, qualifications, resume.full_name)
+        with stream_stage(stream_id, 'intro_messages'):
+            doc_generator.generate_intro_messages(application, qualifications, resume.full_name)
         
         # Regenerate summary to include intro messages
         doc_generator.generate_summary_page(application, qualifications)
@@ -1671,13 +1914,173 @@ def generate_intros(app_id):
         job_processor._save_application_metadata(application)
         dashboard_generator.generate_index_page()
         
+        finish_stream(stream_id, application_id=application.id)
         return jsonify({'success': True, 'message': 'Intro messages generated successfully'})
     except Exception as e:
         import traceback
         traceback.print_exc()
+        finish_stream(stream_id, error=str(e))
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/generation-stream/<stream_id>', methods=['GET'])
+def generation_stream(stream_id):
+    """
+    Server-Sent Events feed of live LLM output for a create/regenerate/intros
+    request that was sent with the same stream_id. Emits 'stage' events
+    (started/finished/failed), 'token' events with generated text, and a
+    final 'done' event.
+    """
+    from flask import Response, stream_with_context
+    return Response(
+        stream_with_context(sse_events(stream_id)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+# ============================================================================
+# BACKGROUND JOBS
+# ============================================================================
+
+def _run_create_application_job(job):
+    """Create an application and generate its documents (job kind 'create_application')"""
+    application = None
+    # A resumed job reuses the application its interrupted attempt created
+    if job.state.get('application_id'):
+        application = job_processor.get_application_by_id(job.state['application_id'])
+    if application is None:
+        with stream_stage(job.id, 'extract'):
+            application = job_processor.create_job_application(**job.payload)
+        job.update_state(application_id=application.id)
+    
+    doc_generator.generate_all_documents(application, stream_id=job.id)
+    job_processor._save_application_metadata(application)
+    return _created_application_payload(application)
+
+
+def _run_regenerate_documents_job(job):
+    """Regenerate an application's documents (job kind 'regenerate_documents')"""
+    application = job_processor.get_application_by_id(job.payload['application_id'])
+    if not application:
+        raise ValueError(f"Application not found: {job.payload['application_id']}")
+    
+    # A resumed fresh regeneration may use responses its interrupted attempt already produced
+    if job.payload.get('force_fresh') and not job.resumed:
+        with bypass_llm_cache():
+            doc_generator.generate_all_documents(application, stream_id=job.id)
+    else:
+        doc_generator.generate_all_documents(application, stream_id=job.id)
+    job_processor._save_application_metadata(application)
+    return {'success': True, 'application_id': application.id}
+
+
+def _run_bulk_import_job(job):
+    """Import a batch of postings (job kind 'bulk_import'); progress is kept in the job state"""
+    importer = BulkImporter(job_processor, doc_generator)
+    # Postings a previous attempt already created are resumed, not imported twice
+    items = importer.prepare(job.payload['postings'], previous=job.state.get('progress'))
+    return importer.run(items, on_progress=lambda progress: job.update_state(progress=progress))
+
+
+def _run_rescore_job(job):
+    """Re-score stored applications (job kind 'rescore_applications'); progress is kept in the job state"""
+    rescorer = MatchRescorer(job_processor)
+    return rescorer.rescore(
+        include_archived=bool(job.payload.get('include_archived')),
+        force=bool(job.payload.get('force')),
+        on_progress=lambda progress: job.update_state(progress=progress)
+    )
+
+
+job_queue = get_job_queue()
+job_queue.register('create_application', _run_create_application_job)
+job_queue.register('regenerate_documents', _run_regenerate_documents_job)
+job_queue.register('bulk_import', _run_bulk_import_job)
+job_queue.register('rescore_applications', _run_rescore_job)
+
+
+def _queued_job_response(job_id):
+    return {
+        'success': True,
+        'job_id': job_id,
+        'status': 'queued',
+        'status_url': f"/api/jobs/{job_id}",
+        'stream_url': f"/api/generation-stream/{job_id}"
+    }
+
+
+@app.route('/api/applications/bulk-import', methods=['POST'])
+def bulk_import_applications():
+    """
+    Import many postings at once: a JSON body {"postings": [...]} or a JSONL
+    file upload (field "file"), one posting per line with company, job_title,
+    job_description and optional job_url. Runs as a background job; its
+    progress (per-posting status, duplicates, preliminary scores) is in the
+    job state at /api/jobs/<id>.
+    """
+    try:
+        if 'file' in request.files:
+            postings = parse_jsonl(request.files['file'].read().decode('utf-8', errors='replace'))
+        else:
+            postings = (request.get_json(silent=True) or {}).get('postings')
+        if not isinstance(postings, list) or not postings:
+            return jsonify({'success': False, 'error': 'No postings provided'}), 400
+        
+        try:
+            resume_manager.load_base_resume()
+        except FileNotFoundError:
+            return jsonify({
+                'success': False,
+                'error': 'Base resume not found. Please create a resume first.'
+            }), 400
+        
+        job_id = job_queue.enqueue('bulk_import', {'postings': postings})
+        response = _queued_job_response(job_id)
+        response['postings'] = len(postings)
+        return jsonify(response), 202
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/applications/rescore', methods=['POST'])
+def rescore_applications():
+    """
+    Recompute every application's preliminary match score (no LLM calls),
+    e.g. after editing the resume, skills.yaml or the skill taxonomy.
+    Applications whose inputs are unchanged are skipped. JSON body options:
+    include_archived, force. Runs as a background job.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        job_id = job_queue.enqueue('rescore_applications', {
+            'include_archived': bool(data.get('include_archived')),
+            'force': bool(data.get('force')),
+        })
+        return jsonify(_queued_job_response(job_id)), 202
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Status of a background job: status, current stage, per-stage progress and result"""
+    job = job_queue.get(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    return jsonify({'success': True, 'job': job})
+
+
+@app.route('/api/jobs', methods=['GET'])
+def list_jobs():
+    """Most recent background jobs, newest first"""
+    try:
+        limit = max(1, min(int(request.args.get('limit', 50)), 500))
+    except ValueError:
+        limit = 50
+    return jsonify({'success': True, 'jobs': job_queue.list_jobs(limit)})
+
+
 # ============================================================================
 # NETWORKING ENDPOINTS
 # ============================================================================
@@ -1749,13 +2152,11 @@ def create_networking_contact():
         try:
             from datetime import datetime
             from app.utils.datetime_utils import get_est_now
-            applications = job_processor.list_all_applications()
             updated_apps = []
-            for app in applications:
-                if app.company.lower().strip() == contact.company_name.lower().strip():
-                    app.status_updated_at = get_est_now()
-                    job_processor._save_application_metadata(app)
-                    updated_apps.append(app)
+            for app in job_processor.find_applications_by_company(contact.company_name):
+                app.status_updated_at = get_est_now()
+                job_processor._save_application_metadata(app)
+                updated_apps.append(app)
             
             # Regenerate dashboards in background if any applications were updated
             if updated_apps:
@@ -1841,6 +2242,7 @@ def get_application_networking_contacts(app_id):
 
 
 @app.route('/api/networking/contacts', methods=['GET'])
+@cached_json_response(vary_by_day=True)
 def list_networking_contacts():
     """List all networking contacts"""
     try:
@@ -1964,24 +2366,22 @@ def update_networking_status(contact_id):
         # Check if contact's company matches any application and create timeline entry
         try:
             from app.utils.datetime_utils import get_est_now
-            applications = job_processor.list_all_applications()
             updated_apps = []
-            for app in applications:
-                if app.company.lower().strip() == contact.company_name.lower().strip():
-                    # Update application's status_updated_at
-                    app.status_updated_at = get_est_now()
-                    job_processor._save_application_metadata(app)
-                    updated_apps.append(app)
-                    
-                    # Create networking timeline entry in matching application
-                    job_processor.create_networking_timeline_entry(
-                        app,
-                        contact.person_name,
-                        status,
-                        notes
-                    )
-                    # Regenerate summary to include the new timeline entry
-                    job_processor._regenerate_summary(app)
+            for app in job_processor.find_applications_by_company(contact.company_name):
+                # Update application's status_updated_at
+                app.status_updated_at = get_est_now()
+                job_processor._save_application_metadata(app)
+                updated_apps.append(app)
+                
+                # Create networking timeline entry in matching application
+                job_processor.create_networking_timeline_entry(
+                    app,
+                    contact.person_name,
+                    status,
+                    notes
+                )
+                # Regenerate summary to include the new timeline entry
+                job_processor._regenerate_summary(app)
             
             # Regenerate dashboards in background if any applications were updated
             if updated_apps:
@@ -2121,13 +2521,11 @@ def update_networking_details(contact_id):
         # Update matching applications' status_updated_at
         try:
             from app.utils.datetime_utils import get_est_now
-            applications = job_processor.list_all_applications()
             updated_apps = []
-            for app in applications:
-                if app.company.lower().strip() == contact.company_name.lower().strip():
-                    app.status_updated_at = get_est_now()
-                    job_processor._save_application_metadata(app)
-                    updated_apps.append(app)
+            for app in job_processor.find_applications_by_company(contact.company_name):
+                app.status_updated_at = get_est_now()
+                job_processor._save_application_metadata(app)
+                updated_apps.append(app)
             
             # Regenerate dashboards in background if any applications were updated
             if updated_apps:
@@ -2429,16 +2827,21 @@ def get_reports_data():
         gap_period = request.args.get('gap_period', 'all')  # For skill gaps: 'daily', 'weekly', 'monthly', 'all'
 
         # ------------------------------------------------------------------
-        # Simple file-based caching, similar to dashboard caching.
-        # Cache key includes period, report_type, and gap_period.
+        # File-based caching keyed by period, report_type, and gap_period.
+        # Entries are valid until the data generation changes (any write to
+        # applications, contacts or the activity log) or the day rolls over,
+        # since periods are relative to today.
         # ------------------------------------------------------------------
         cache_filename = f"reports_cache_{period}_{report_type}_{gap_period}.json"
         cache_path = get_data_path('output') / Path(cache_filename)
+        cache_generation = [
+            current_generation(),
+            datetime.now(timezone(timedelta(hours=-4))).date().isoformat()
+        ]
 
-        if not is_cache_stale(cache_path, ttl_seconds=300):
-            cached = get_cached_json(cache_path)
-            if cached is not None:
-                return jsonify(cached)
+        cached = get_generation_cached_json(cache_path, cache_generation)
+        if cached is not None:
+            return jsonify(cached)
         
         # Calculate date ranges based on period
         now = datetime.now(timezone(timedelta(hours=-4)))
@@ -2840,7 +3243,7 @@ def get_reports_data():
         }
 
         # Save to cache for subsequent fast loads.
-        save_cached_json(cache_path, response_payload)
+        save_generation_cached_json(cache_path, response_payload, cache_generation)
 
         return jsonify(response_payload)
         
@@ -2995,15 +3398,16 @@ def get_daily_activities():
         # ------------------------------------------------------------------
         # File-based caching for daily activities.
         # Single cache file since this endpoint has no query parameters.
-        # Cache for 5 minutes (300 seconds) - activities are logged in real-time
+        # Valid until the data generation changes - every logged activity
+        # bumps it, so the cache is never behind the activity log.
         # ------------------------------------------------------------------
         cache_filename = "daily_activities_cache.json"
         cache_path = get_data_path('output') / Path(cache_filename)
+        cache_generation = current_generation()
 
-        if not is_cache_stale(cache_path, ttl_seconds=300):
-            cached = get_cached_json(cache_path)
-            if cached is not None:
-                return jsonify(cached)
+        cached = get_generation_cached_json(cache_path, cache_generation)
+        if cached is not None:
+            return jsonify(cached)
 
         # Use activity log service for fast data retrieval
         daily_summary = activity_log_service.get_daily_activities_summary()
@@ -3025,7 +3429,7 @@ def get_daily_activities():
         }
 
         # Save to cache for subsequent fast loads.
-        save_cached_json(cache_path, response_payload)
+        save_generation_cached_json(cache_path, response_payload, cache_generation)
 
         return jsonify(response_payload)
         
@@ -3158,15 +3562,16 @@ def get_analytics():
         # ------------------------------------------------------------------
         # File-based caching for analytics.
         # Cache key includes period and gap_period.
-        # Analytics refreshes once per day (24 hours = 86400 seconds)
+        # Valid until the data generation changes or the day rolls over
+        # (periods are relative to today).
         # ------------------------------------------------------------------
         cache_filename = f"analytics_cache_{period}_{gap_period}.json"
         cache_path = get_data_path('output') / Path(cache_filename)
+        cache_generation = [current_generation(), datetime.now().date().isoformat()]
 
-        if not is_cache_stale(cache_path, ttl_seconds=86400):  # 24 hours
-            cached = get_cached_json(cache_path)
-            if cached is not None:
-                return jsonify(cached)
+        cached = get_generation_cached_json(cache_path, cache_generation)
+        if cached is not None:
+            return jsonify(cached)
 
         analytics_data = analytics_generator.generate_analytics(period, gap_period)
 
@@ -3176,7 +3581,7 @@ def get_analytics():
         }
 
         # Save to cache for subsequent fast loads.
-        save_cached_json(cache_path, response_payload)
+        save_generation_cached_json(cache_path, response_payload, cache_generation)
 
         return jsonify(response_payload)
     except Exception as e:
@@ -3207,10 +3612,11 @@ def view_dashboard():
 @app.route('/archived')
 def archived_dashboard():
     """Archived applications dashboard"""
-    from app.utils.file_utils import get_data_path
-    # Always regenerate archived dashboard to ensure it's up to date
-    dashboard_generator.generate_archived_dashboard()
-    dashboard_path = get_data_path('output') / 'archived.html'
+    # Only regenerate when the cached HTML is missing (archiving or rejecting an
+    # application deletes it) or stale; otherwise this is a static file send.
+    if dashboard_generator.is_archived_dashboard_stale():
+        dashboard_generator.generate_archived_dashboard()
+    dashboard_path = dashboard_generator.get_archived_dashboard_path()
     
     if dashboard_path.exists():
         return send_from_directory(
@@ -3302,6 +3708,11 @@ if __name__ == '__main__':
     #     f.write(json.dumps({"location":"web.py:main","message":"About to start Flask app","data":{"port":port,"host":"0.0.0.0","debug":True},"timestamp":time.time()*1000,"sessionId":"debug-session","runId":"startup","hypothesisId":"A"}) + '\n')
     # #endregion
     
+    # Resume background jobs interrupted by the last shutdown. With the debug
+    # reloader only the serving child process (WERKZEUG_RUN_MAIN) runs workers.
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        job_queue.start()
+    
     print()
     print("🔄 Starting Flask server...")
     app.run(debug=True, port=port, host='0.0.0.0')
@@ -28,8 +28,7 @@ def backfill_activity_log():
     activity_log = ActivityLogService()
     
     # Load existing log to check what's already there
-    existing_log = activity_log._load_log()
-    existing_activity_ids = {a.get('id') for a in existing_log.get('activities', [])}
+    existing_activity_ids = {a.get('id') for a in activity_log.get_activities()}
     print(f"Found {len(existing_activity_ids)} existing activities in log")
     print()
     
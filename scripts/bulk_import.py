@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Bulk-import job postings from a JSONL file or a directory of postings.
+
+Postings are deduplicated (within the batch and against existing
+applications) and scored with the preliminary matcher before any LLM call,
+then applications and documents are generated a few at a time.
+
+Usage:
+    python scripts/bulk_import.py postings.jsonl
+    python scripts/bulk_import.py ~/job-fair-postings/ --concurrency 3
+    python scripts/bulk_import.py postings.jsonl --dry-run
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.bulk_importer import BulkImporter, load_postings
+from app.services.document_generator import DocumentGenerator
+from app.services.job_processor import JobProcessor
+from app.services.resume_manager import ResumeManager
+
+
+def print_item(item):
+    score = f"{item['preliminary_score']:.0f}%" if item.get('preliminary_score') is not None else '  - '
+    detail = item.get('reason') or item.get('error') or item.get('application_id') or ''
+    print(f"  [{item['status']:>9}] {score:>5}  {item['company']} - {item['job_title']}  {detail}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-import job postings")
+    parser.add_argument('path', type=Path, help="JSONL/JSON file or directory of .jsonl/.json/.txt/.md postings")
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help="Postings generated at once (default: jobs.bulk_concurrency in config.yaml)")
+    parser.add_argument('--dry-run', action='store_true', help="Only dedupe and score the postings")
+    args = parser.parse_args()
+
+    if not args.path.exists():
+        print(f"❌ Not found: {args.path}")
+        return 1
+    try:
+        ResumeManager().load_base_resume()
+    except FileNotFoundError:
+        print("❌ Base resume not found. Please create a resume first.")
+        return 1
+
+    postings = load_postings(args.path)
+    importer = BulkImporter(JobProcessor(), DocumentGenerator(), max_concurrent=args.concurrency)
+    items = importer.prepare(postings)
+
+    summary = importer.summarize(items)
+    print(f"Found {summary['total']} postings: {summary['pending']} to import, "
+          f"{summary['duplicate']} duplicates, {summary['invalid']} invalid")
+    for item in items:
+        print_item(item)
+    if args.dry_run or not summary['pending']:
+        return 0
+
+    print()
+    print(f"Importing {summary['pending']} postings ({importer.max_concurrent} at a time)...")
+    last_line = None
+
+    def on_progress(progress):
+        nonlocal last_line
+        line = (f"Progress: {progress['succeeded'] + progress['failed']}/{progress['pending'] + progress['running'] + progress['succeeded'] + progress['failed']} "
+                f"done ({progress['running']} running, {progress['failed']} failed)")
+        if line != last_line:
+            print(line)
+            last_line = line
+
+    summary = importer.run(items, on_progress=on_progress)
+    print()
+    for item in summary['items']:
+        if item['status'] in ('succeeded', 'failed'):
+            print_item(item)
+    print(f"✅ Imported {summary['succeeded']} postings, {summary['failed']} failed")
+    return 0 if not summary['failed'] else 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
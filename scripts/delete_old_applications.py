@@ -4,7 +4,6 @@ Delete all applications created before October 1st, 2025
 """
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-import shutil
 from app.services.job_processor import JobProcessor
 
 def delete_applications_before_date(cutoff_date_str: str = "2025-10-01"):
@@ -58,7 +57,7 @@ def delete_applications_before_date(cutoff_date_str: str = "2025-10-01"):
     for app in to_delete:
         try:
             if app.folder_path and app.folder_path.exists():
-                shutil.rmtree(app.folder_path)
+                job_processor.delete_application(app)
                 print(f"  ✓ Deleted: {app.company} - {app.job_title}")
                 deleted_count += 1
             else:
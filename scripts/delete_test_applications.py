@@ -3,7 +3,6 @@
 Delete all applications with "test" in company name.
 Removes from dashboards and folders in the drive.
 """
-import shutil
 from pathlib import Path
 from typing import List
 from app.services.job_processor import JobProcessor
@@ -58,7 +57,7 @@ def delete_test_applications() -> None:
                 print(f"   Folder: {app.folder_path}")
                 
                 # Remove the entire folder and all its contents
-                shutil.rmtree(app.folder_path)
+                job_processor.delete_application(app)
                 print(f"   ✓ Successfully deleted folder")
                 deleted_count += 1
                 
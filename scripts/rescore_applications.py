@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Re-score stored applications with the preliminary matcher (no LLM calls).
+
+Run after editing base_resume.md, skills.yaml or skill_normalization.yaml.
+Applications whose job description and resume/taxonomy inputs are unchanged
+since their last re-score are skipped.
+
+Usage:
+    python scripts/rescore_applications.py
+    python scripts/rescore_applications.py --include-archived --workers 4
+    python scripts/rescore_applications.py --force --dry-run
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.job_processor import JobProcessor
+from app.services.match_rescorer import MatchRescorer
+
+
+def format_score(score):
+    return f"{score:.0f}%" if score is not None else '-'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score applications with the preliminary matcher")
+    parser.add_argument('--include-archived', action='store_true', help="Also re-score archived applications")
+    parser.add_argument('--force', action='store_true', help="Re-score even if the inputs are unchanged")
+    parser.add_argument('--dry-run', action='store_true', help="Show the new scores without saving them")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Processes to use (default: jobs.rescore_workers in config.yaml, or one per core)")
+    args = parser.parse_args()
+
+    rescorer = MatchRescorer(JobProcessor(), workers=args.workers)
+    print(f"Re-scoring applications ({rescorer.workers} processes)...")
+    summary = rescorer.rescore(include_archived=args.include_archived, force=args.force, dry_run=args.dry_run)
+
+    for item in summary['items']:
+        if item['old_score'] != item['new_score']:
+            print(f"  {format_score(item['old_score']):>5} -> {format_score(item['new_score']):>5}  "
+                  f"{item['company']} - {item['job_title']}")
+    action = "Would update" if args.dry_run else "Updated"
+    print(f"✅ {action} {summary['changed']} of {summary['total']} applications "
+          f"({summary['rescored']} re-scored, {summary['unchanged']} unchanged, {summary['skipped']} without a job description)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())